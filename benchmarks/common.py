@@ -0,0 +1,62 @@
+"""
+Helpers shared by the benchmarks:  synthetic API payloads shaped like real tzKT responses, and a timer.
+
+Run a benchmark from the root of the repository, e.g. `python benchmarks/json_decoding.py`.
+"""
+import os
+import sys
+import json
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def micheline(depth, width):
+    if depth == 0:
+        return {'prim': 'Pair', 'args': [{'int': '1000000'}, {'string': 'tz1burnburnburnburnburnburnburjAYjjX'}]}
+    return {'prim': 'Pair', 'args': [micheline(depth - 1, width) for _ in range(width)]}
+
+
+def transaction(i):
+    return {
+        'type': 'transaction', 'id': 100000000 + i, 'level': 1500000 + i // 50, 'timestamp': '2021-06-01T12:%02d:%02dZ' % (i // 60 % 60, i % 60),
+        'block': 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2', 'hash': 'ooBghN2ok5EpgEuMqYWqvfwNLBiK9eNFoPai91iwqk2nRCyUKgE',
+        'counter': 1000000 + i, 'initiator': None, 'sender': {'alias': 'Sender', 'address': 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'},
+        'target': {'alias': 'Contract', 'address': 'KT1RJ6PbjHpwc3M5rw5s2Nbmefwbuwbdxton'}, 'nonce': None,
+        'gasLimit': 15000, 'gasUsed': 12345, 'storageLimit': 300, 'storageUsed': 67, 'bakerFee': 2000, 'storageFee': 16750, 'allocationFee': 0,
+        'amount': 1000000 + i, 'parameter': {'entrypoint': 'transfer', 'value': micheline(2, 2)}, 'storage': micheline(3, 2),
+        'diffs': [{'bigmap': 511, 'path': 'ledger', 'action': 'update_key', 'content': {'hash': 'exprtZBwZUeYYYfUs9B9Rg2ywHezVHnCCnmF9WsDQVrs582dSK63dC', 'key': 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb', 'value': str(i)}}],
+        'status': 'applied', 'hasInternals': False, 'quote': None,
+    }
+
+
+def origination(i):
+    return {
+        'type': 'origination', 'id': 200000000 + i, 'level': 1500000 + i // 50, 'timestamp': '2021-06-01T12:00:00Z',
+        'block': 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2', 'hash': 'ooBghN2ok5EpgEuMqYWqvfwNLBiK9eNFoPai91iwqk2nRCyUKgE',
+        'counter': 1000000 + i, 'initiator': None, 'sender': {'alias': None, 'address': 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'}, 'nonce': None,
+        'gasLimit': 15000, 'gasUsed': 12345, 'storageLimit': 3000, 'storageUsed': 2670, 'bakerFee': 2000, 'storageFee': 667500, 'allocationFee': 64250,
+        'contractBalance': 0, 'contractManager': None, 'contractDelegate': None, 'code': [micheline(4, 2) for _ in range(3)], 'storage': micheline(4, 2),
+        'diffs': None, 'status': 'applied', 'originatedContract': {'kind': 'smart_contract', 'address': 'KT1RJ6PbjHpwc3M5rw5s2Nbmefwbuwbdxton'}, 'quote': None,
+    }
+
+
+def page(factory, size):
+    """
+    Returns the raw body of a page of `size` items built with `factory`.
+
+    Returns:
+        bytes
+    """
+    return json.dumps([factory(i) for i in range(size)]).encode('utf-8')
+
+
+def timed(function, number=3, repeat=3):
+    """
+    Returns the best time (seconds) of a single call of `function`.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def report(name, seconds, baseline=None):
+    speedup = '' if baseline is None else '  (%.2fx)' % (baseline / seconds)
+    print('%-48s %10.2f ms%s' % (name, seconds * 1000, speedup))
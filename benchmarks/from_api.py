@@ -0,0 +1,86 @@
+"""
+Measures the generated `from_api` constructor of every model class against the hand-written constructors it replaced, which copied each payload into a `defaultdict`, read every key into a local and called `__init__`.
+
+Timestamps are left out of the payloads so the cost of object construction is not hidden by the cost of parsing dates;  pass `--timestamps` to include them.
+"""
+import re
+import sys
+import inspect
+from collections import defaultdict
+import common
+from tzktpy.base import Base
+import tzktpy
+
+
+def models(cls=Base):
+    for subclass in cls.__subclasses__():
+        if 'api_fields' in vars(subclass):
+            yield subclass
+        for model in models(subclass):
+            yield model
+
+
+TIMESTAMPS = '--timestamps' in sys.argv
+
+
+def sample_value(key, converter):
+    if converter == 'to_datetime':
+        return '2021-06-01T12:00:00Z' if TIMESTAMPS else None
+    if converter is not None:
+        owner = converter.__self__
+        item = sample(owner)
+        return [item, item] if converter.__name__ == 'from_api_list' else item
+    if key in ('sender', 'target', 'initiator', 'baker', 'delegate'):
+        return {'alias': 'Baker', 'address': 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'}
+    return 1000000
+
+
+def sample(model):
+    if model is tzktpy.operation.Transaction:
+        return dict(common.transaction(1), timestamp=sample_value('timestamp', 'to_datetime'))
+    if model is tzktpy.operation.Origination:
+        return dict(common.origination(1), timestamp=sample_value('timestamp', 'to_datetime'))
+    return dict((field[0], sample_value(field[0], field[2] if len(field) > 2 else None)) for field in model.api_fields)
+
+
+def legacy_from_api(model):
+    """
+    Returns a constructor equivalent to the hand-written `from_api` methods the generated constructors replaced.
+    """
+    attributes = dict((field[1], field) for field in model.api_fields)
+    namespace = dict(model=model, defaultdict=defaultdict)
+    lines = ['def from_api(data):', '    data = defaultdict(lambda: None, data)']
+    arguments = []
+    for index, parameter in enumerate(list(inspect.signature(model.__init__).parameters)[1:]):
+        attribute = re.sub('([A-Z])', r'_\1', parameter).lower()
+        field = attributes.get(parameter) or attributes.get(attribute)
+        name = 'value_%d' % index
+        arguments.append(name)
+        if field is None:
+            lines.append('    %s = None' % name)
+            continue
+        lines.append('    %s = data[%r]' % (name, field[0]))
+        converter = field[2] if len(field) > 2 else None
+        if converter is not None:
+            namespace['convert_%d' % index] = getattr(model, converter) if isinstance(converter, str) else converter
+            lines.append('    if %s:' % name)
+            lines.append('        %s = convert_%d(%s)' % (name, index, name))
+    lines.append('    return model(%s)' % ', '.join(arguments))
+    exec('\n'.join(lines), namespace)
+    return namespace['from_api']
+
+
+def main():
+    rows = 10000
+    print('%d rows per class' % rows)
+    for model in models():
+        payloads = [sample(model)] * rows
+        legacy = legacy_from_api(model)
+        baseline = common.timed(lambda: [legacy(item) for item in payloads])
+        generated = common.timed(lambda: [model.from_api(item) for item in payloads])
+        name = '%s.%s (%d fields)' % (model.__module__.split('.')[-1], model.__name__, len(model.api_fields))
+        print('%-40s %10.2f ms -> %8.2f ms  (%.2fx)' % (name, baseline * 1000, generated * 1000, baseline / generated))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Compares the decoders available to `Response.json` on large operation pages.
+
+`requests` decodes the body to text before handing it to the standard library.  The clients do the same when the standard library decoder is used, and pass the raw bytes to any other decoder (e.g. orjson).
+"""
+import json
+import common
+from tzktpy.response import Response
+from tzktpy.operation import Transaction, Origination
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def main():
+    for name, factory, size in (('transactions', common.transaction, 10000), ('originations', common.origination, 1000)):
+        content = common.page(factory, size)
+        print('%d %s (%.1f MB)' % (size, name, len(content) / 1024.0 / 1024))
+
+        baseline = common.timed(lambda: json.loads(content.decode('utf-8')))
+        common.report('json.loads(text)  [requests.Response.json]', baseline)
+        common.report('json.loads(bytes)', common.timed(lambda: json.loads(content)), baseline)
+        common.report('Response.json()  [stdlib]', common.timed(lambda: Response(200, {}, '', content, 'utf-8', json.loads).json()), baseline)
+        if orjson is not None:
+            common.report('orjson.loads(bytes)', common.timed(lambda: orjson.loads(content)), baseline)
+
+        model = Transaction if factory is common.transaction else Origination
+        stdlib = Response(200, {}, '', content, 'utf-8', json.loads)
+        total = common.timed(lambda: [model.from_api(item) for item in stdlib.json()])
+        common.report('stdlib + from_api', total)
+        if orjson is not None:
+            fast = Response(200, {}, '', content, 'utf-8', orjson.loads)
+            common.report('orjson + from_api', common.timed(lambda: [model.from_api(item) for item in fast.json()]), total)
+        print('')
+
+
+if __name__ == '__main__':
+    main()
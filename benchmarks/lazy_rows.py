@@ -0,0 +1,36 @@
+"""
+Compares eager objects (`from_api` on every row) against lazy rows (`Base.lazy = True`) for pages of transactions where only a few attributes are read, and where every attribute is read.
+"""
+import json
+import common
+from tzktpy.base import parse_timestamp
+from tzktpy.operation import Transaction
+
+
+def main():
+    rows = 10000
+    items = json.loads(common.page(common.transaction, rows))
+    attributes = [field[1] for field in Transaction.api_fields]
+    print('%d transactions' % rows)
+
+    def run(lazy, names):
+        def function():
+            parse_timestamp.cache_clear()
+            Transaction.lazy = lazy
+            try:
+                for row in Transaction.from_api_list(items):
+                    for name in names:
+                        getattr(row, name)
+            finally:
+                Transaction.lazy = False
+        return function
+
+    for label, names in (('level, sender, amount', ['level', 'sender', 'amount']), ('every attribute', attributes)):
+        baseline = common.timed(run(False, names))
+        common.report('%s: eager' % label, baseline)
+        common.report('%s: lazy' % label, common.timed(run(True, names)), baseline)
+        print('')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Compares decoding a page of transactions with Micheline fields decoded eagerly (the default) against deferred decoding (`micheline_mode = 'defer'`, where the API sends the fields as JSON strings):  time and peak memory to decode the page and read `amount` on every object.
+"""
+import json
+import tracemalloc
+import common
+from tzktpy.response import get_json_decoder
+from tzktpy.operation import Transaction
+
+
+def as_strings(item):
+    # the shape of a transaction requested with `micheline=1`
+    item = dict(item)
+    item['parameter'] = dict(item['parameter'], value=json.dumps(item['parameter']['value']))
+    item['storage'] = json.dumps(item['storage'])
+    item['diffs'] = [dict(diff, content=dict(diff['content'], key=json.dumps(diff['content']['key']), value=json.dumps(diff['content']['value']))) for diff in item['diffs']]
+    return item
+
+
+def main():
+    rows = 10000
+    loads = get_json_decoder()
+    eager_body = common.page(common.transaction, rows)
+    deferred_body = json.dumps([as_strings(common.transaction(i)) for i in range(rows)]).encode('utf-8')
+    print('%d transactions (%.1f MB, %.1f MB with micheline=1)' % (rows, len(eager_body) / 1e6, len(deferred_body) / 1e6))
+
+    def run(mode, body):
+        def function():
+            Transaction.micheline_mode = mode
+            try:
+                return sum(row.amount for row in Transaction.from_api_list(loads(body)))
+            finally:
+                Transaction.micheline_mode = 'decode'
+        return function
+
+    def peak(function):
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    baseline = common.timed(run('decode', eager_body))
+    common.report('decode', baseline)
+    common.report('defer', common.timed(run('defer', deferred_body)), baseline)
+    print('peak memory:  decode %.1f MB, defer %.1f MB' % (peak(run('decode', eager_body)) / 1e6, peak(run('defer', deferred_body)) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
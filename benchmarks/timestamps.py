@@ -0,0 +1,47 @@
+"""
+Compares the parsing of API timestamps with `datetime.strptime` (the previous implementation of `Base.to_datetime`) against the fast parser, with and without repeated timestamps.
+"""
+from datetime import datetime
+import common
+from tzktpy.base import Base, parse_timestamp, parse_epoch
+
+
+def main():
+    rows = 100000
+    # every timestamp is distinct, so the memo never hits
+    distinct = ['2021-06-%02dT%02d:%02d:%02dZ' % (1 + i // 86400 % 28, i // 3600 % 24, i // 60 % 60, i % 60) for i in range(rows)]
+    # about 50 operations per block, as in a page of transactions
+    blocks = [distinct[i // 50] for i in range(rows)]
+    print('%d timestamps' % rows)
+
+    for name, timestamps in (('distinct', distinct), ('50 per block', blocks)):
+        baseline = common.timed(lambda: [datetime.strptime(text, Base.datetime_format) for text in timestamps], number=1)
+        common.report('%s: strptime' % name, baseline)
+
+        def parse():
+            parse_timestamp.cache_clear()
+            return [Base.to_datetime(text) for text in timestamps]
+        common.report('%s: to_datetime' % name, common.timed(parse, number=1), baseline)
+
+        def epoch():
+            parse_timestamp.cache_clear()
+            parse_epoch.cache_clear()
+            Base.timestamps = 'epoch'
+            try:
+                return [Base.to_datetime(text) for text in timestamps]
+            finally:
+                Base.timestamps = 'datetime'
+        common.report('%s: to_datetime (epoch)' % name, common.timed(epoch, number=1), baseline)
+
+        def raw():
+            Base.timestamps = 'raw'
+            try:
+                return [Base.to_datetime(text) for text in timestamps]
+            finally:
+                Base.timestamps = 'datetime'
+        common.report('%s: to_datetime (raw)' % name, common.timed(raw, number=1), baseline)
+        print('')
+
+
+if __name__ == '__main__':
+    main()
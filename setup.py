@@ -1,5 +1,4 @@
-from setuptools import find_packages
-from distutils.core import setup
+from setuptools import find_packages, setup
 import os
 import io
 
@@ -16,7 +15,17 @@ setup(
     description='Python wrapper for the tzKT API',
     long_description=readfile('README.md'),
     long_description_content_type='text/markdown',
-    packages=find_packages(),
+    packages=find_packages(exclude=('tests', 'tests.*')),
+    python_requires='>=3.9',
+    install_requires=['requests'],
+    extras_require={
+        'aio': ['aiohttp'],
+        'orjson': ['orjson'],
+        'numpy': ['numpy'],
+        'arrow': ['pyarrow'],
+        'pandas': ['pandas'],
+        'all': ['aiohttp', 'orjson', 'numpy', 'pyarrow', 'pandas'],
+    },
     author=u'Doug Fenstermacher',
     author_email='douglas.fenstermacher@gmail.com',
     url='https://github.com/dpfens/tzktPy',
@@ -26,6 +35,8 @@ setup(
         'Development Status :: 4 - Beta',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
         'Intended Audience :: Developers',
     ]
 )
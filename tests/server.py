@@ -0,0 +1,153 @@
+"""
+Local stand-in for the tzkt REST API, used by the tests of the synchronous clients.
+"""
+import re
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+
+class StubServer(object):
+    """
+    HTTP server on a free local port answering the routes it is given.
+
+    A route is a regular expression matched against the whole path (without the leading `/`), and a handler called with the query parameters (dict) and the groups of the match.  A handler returns the body of a `200` response, or a `(status, body)` or `(status, body, headers)` tuple.  Bodies that are not bytes or str are sent as JSON.
+
+    Attributes:
+        url (str):  The domain of the server, e.g. `http://127.0.0.1:8080`.
+        requests (list):  `(path, query)` of every request received, in order.
+
+    Examples:
+        >>> with StubServer() as server:
+        ...     server.route(r'v1/head', lambda query: dict(level=100, cycle=1))
+        ...     head = Head.get(domain=server.url)
+    """
+
+    def __init__(self):
+        self.routes = []
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+        self.url = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def route(self, pattern, handler):
+        self.routes.insert(0, (re.compile(pattern), handler))
+        return self
+
+    def requested(self, pattern):
+        """
+        Returns the query of every request whose path matches the pattern.
+
+        Returns:
+            list
+        """
+        rule = re.compile(pattern)
+        with self.lock:
+            return [query for path, query in self.requests if rule.fullmatch(path)]
+
+    def respond(self, path, query):
+        with self.lock:
+            self.requests.append((path, query))
+        for rule, handler in self.routes:
+            match = rule.fullmatch(path)
+            if match:
+                result = handler(query, *match.groups())
+                break
+        else:
+            result = (404, dict(code=404, errors='Not found'))
+        if not isinstance(result, tuple):
+            result = (200, result)
+        status, body = result[:2]
+        headers = dict(result[2]) if len(result) > 2 else dict()
+        if not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+            headers.setdefault('Content-Type', 'application/json; charset=utf-8')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return status, body, headers
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                status, body, headers = stub.respond(url.path.strip('/'), dict(parse_qsl(url.query, keep_blank_values=True)))
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = 'http://127.0.0.1:%i' % self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+def list_endpoint(rows, key='id'):
+    """
+    Returns a handler emulating a list endpoint of the API over the given rows (dicts sorted by `key`):  comparison filters on integer fields (`level.gt`, `level.le`, ...), `sort.asc`/`sort.desc`, `offset`/`offset.el`/`offset.cr`, `limit` and `select`/`select.values` projections.
+
+    Returns:
+        callable
+    """
+    comparisons = dict(eq=lambda a, b: a == b, gt=lambda a, b: a > b, ge=lambda a, b: a >= b, lt=lambda a, b: a < b, le=lambda a, b: a <= b)
+
+    def handler(query):
+        items = list(rows)
+        for name, value in query.items():
+            field, _, suffix = name.partition('.')
+            if suffix in comparisons and items and field in items[0]:
+                items = [item for item in items if comparisons[suffix](item[field], int(value))]
+        sort = query.get('sort.asc') or query.get('sort.desc') or key
+        items.sort(key=lambda item: item[sort], reverse='sort.desc' in query)
+        if 'offset.cr' in query:
+            cursor = int(query['offset.cr'])
+            items = [item for item in items if (item[sort] < cursor if 'sort.desc' in query else item[sort] > cursor)]
+        items = items[int(query.get('offset.el') or query.get('offset') or 0):]
+        items = items[:int(query.get('limit', 100))]
+        if 'select.values' in query:
+            keys = query['select.values'].split(',')
+            return [[item.get(name) for name in keys] if len(keys) > 1 else item.get(keys[0]) for item in items]
+        if 'select' in query:
+            keys = query['select'].split(',')
+            return [dict((name, item.get(name)) for name in keys) if len(keys) > 1 else item.get(keys[0]) for item in items]
+        return items
+    return handler
+
+
+def count_endpoint(rows):
+    """
+    Returns a handler emulating a count endpoint over the given rows.  Like the API, it rejects the parameters of list endpoints.
+
+    Returns:
+        callable
+    """
+    def handler(query):
+        invalid = [name for name in query if name.split('.')[0] in ('select', 'limit', 'offset', 'sort')]
+        if invalid:
+            return 400, dict(code=400, errors=dict((name, 'Invalid parameter') for name in invalid))
+        return str(len(rows))
+    return handler
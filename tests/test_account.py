@@ -0,0 +1,48 @@
+"""
+Tests of the batched account lookups.
+"""
+import unittest
+from tzktpy.account import Account
+from tzktpy.client import Client
+from .server import StubServer
+
+ADDRESSES = ['tz1%033i' % index for index in range(10)]
+
+
+def accounts(query):
+    # like the API, unknown addresses are left out of the results
+    addresses = query['address.in'].split(',')
+    return [dict(type='user', address=address, balance=ADDRESSES.index(address)) for address in addresses if address in ADDRESSES[:8]]
+
+
+class ByAddressesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/accounts', accounts)
+        self.client = Client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_chunks_stay_under_max_length(self):
+        chunks = Account.address_chunks(ADDRESSES, max_length=80)
+        self.assertEqual(chunks, [ADDRESSES[index:index + 2] for index in range(0, 10, 2)])
+        self.assertEqual(Account.address_chunks(ADDRESSES[:1], max_length=10), [ADDRESSES[:1]])
+
+    def test_accounts_by_address(self):
+        addresses = ADDRESSES + ADDRESSES[:3]
+        with self.client.use():
+            output = Account.by_addresses(addresses, max_length=120, concurrency=2, domain=self.server.url)
+        self.assertEqual(list(output), ADDRESSES)
+        self.assertEqual([output[address].balance for address in ADDRESSES[:8]], list(range(8)))
+        self.assertEqual((output[ADDRESSES[8]], output[ADDRESSES[9]]), (None, None))
+        queries = self.server.requested(r'v1/accounts')
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(sorted(address for query in queries for address in query['address.in'].split(',')), ADDRESSES)
+        self.assertTrue(all(int(query['limit']) == len(query['address.in'].split(',')) for query in queries))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests of the AsyncClient and of the replay of synchronous endpoints.
+"""
+import random
+import threading
+import unittest
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+from tzktpy.aio import AsyncClient, ReplayClient, ReplayMismatch, PendingRequest, request_key, set_default_async_client
+from tzktpy.block import Block
+from tzktpy.response import Response
+from .server import StubServer
+
+
+def block(query, level):
+    return dict(level=int(level), hash='B%s' % level)
+
+
+class ReplayClientTest(unittest.TestCase):
+
+    def response(self, level):
+        return Response(200, {}, 'http://stub', b'{"level": %i}' % level)
+
+    def test_responses_are_matched_on_the_request(self):
+        responses = [(request_key('GET', 'http://stub', 'v1/blocks/%i' % level), self.response(level)) for level in range(20)]
+        replay = ReplayClient(responses)
+        levels = dict()
+
+        def fetch(level):
+            levels[level] = replay.request('GET', 'http://stub', 'v1/blocks/%i' % level).json()['level']
+        threads = [threading.Thread(target=fetch, args=(level, )) for level in random.sample(range(20), 20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(levels, dict((level, level) for level in range(20)))
+
+    def test_unknown_request(self):
+        responses = [(request_key('GET', 'http://stub', 'v1/blocks/1'), self.response(1))]
+        with self.assertRaises(ReplayMismatch):
+            ReplayClient(responses).request('GET', 'http://stub', 'v1/blocks/2')
+        replay = ReplayClient(responses)
+        replay.request('GET', 'http://stub', 'v1/blocks/1')
+        with self.assertRaises(PendingRequest):
+            replay.request('GET', 'http://stub', 'v1/blocks/2')
+        fallback = ReplayClient(responses, fallback=lambda method, domain, path, kwargs: self.response(2))
+        self.assertEqual(fallback.request('GET', 'http://stub', 'v1/blocks/2').json(), dict(level=2))
+
+
+@unittest.skipIf(aiohttp is None, 'requires aiohttp')
+class AsyncClientTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/blocks/(\d+)', block)
+        self.domain = self.server.url
+
+    def tearDown(self):
+        self.server.stop()
+
+    async def test_single_request(self):
+        async with AsyncClient() as client:
+            result = await client.call(Block.by_level, 7, domain=self.domain)
+        self.assertEqual(result.level, 7)
+        self.assertEqual(len(self.server.requests), 1)
+
+    async def test_each_response_is_fetched_once(self):
+        domain = self.domain
+
+        def levels():
+            return [Block.by_level(level, domain=domain).level for level in range(10, 20)]
+        async with AsyncClient() as client:
+            result = await client.call(levels)
+        self.assertEqual(result, list(range(10, 20)))
+        self.assertEqual(sorted(path for path, _ in self.server.requests), sorted('v1/blocks/%i' % level for level in range(10, 20)))
+
+    async def test_concurrent_requests_in_a_replayed_call(self):
+        domain = self.domain
+
+        def levels():
+            return [item.level for item in Block.map_concurrent(lambda level: Block.by_level(level, domain=domain), range(30), concurrency=8)]
+        async with AsyncClient() as client:
+            for _ in range(3):
+                self.assertEqual(await client.call(levels), list(range(30)))
+        self.assertEqual(len(self.server.requests), 90)
+
+    async def test_nondeterministic_requests_raise(self):
+        domain = self.domain
+
+        def latest():
+            return Block.by_level(random.randint(0, 10 ** 9), domain=domain)
+        async with AsyncClient() as client:
+            with self.assertRaises(ReplayMismatch):
+                await client.call(latest)
+
+    async def test_async_twin(self):
+        async with AsyncClient() as client:
+            previous = set_default_async_client(client)
+            try:
+                result = await Block.aby_level(3, domain=self.domain)
+            finally:
+                set_default_async_client(previous)
+        self.assertEqual(result.level, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
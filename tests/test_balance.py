@@ -0,0 +1,74 @@
+"""
+Tests of local balance histories.
+"""
+import datetime
+import os
+import tempfile
+import unittest
+from tzktpy.balance import BalanceSeries
+from tzktpy.client import Client
+from .server import StubServer, list_endpoint
+
+ADDRESS = 'tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE'
+EPOCH = 1600000000
+
+
+def utc(seconds):
+    return datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=seconds)
+
+
+def change(level, balance):
+    timestamp = utc(EPOCH + level * 60).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return dict(level=level, timestamp=timestamp, balance=balance)
+
+
+class BalanceSeriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.changes = [change(10, 100), change(20, 250), change(35, 200)]
+        self.server = StubServer().start()
+        self.server.route(r'v1/accounts/(\w+)/balance_history', lambda query, address: list_endpoint(self.changes, key='level')(query))
+        self.client = Client()
+        with self.client.use():
+            self.series = BalanceSeries(ADDRESS, domain=self.server.url).fetch(limit=2)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_fetch_pages_the_history(self):
+        self.assertEqual((len(self.series), self.series.level), (3, 35))
+        self.assertEqual(list(self.series.timestamps), [EPOCH + 600, EPOCH + 1200, EPOCH + 2100])
+        queries = self.server.requested(r'v1/accounts/\w+/balance_history')
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(queries[0]['select.values'], 'level,timestamp,balance')
+
+    def test_balances_at_levels_and_dates(self):
+        self.assertEqual(self.series.by_levels([9, 10, 19, 20, 34, 35, 100]), [0, 100, 100, 250, 250, 200, 200])
+        self.assertEqual(self.series.by_date(EPOCH + 1199), 100)
+        self.assertEqual(self.series.by_date(utc(EPOCH + 1200)), 250)
+        self.assertEqual(self.series.by_dates([datetime.date(2020, 1, 1), '2030-01-01T00:00:00Z']), [0, 200])
+
+    def test_resampling_and_changes(self):
+        self.assertEqual(self.series.resample(10), [(20, 250), (30, 250)])
+        self.assertEqual(self.series.resample(15, start=0, end=45), [(0, 0), (15, 100), (30, 250), (45, 200)])
+        self.assertEqual(self.series.resample_time(datetime.timedelta(minutes=10)), [(EPOCH + 600, 100), (EPOCH + 1200, 250), (EPOCH + 1800, 250)])
+        self.assertEqual(self.series.diff(15, 40), 100)
+        self.assertEqual(self.series.changes(), [(10, EPOCH + 600, 100), (20, EPOCH + 1200, 150), (35, EPOCH + 2100, -50)])
+        self.assertEqual(self.series.changes(10, 20), [(20, EPOCH + 1200, 150)])
+
+    def test_saved_series_refresh_from_the_last_level(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'series')
+            self.series.save(path)
+            series = BalanceSeries.read(path, domain=self.server.url)
+        self.assertEqual((series.address, list(series.balances)), (ADDRESS, [100, 250, 200]))
+        self.changes.append(change(40, 0))
+        with self.client.use():
+            self.assertEqual(series.refresh(), 1)
+        self.assertEqual(self.server.requests[-1][1]['offset.cr'], '35')
+        self.assertEqual(series.by_level(40), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests of the parallel fetching of block ranges.
+"""
+import unittest
+from tzktpy.block import Block
+from tzktpy.client import Client
+from .server import StubServer, list_endpoint
+
+
+class RangeTest(unittest.TestCase):
+    rows = [dict(level=level, hash='B%i' % level) for level in range(100)]
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/blocks', list_endpoint(self.rows, key='level'))
+        self.server.route(r'v1/head', lambda query: dict(level=79, cycle=1))
+        self.client = Client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def levels(self, *args, **kwargs):
+        with self.client.use():
+            return [block.level for block in Block.range(*args, domain=self.server.url, **kwargs)]
+
+    def test_blocks_are_yielded_in_level_order(self):
+        self.assertEqual(self.levels(5, 95, chunk_size=7, concurrency=4), list(range(5, 95)))
+        queries = self.server.requested(r'v1/blocks')
+        self.assertEqual(len(queries), 13)
+        self.assertTrue(all(int(query['limit']) == int(query['level.lt']) - int(query['level.ge']) for query in queries))
+
+    def test_range_ends_at_the_head(self):
+        self.assertEqual(self.levels(70, chunk_size=3), list(range(70, 80)))
+
+    def test_checkpoint_resumes_the_range(self):
+        self.assertEqual(self.levels(0, 20, chunk_size=5, checkpoint=12), list(range(13, 20)))
+        self.assertEqual(self.levels(0, 20, checkpoint=30), [])
+
+    def test_chunk_size_is_bounded(self):
+        for chunk_size in (0, Block.max_chunk_size + 1):
+            with self.assertRaises(ValueError):
+                self.levels(0, 20, chunk_size=chunk_size)
+        self.assertEqual(self.server.requests, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests of the cache policy, of the in-memory response cache and of the persistent SQLite store.
+"""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from tzktpy.block import Block
+from tzktpy.cache import FOREVER, CachePolicy, ResponseCache, SQLiteStore
+from tzktpy.client import Client
+from tzktpy.response import Response
+from .server import StubServer
+
+OPERATION_HASH = 'op6hnMitxyMmdoULXeKq6En2KfC1VDWg9nLwoahTqVhgqNimDLi'
+BLOCK_HASH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+HEAD = (2000, 20)
+
+
+def response(data, status_code=200):
+    return Response(status_code, {}, 'http://stub', json.dumps(data).encode('utf-8'))
+
+
+class CachePolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.policy = CachePolicy()
+        self.page = response([dict(id=1, level=100), dict(id=2, level=101)])
+
+    def test_list_endpoints_are_never_final(self):
+        paths = (
+            'v1/blocks',
+            'v1/blocks/count',
+            'v1/operations/originations',
+            'v1/operations/transactions',
+            'v1/operations/originations/count',
+            'v1/operations/transactions/count',
+            'v1/operations/delegations',
+            'v1/bigmaps/updates',
+            'v1/bigmaps/12/keys',
+        )
+        for path in paths:
+            self.assertIsNone(self.policy.ttl(path, self.page, HEAD), path)
+            self.assertFalse(self.policy.requires_head(path), path)
+
+    def test_hashes_are_final_below_the_head(self):
+        self.assertEqual(self.policy.ttl('v1/operations/%s' % OPERATION_HASH, self.page, HEAD), FOREVER)
+        self.assertEqual(self.policy.ttl('v1/operations/%s/1' % OPERATION_HASH, self.page, HEAD), FOREVER)
+        self.assertEqual(self.policy.ttl('v1/operations/transactions/%s' % OPERATION_HASH, self.page, HEAD), FOREVER)
+        self.assertEqual(self.policy.ttl('v1/blocks/%s' % BLOCK_HASH, response(dict(level=100)), HEAD), FOREVER)
+        recent = response([dict(id=3, level=1999)])
+        self.assertIsNone(self.policy.ttl('v1/operations/%s' % OPERATION_HASH, recent, HEAD))
+
+    def test_levels_and_cycles(self):
+        block = response(dict(level=100))
+        self.assertEqual(self.policy.ttl('v1/blocks/100', block, HEAD), FOREVER)
+        self.assertIsNone(self.policy.ttl('v1/blocks/1999', block, HEAD))
+        self.assertIsNone(self.policy.ttl('v1/blocks/100', block, None))
+        self.assertEqual(self.policy.ttl('v1/cycles/19', block, HEAD), FOREVER)
+        self.assertIsNone(self.policy.ttl('v1/cycles/20', block, HEAD))
+
+    def test_mutable_resources_expire(self):
+        self.assertEqual(self.policy.ttl('v1/head', response(dict(level=1)), HEAD), 2)
+        self.assertEqual(self.policy.ttl('v1/accounts/tz1abc', response(dict()), HEAD), 30)
+        self.assertIsNone(self.policy.ttl('v1/head', response(dict(), 500), HEAD))
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(maxsize=2)
+        for name in ('a', 'b', 'c'):
+            cache.set(ResponseCache.key('http://stub', name), response(name), FOREVER)
+        self.assertIsNone(cache.get(ResponseCache.key('http://stub', 'a')))
+        self.assertIsNotNone(cache.get(ResponseCache.key('http://stub', 'c')))
+        self.assertEqual(len(cache), 2)
+
+    def test_key_normalizes_parameters(self):
+        self.assertEqual(ResponseCache.key('http://stub/', '/v1/blocks', dict(a=1, b=[1, 2])), ResponseCache.key('http://stub', 'v1/blocks', dict(b='1,2', a='1')))
+
+    def test_client_serves_final_blocks_from_cache(self):
+        with StubServer() as server, Client(cache=ResponseCache()) as client:
+            server.route(r'v1/head', lambda query: dict(level=2000, cycle=20))
+            server.route(r'v1/blocks/(\d+)', lambda query, level: dict(level=int(level), hash='B%s' % level))
+            with client.use():
+                levels = [Block.by_level(level, domain=server.url).level for level in (100, 100, 1999, 1999)]
+            self.assertEqual(levels, [100, 100, 1999, 1999])
+            self.assertEqual(len(server.requested(r'v1/blocks/100')), 1)
+            self.assertEqual(len(server.requested(r'v1/blocks/1999')), 2)
+            self.assertEqual(len(server.requested(r'v1/head')), 1)
+
+
+class SQLiteStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'responses.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_responses_survive_reopening(self):
+        key = ResponseCache.key('http://stub', 'v1/blocks/100', dict(micheline=1))
+        SQLiteStore(self.path).set(key, response(dict(level=100)))
+        store = SQLiteStore(self.path)
+        self.assertEqual(store.get(key).json(), dict(level=100))
+        self.assertIsNone(store.get(ResponseCache.key('http://stub', 'v1/blocks/101')))
+
+    def test_evicts_least_recently_used_beyond_max_bytes(self):
+        store = SQLiteStore(self.path, max_bytes=100)
+        keys = [ResponseCache.key('http://stub', 'v1/blocks/%i' % level) for level in range(5)]
+        for key in keys:
+            store.set(key, response('x' * 28))
+        self.assertLessEqual(store.size(), 90)
+        self.assertIsNone(store.get(keys[0]))
+        self.assertIsNotNone(store.get(keys[-1]))
+
+    def test_connections_are_per_thread(self):
+        store = SQLiteStore(self.path)
+        key = ResponseCache.key('http://stub', 'v1/blocks/1')
+        thread = threading.Thread(target=store.set, args=(key, response(dict(level=1))))
+        thread.start()
+        thread.join()
+        self.assertEqual(store.get(key).json(), dict(level=1))
+
+    def test_cache_persists_only_final_responses(self):
+        store = SQLiteStore(self.path)
+        cache = ResponseCache(persistent=store)
+        final, recent = ResponseCache.key('http://stub', 'v1/blocks/100'), ResponseCache.key('http://stub', 'v1/head')
+        cache.set(final, response(dict(level=100)), FOREVER)
+        cache.set(recent, response(dict(level=2000)), 2)
+        self.assertIsNone(store.get(recent))
+        restarted = ResponseCache(persistent=SQLiteStore(self.path))
+        self.assertEqual(restarted.get(final).json(), dict(level=100))
+        self.assertEqual(len(restarted), 1)
+        self.assertEqual((restarted.hits, restarted.misses), (1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
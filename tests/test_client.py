@@ -0,0 +1,63 @@
+"""
+Tests of the pooled Client and of how model classes pick their client.
+"""
+import unittest
+from tzktpy.client import Client, get_default_client, set_default_client
+from tzktpy.head import Head
+from .server import StubServer
+
+
+class CountingClient(Client):
+
+    def __init__(self, *args, **kwargs):
+        super(CountingClient, self).__init__(*args, **kwargs)
+        self.paths = []
+
+    def request(self, method, domain, path, **kwargs):
+        self.paths.append(path)
+        return super(CountingClient, self).request(method, domain, path, **kwargs)
+
+
+class ClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/head', lambda query: dict(level=100, cycle=1, hash='BLhead'))
+        self.previous = set_default_client(CountingClient())
+
+    def tearDown(self):
+        get_default_client().close()
+        set_default_client(self.previous)
+        self.server.stop()
+
+    def test_session_is_reused_per_domain(self):
+        with CountingClient() as client:
+            with client.use():
+                first = Head.get(domain=self.server.url)
+                second = Head.get(domain=self.server.url)
+            self.assertEqual((first.level, second.level), (100, 100))
+            self.assertEqual(list(client._sessions), [self.server.url])
+            self.assertIs(client.session(self.server.url), client.session(self.server.url))
+
+    def test_bound_client_takes_precedence(self):
+        default = get_default_client()
+        with CountingClient() as bound, CountingClient() as own:
+            Head.client = own
+            try:
+                Head.get(domain=self.server.url)
+                with bound.use():
+                    Head.get(domain=self.server.url)
+            finally:
+                Head.client = None
+            Head.get(domain=self.server.url)
+            self.assertEqual(own.paths, ['v1/head'])
+            self.assertEqual(bound.paths, ['v1/head'])
+            self.assertEqual(default.paths, ['v1/head'])
+
+    def test_default_timeout(self):
+        self.assertEqual(Client().timeout, Client.default_timeout)
+        self.assertEqual(Client(timeout=3).timeout, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests of the projection of list endpoints and of columnar results.
+"""
+import math
+import unittest
+from tzktpy.client import Client
+from tzktpy.columns import NAT, Columns, pyarrow
+from tzktpy.operation import Transaction
+from .server import StubServer, list_endpoint
+
+
+def transaction(id):
+    return dict(type='transaction', id=id, level=100 + id, timestamp='2021-01-01T00:00:%02iZ' % id if id % 2 else None, sender=dict(address='tz1sender'), amount=id * 10, bakerFee=id if id > 1 else None, hash='op%i' % id, hasInternals=False)
+
+
+class SelectParametersTest(unittest.TestCase):
+
+    def test_projections(self):
+        self.assertEqual(Transaction.select_parameters(['sender', 'amount', 'has_internals']), dict(select='sender,amount,hasInternals'))
+        self.assertEqual(Transaction.select_parameters(['id', 'amount'], tuples=True), {'select.values': 'id,amount'})
+        self.assertEqual(Transaction.select_parameters(columns=['id', 'baker_fee']), dict(select='id,bakerFee'))
+        self.assertEqual(Transaction.select_parameters(columns=True), dict())
+        self.assertEqual(Transaction.select_parameters(), dict())
+
+
+class ColumnsTest(unittest.TestCase):
+    rows = [transaction(id) for id in range(1, 6)]
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/operations/transactions', list_endpoint(self.rows))
+        self.client = Client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def get(self, **kwargs):
+        with self.client.use():
+            return Transaction.get(domain=self.server.url, **kwargs)
+
+    def test_column_types(self):
+        columns = self.get(columns=True)
+        self.assertEqual(len(columns), 5)
+        self.assertIn('amount', columns)
+        self.assertEqual(list(columns['amount']), [10, 20, 30, 40, 50])
+        self.assertIn(type(columns['amount'][0]).__name__, ('int', 'int64'))
+        baker_fees = list(columns['baker_fee'])
+        self.assertTrue(math.isnan(baker_fees[0]))
+        self.assertEqual(baker_fees[1:], [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(list(columns['hash']), ['op1', 'op2', 'op3', 'op4', 'op5'])
+        self.assertEqual(columns['sender'], [dict(address='tz1sender')] * 5)
+        self.assertEqual(columns.last_value('id'), 5)
+
+    def test_missing_timestamps(self):
+        columns = Columns(Transaction, list(self.rows), ['timestamp'])
+        values = [int(value.astype('int64')) if hasattr(value, 'astype') else value for value in columns['timestamp']]
+        self.assertEqual(values[0], 1609459201)
+        self.assertEqual(values[1], NAT)
+
+    def test_columns_are_built_on_first_access(self):
+        columns = self.get(columns=True)
+        self.assertEqual(columns._columns, dict())
+        columns['amount']
+        self.assertEqual(list(columns._columns), ['amount'])
+
+    def test_listed_columns_release_the_rows(self):
+        columns = self.get(columns=['id', 'amount'])
+        self.assertEqual(columns.names, ('id', 'amount'))
+        self.assertIsNone(columns._rows)
+        self.assertEqual(self.server.requests[-1][1]['select'], 'id,amount')
+        with self.assertRaises(KeyError):
+            columns['level']
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            Columns(Transaction, list(self.rows), ['id', 'invalid'])
+
+    def test_concat_and_drop(self):
+        first, second = Columns(Transaction, self.rows[:2]), Columns(Transaction, self.rows[2:])
+        self.assertEqual(list(Columns.concat([first, second])['id']), [1, 2, 3, 4, 5])
+        first, second = Columns(Transaction, self.rows[:2], ['id', 'amount']), Columns(Transaction, self.rows[2:], ['id', 'amount'])
+        concatenated = Columns.concat([first, second])
+        self.assertEqual(list(concatenated['amount']), [10, 20, 30, 40, 50])
+        concatenated.drop('id')
+        self.assertEqual(concatenated.names, ('amount', ))
+        self.assertEqual(list(concatenated.to_dict()), ['amount'])
+
+    @unittest.skipIf(pyarrow is None, 'requires pyarrow')
+    def test_to_arrow(self):
+        batch = self.get(columns=['id', 'baker_fee', 'sender']).to_arrow()
+        self.assertEqual(batch.num_rows, 5)
+        self.assertEqual(batch.column(1).null_count, 1)
+        self.assertEqual(batch.column(2)[0].as_py(), '{"address": "tz1sender"}')
+
+
+if __name__ == '__main__':
+    unittest.main()
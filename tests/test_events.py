@@ -0,0 +1,174 @@
+"""
+Tests of the EventClient against a local stand-in for the tzkt events hub.
+"""
+import json
+import unittest
+try:
+    from aiohttp import web, WSMsgType
+except ImportError:  # pragma: no cover
+    web = None
+from tzktpy.aio import AsyncClient
+from tzktpy.events import EventClient, RECORD_SEPARATOR, COMPLETION, INVOCATION, STATE, DATA
+from tzktpy.throttle import RetryPolicy
+
+
+def block(level):
+    return dict(level=level, hash='B%i' % level, timestamp='2021-06-01T12:00:00Z')
+
+
+class StandInHub(object):
+    """
+    Local aiohttp server speaking the SignalR JSON hub protocol of `/v1/events`, and serving the blocks of its chain on `/v1/blocks`.
+
+    Attributes:
+        sessions (list):  For each websocket connection, the `(channel, payload)` messages pushed once the client subscribed.  The connection is dropped after its messages were pushed, except for the last one, which stays open.
+        chain (dict):  Blocks served by the REST endpoint, by level.
+        failures (int):  Number of REST requests answered with a `500` before the endpoint works.
+        connections (int):  Number of websocket connections accepted.
+        requests (list):  Query parameters of every REST request.
+    """
+
+    def __init__(self, sessions, chain, failures=0):
+        self.sessions = list(sessions)
+        self.chain = chain
+        self.failures = failures
+        self.connections = 0
+        self.requests = []
+        self.runner = None
+        self.url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/v1/events/negotiate', self.negotiate)
+        app.router.add_get('/v1/events', self.websocket)
+        app.router.add_get('/v1/blocks', self.blocks)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = 'http://127.0.0.1:%i' % port
+        return self
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def negotiate(self, request):
+        return web.json_response(dict(negotiateVersion=1, connectionToken='token-%i' % (self.connections + 1)))
+
+    async def send(self, websocket, message):
+        await websocket.send_str(json.dumps(message) + RECORD_SEPARATOR)
+
+    async def receive(self, websocket):
+        # pings sent by the client are ignored
+        while True:
+            message = await websocket.receive()
+            if message.type != WSMsgType.TEXT:
+                return None
+            messages = [json.loads(part) for part in message.data.split(RECORD_SEPARATOR) if part]
+            messages = [item for item in messages if item.get('type') != 6]
+            if messages:
+                return messages[0]
+
+    async def websocket(self, request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.connections += 1
+        messages = self.sessions.pop(0) if self.sessions else []
+        last = not self.sessions
+
+        handshake = await self.receive(websocket)
+        assert handshake == dict(protocol='json', version=1)
+        await websocket.send_str('{}' + RECORD_SEPARATOR)
+        invocation = await self.receive(websocket)
+        assert invocation['type'] == INVOCATION and invocation['target'] == 'SubscribeToBlocks'
+        await self.send(websocket, dict(type=COMPLETION, invocationId=invocation['invocationId']))
+
+        for channel, payload in messages:
+            await self.send(websocket, dict(type=INVOCATION, target=channel, arguments=[payload]))
+        if last:
+            while await self.receive(websocket) is not None:
+                pass
+        await websocket.close()
+        return websocket
+
+    async def blocks(self, request):
+        self.requests.append(dict(request.query))
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=500, text='Internal Server Error')
+        query = request.query
+        levels = sorted(self.chain)
+        for name, keep in (('level.gt', lambda level, value: level > value), ('level.le', lambda level, value: level <= value), ('offset.cr', lambda level, value: level > value)):
+            if name in query:
+                levels = [level for level in levels if keep(level, int(query[name]))]
+        levels = levels[:int(query.get('limit', 100))]
+        return web.json_response([self.chain[level] for level in levels])
+
+
+@unittest.skipIf(web is None, 'requires aiohttp')
+class EventClientTest(unittest.IsolatedAsyncioTestCase):
+
+    async def collect(self, hub, count, callback=None):
+        items = []
+        async with AsyncClient(retry=RetryPolicy(retries=0)) as client:
+            async with EventClient(domain=hub.url, client=client, callback=callback, keepalive=60, timeout=5, retry=RetryPolicy(backoff=0.01, max_backoff=0.01)) as events:
+                events.subscribe_blocks()
+                async for item in events:
+                    items.append(item)
+                    if len(items) == count:
+                        break
+        return items
+
+    async def test_gap_is_backfilled_in_order(self):
+        chain = dict((level, block(level)) for level in range(100, 107))
+        sessions = [
+            [('blocks', dict(type=STATE, state=100)), ('blocks', dict(type=DATA, state=101, data=[block(101)])), ('blocks', dict(type=DATA, state=102, data=[block(102)]))],
+            [('blocks', dict(type=STATE, state=105)), ('blocks', dict(type=DATA, state=106, data=[block(106)]))],
+        ]
+        hub = await StandInHub(sessions, chain).start()
+        try:
+            items = await self.collect(hub, 6)
+        finally:
+            await hub.stop()
+        self.assertEqual([item.level for item in items], [101, 102, 103, 104, 105, 106])
+        self.assertEqual(hub.connections, 2)
+        self.assertEqual(hub.requests[0]['level.gt'], '102')
+        self.assertEqual(hub.requests[0]['level.le'], '105')
+
+    async def test_failed_backfill_reconnects(self):
+        chain = dict((level, block(level)) for level in range(100, 105))
+        sessions = [
+            [('blocks', dict(type=STATE, state=100)), ('blocks', dict(type=DATA, state=101, data=[block(101)]))],
+            [('blocks', dict(type=STATE, state=103))],
+            [('blocks', dict(type=STATE, state=103)), ('blocks', dict(type=DATA, state=104, data=[block(104)]))],
+        ]
+        hub = await StandInHub(sessions, chain, failures=1).start()
+        try:
+            items = await self.collect(hub, 4)
+        finally:
+            await hub.stop()
+        self.assertEqual([item.level for item in items], [101, 102, 103, 104])
+        self.assertEqual(hub.connections, 3)
+
+    async def test_callback_errors_propagate(self):
+        chain = dict((level, block(level)) for level in range(100, 103))
+        sessions = [
+            [('blocks', dict(type=STATE, state=100)), ('blocks', dict(type=DATA, state=101, data=[block(101)])), ('blocks', dict(type=DATA, state=102, data=[block(102)]))],
+            [('blocks', dict(type=STATE, state=102))],
+        ]
+
+        def callback(item):
+            if item.level == 102:
+                raise ValueError('cannot process block %i' % item.level)
+        hub = await StandInHub(sessions, chain).start()
+        try:
+            with self.assertRaises(ValueError):
+                await self.collect(hub, 3, callback)
+        finally:
+            await hub.stop()
+        self.assertEqual(hub.connections, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
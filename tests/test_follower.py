@@ -0,0 +1,82 @@
+"""
+Tests of the Follower.
+"""
+import unittest
+from tzktpy.client import Client
+from tzktpy.follower import Batch, Follower, ReorgTooDeep, Rollback
+from tzktpy.operation import Transaction
+from .server import StubServer, list_endpoint
+
+
+class FollowerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.blocks = []
+        self.transactions = []
+        self.extend(10)
+        self.server = StubServer().start()
+        self.server.route(r'v1/blocks', list_endpoint(self.blocks, key='level'))
+        self.server.route(r'v1/operations/transactions', list_endpoint(self.transactions))
+        self.server.route(r'v1/head', lambda query: dict(self.blocks[-1], cycle=0))
+        self.client = Client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def extend(self, count, fork=''):
+        for level in range(len(self.blocks), len(self.blocks) + count):
+            self.blocks.append(dict(level=level, hash='B%i%s' % (level, fork)))
+            self.transactions.append(dict(type='transaction', id=len(self.transactions) + 1, level=level, hash='o%i%s' % (level, fork)))
+
+    def reorganize(self, level, count):
+        del self.blocks[level + 1:]
+        self.transactions[:] = [item for item in self.transactions if item['level'] <= level]
+        self.extend(count, fork='x')
+
+    def poll(self, follower):
+        with self.client.use():
+            return follower.poll()
+
+    def test_first_poll_starts_at_the_head(self):
+        follower = Follower(domain=self.server.url)
+        self.assertEqual(self.poll(follower), [])
+        self.assertEqual((follower.level, follower.hash), (9, 'B9'))
+        self.assertTrue(follower.caught_up)
+
+    def test_batches_of_new_blocks_and_operations(self):
+        events = []
+        follower = Follower(level=3, hash='B3', operations=[Transaction], callback=events.append, max_levels=4, domain=self.server.url)
+        first = self.poll(follower)
+        self.assertEqual(events, first)
+        self.assertIsInstance(first[0], Batch)
+        self.assertEqual([block.level for block in first[0].blocks], [4, 5, 6, 7])
+        self.assertEqual([item.hash for item in first[0].operations[Transaction]], ['o4', 'o5', 'o6', 'o7'])
+        self.assertEqual([item.hash for item in first[0].at_level(5)[Transaction]], ['o5'])
+        self.assertFalse(follower.caught_up)
+        self.assertEqual([block.level for block in self.poll(follower)[0].blocks], [8, 9])
+        self.assertEqual(self.poll(follower), [])
+        self.assertEqual(len(self.server.requested(r'v1/blocks')), 2)
+
+    def test_reorganization_rolls_back_to_the_fork(self):
+        follower = Follower(level=5, hash='B5', operations=[Transaction], domain=self.server.url)
+        self.poll(follower)
+        self.reorganize(7, 3)
+        rollback, batch = self.poll(follower)
+        self.assertIsInstance(rollback, Rollback)
+        self.assertEqual((rollback.level, rollback.hash, rollback.previous_level, rollback.previous_hash), (7, 'B7', 9, 'B9'))
+        self.assertEqual([block.hash for block in batch.blocks], ['B8x', 'B9x', 'B10x'])
+        self.assertEqual([item.hash for item in batch.operations[Transaction]], ['o8x', 'o9x', 'o10x'])
+        self.assertEqual((follower.level, follower.hash), (10, 'B10x'))
+
+    def test_reorganization_deeper_than_the_history(self):
+        follower = Follower(level=5, hash='B5', depth=2, domain=self.server.url)
+        self.poll(follower)
+        self.reorganize(3, 7)
+        with self.assertRaises(ReorgTooDeep):
+            self.poll(follower)
+        self.assertEqual((follower.level, follower.hash), (9, 'B9'))
+
+
+if __name__ == '__main__':
+    unittest.main()
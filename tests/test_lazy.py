@@ -0,0 +1,63 @@
+"""
+Tests of lazy rows.
+"""
+import copy
+import datetime
+import pickle
+import unittest
+from tzktpy.client import Client
+from tzktpy.operation import Transaction
+from .server import StubServer, list_endpoint
+
+
+def transaction(id):
+    return dict(type='transaction', id=id, level=100 + id, timestamp='2021-01-01T00:00:0%iZ' % id, sender=dict(address='tz1sender'), amount=id * 10, hasInternals=False)
+
+
+class LazyRowTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/operations/transactions', list_endpoint([transaction(id) for id in range(1, 4)]))
+        self.client = Client()
+        Transaction.lazy = True
+
+    def tearDown(self):
+        del Transaction.lazy
+        self.client.close()
+        self.server.stop()
+
+    def get(self):
+        with self.client.use():
+            return Transaction.get(domain=self.server.url)
+
+    def test_rows_are_instances_of_the_model(self):
+        rows = self.get()
+        self.assertIsInstance(rows[0], Transaction)
+        self.assertIs(type(rows[0]), Transaction.lazy_class())
+        self.assertEqual(type(rows[0]).__name__, 'Transaction')
+
+    def test_attributes_are_converted_on_first_access(self):
+        row = self.get()[0]
+        self.assertEqual(list(vars(row)), ['_data'])
+        self.assertEqual(row.timestamp, datetime.datetime(2021, 1, 1, 0, 0, 1))
+        self.assertEqual(list(vars(row)), ['_data', 'timestamp'])
+        self.assertEqual((row.amount, row.has_internals, row.hash), (10, False, None))
+        row.amount = 5
+        self.assertEqual(row.amount, 5)
+
+    def test_rows_pickle_as_regular_objects(self):
+        row = self.get()[1]
+        row.amount = 1
+        for restored in (pickle.loads(pickle.dumps(row)), copy.copy(row)):
+            self.assertIs(type(restored), Transaction)
+            self.assertEqual((restored.id, restored.amount, restored.sender), (2, 1, dict(address='tz1sender')))
+            self.assertEqual(restored.timestamp, datetime.datetime(2021, 1, 1, 0, 0, 2))
+
+    def test_eager_rows_by_default(self):
+        Transaction.lazy = False
+        self.assertIs(type(self.get()[0]), Transaction)
+
+
+if __name__ == '__main__':
+    unittest.main()
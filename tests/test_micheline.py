@@ -0,0 +1,55 @@
+"""
+Tests of the deferred decoding of Micheline fields.
+"""
+import json
+import unittest
+from tzktpy.client import Client
+from tzktpy.micheline import Deferred
+from tzktpy.operation import Transaction
+from .server import StubServer, list_endpoint
+
+PARAMETER = dict(entrypoint='transfer', value=dict(prim='Pair', args=[dict(int='1'), dict(string='tz1')]))
+
+
+def transactions(query):
+    rows = list_endpoint([dict(type='transaction', id=id, level=100, amount=id, parameter=PARAMETER) for id in range(1, 4)])(query)
+    if query.get('micheline') == '1':
+        rows = [dict(row, parameter=dict(row['parameter'], value=json.dumps(row['parameter']['value']))) if isinstance(row, dict) and 'parameter' in row else row for row in rows]
+    return rows
+
+
+class MichelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/operations/transactions', transactions)
+        self.client = Client()
+        self.previous = Transaction.micheline_mode
+        Transaction.micheline_mode = 'defer'
+
+    def tearDown(self):
+        Transaction.micheline_mode = self.previous
+        self.client.close()
+        self.server.stop()
+
+    def test_objects_defer_decoding(self):
+        with self.client.use():
+            items = Transaction.get(domain=self.server.url)
+        self.assertEqual(self.server.requests[0][1].get('micheline'), '1')
+        slot = Transaction.__dict__['parameter'].slot
+        self.assertIsInstance(slot.__get__(items[0], Transaction), Deferred)
+        self.assertEqual(items[0].parameter, PARAMETER)
+
+    def test_tuples_and_columns_hold_decoded_values(self):
+        with self.client.use():
+            rows = Transaction.get(fields=['id', 'parameter'], tuples=True, domain=self.server.url)
+            columns = Transaction.get(columns=['id', 'parameter'], domain=self.server.url)
+            every = Transaction.get(columns=True, domain=self.server.url)
+        self.assertEqual(rows, [(id, PARAMETER) for id in range(1, 4)])
+        self.assertEqual(list(columns['parameter']), [PARAMETER] * 3)
+        self.assertEqual(list(every['parameter']), [PARAMETER] * 3)
+        self.assertEqual([query.get('micheline') for path, query in self.server.requests], [None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
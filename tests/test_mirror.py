@@ -0,0 +1,154 @@
+"""
+Tests of the local mirrors of bigmaps.
+"""
+import unittest
+from tzktpy.bigmap import BigMapUpdate
+from tzktpy.client import Client
+from tzktpy.mirror import BigMapHistory, BigMapMirror
+from .server import StubServer, list_endpoint
+
+PTR = 7
+
+
+def key(id, hash, key, value, active=True):
+    return dict(id=id, active=active, hash=hash, key=key, value=value, firstLevel=1, lastLevel=1, updates=1)
+
+
+def update(id, level, action, content=None, bigmap=PTR):
+    return dict(id=id, level=level, bigmap=bigmap, contract=dict(address='KT1ledger'), path='ledger', action=action, content=content)
+
+
+def content(hash, key, value=None):
+    return dict(hash=hash, key=key, value=value)
+
+
+class BigMapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.head = 100
+        self.keys = []
+        self.updates = []
+        self.server = StubServer().start()
+        self.server.route(r'v1/head', lambda query: dict(level=self.head, cycle=1))
+        keys = list_endpoint(self.keys)
+        self.server.route(r'v1/bigmaps/(\d+)/keys', lambda query, ptr: keys(query) if int(ptr) == PTR else [])
+        updates = list_endpoint(self.updates)
+        self.server.route(r'v1/bigmaps/updates', lambda query: [item for item in updates(query) if str(item['bigmap']) == query['bigmap']])
+        self.client = Client()
+        binding = self.client.use()
+        binding.__enter__()
+        self.addCleanup(binding.__exit__, None, None, None)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+
+class BigMapMirrorTest(BigMapTestCase):
+
+    def setUp(self):
+        super(BigMapMirrorTest, self).setUp()
+        self.keys += [
+            key(1, 'exprA', 'tz1a', dict(balance='10')),
+            key(2, 'exprB', 'tz1b', dict(balance='50')),
+            key(3, 'exprC', dict(owner='tz1c', token=0), dict(balance='50')),
+        ]
+        self.mirror = BigMapMirror(PTR, domain=self.server.url).bootstrap(limit=2)
+
+    def test_bootstrap_copies_the_active_keys(self):
+        mirror = self.mirror
+        self.assertEqual((len(mirror), mirror.level), (3, 100))
+        self.assertEqual(mirror['tz1a'], dict(balance='10'))
+        self.assertEqual(mirror['exprB'], dict(balance='50'))
+        self.assertEqual(mirror.get(dict(token=0, owner='tz1c')), dict(balance='50'))
+        self.assertNotIn('tz1z', mirror)
+        with self.assertRaises(KeyError):
+            mirror['tz1z']
+        self.assertEqual(mirror.get_many(['tz1a', 'tz1z'], 0), [dict(balance='10'), 0])
+        self.assertEqual(len(self.server.requested(r'v1/bigmaps/7/keys')), 2)
+        # the head did not move while the keys were paged:  there is nothing to replay
+        self.assertEqual(self.server.requested(r'v1/bigmaps/updates'), [])
+
+    def test_refresh_replays_the_updates(self):
+        balances = self.mirror.add_index('balance', convert=int)
+        self.updates += [
+            update(1, 101, 'update_key', content('exprA', 'tz1a', dict(balance='70'))),
+            update(2, 101, 'add_key', content('exprD', 'tz1d', dict(balance='5'))),
+            update(3, 102, 'remove_key', content('exprB', 'tz1b', dict(balance='50'))),
+            update(4, 102, 'add_key', content('exprE', 'tz1e', dict(balance='1')), bigmap=PTR + 1),
+        ]
+        self.head = 102
+        self.assertEqual(self.mirror.refresh(), 3)
+        self.assertEqual(self.mirror.level, 102)
+        query = self.server.requested(r'v1/bigmaps/updates')[0]
+        self.assertEqual((query['level.gt'], query['level.le']), ('100', '102'))
+        self.assertEqual(sorted(key for key in self.mirror if isinstance(key, str)), ['tz1a', 'tz1d'])
+        self.assertNotIn('tz1b', self.mirror)
+        self.assertEqual(balances.eq('50'), {'exprC'})
+        self.assertEqual(balances.range(10), {'exprA', 'exprC'})
+        self.assertEqual(balances.range(None, 60), {'exprC', 'exprD'})
+        self.assertEqual(self.mirror.find(70, 'balance'), ['tz1a'])
+        self.assertEqual(self.mirror.where(lambda value: value['balance'] == '5'), [('tz1d', dict(balance='5'))])
+        self.assertEqual(self.mirror.refresh(), 0)
+
+    def test_updates_made_while_paging_are_replayed(self):
+        keys = list_endpoint(self.keys)
+
+        def moving_keys(query, ptr):
+            if self.head == 100:
+                self.head = 101
+                self.updates.append(update(1, 101, 'update_key', content('exprA', 'tz1a', dict(balance='0'))))
+            return keys(query)
+        self.server.route(r'v1/bigmaps/(\d+)/keys', moving_keys)
+        mirror = BigMapMirror(PTR, domain=self.server.url).bootstrap()
+        self.assertEqual((mirror.level, mirror['tz1a']), (101, dict(balance='0')))
+
+    def test_clearing_updates_empty_the_mirror(self):
+        index = self.mirror.add_index('balance')
+        self.assertEqual(self.mirror.apply([BigMapUpdate.from_api(update(1, 101, 'remove'))]), 1)
+        self.assertEqual((len(self.mirror), self.mirror.level, index.entries), (0, 101, dict()))
+
+
+class BigMapHistoryTest(BigMapTestCase):
+
+    def setUp(self):
+        super(BigMapHistoryTest, self).setUp()
+        self.updates += [
+            update(1, 10, 'allocate'),
+            update(2, 10, 'add_key', content('exprA', 'tz1a', '1')),
+            update(3, 10, 'add_key', content('exprB', 'tz1b', '2')),
+            update(4, 12, 'update_key', content('exprA', 'tz1a', '3')),
+            update(5, 13, 'remove_key', content('exprB', 'tz1b', '2')),
+            update(6, 15, 'remove'),
+            update(7, 15, 'add_key', content('exprC', 'tz1c', '9')),
+        ]
+        self.head = 15
+        self.history = BigMapHistory(PTR, domain=self.server.url).load(limit=3)
+
+    def test_values_at_past_levels(self):
+        history = self.history
+        self.assertEqual((len(history), history.level), (3, 15))
+        self.assertEqual(history.values_at('tz1a', [9, 10, 11, 12, 14, 15]), [None, '1', '1', '3', '3', None])
+        self.assertEqual(history.values_at('exprB', [10, 12, 13], default=''), ['2', '2', ''])
+        self.assertEqual(history.value_at('tz1c', 15), '9')
+        self.assertIsNone(history.value_at('tz1z', 15))
+        self.assertEqual(history.changes('tz1b'), [(10, '2'), (13, None)])
+        self.assertEqual(len(self.server.requested(r'v1/bigmaps/updates')), 3)
+
+    def test_state_at_past_levels(self):
+        self.assertEqual(self.history.state_at(9), dict())
+        self.assertEqual(self.history.state_at(12), dict(exprA='3', exprB='2'))
+        self.assertEqual(self.history.state_at(13), dict(exprA='3'))
+        self.assertEqual(self.history.state_at(15), dict(exprC='9'))
+
+    def test_refresh_records_new_levels(self):
+        self.updates.append(update(8, 16, 'add_key', content('exprA', 'tz1a', '4')))
+        self.head = 16
+        self.assertEqual(self.history.refresh(), 1)
+        self.assertEqual(self.server.requested(r'v1/bigmaps/updates')[-1]['level.gt'], '15')
+        self.assertEqual(self.history.values_at('tz1a', [14, 15, 16]), ['3', None, '4'])
+        self.assertEqual(self.history.refresh(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
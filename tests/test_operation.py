@@ -0,0 +1,51 @@
+"""
+Tests of the batched operation lookups.
+"""
+import unittest
+from tzktpy.client import Client
+from tzktpy.exception import TZKTException
+from tzktpy.operation import Transaction
+from .server import StubServer
+
+HASHES = ('op6hnMitxyMmdoULXeKq6En2KfC1VDWg9nLwoahTqVhgqNimDLi', 'ooRhy9ToxZEGVsbSNt8u1zYFz9DyUo9Z4iqz1amaR2R3RuNLwzG')
+
+
+def transactions(query, hash):
+    if hash not in HASHES:
+        return 400, dict(code=400, errors=dict(hash='Invalid operation hash.'))
+    return [dict(type='transaction', id=HASHES.index(hash) + 1, level=100, hash=hash, amount=10)]
+
+
+class ByHashesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/operations/transactions/(\w+)', transactions)
+        self.client = Client()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_results_follow_the_hashes(self):
+        hashes = [HASHES[1], HASHES[0], HASHES[1]]
+        with self.client.use():
+            results = Transaction.by_hashes(hashes, concurrency=4, domain=self.server.url)
+        self.assertEqual([[item.hash for item in result] for result in results], [[hash] for hash in hashes])
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_invalid_hash_reports_the_api_error(self):
+        with self.client.use():
+            results = Transaction.by_hashes([HASHES[0], 'oInvalid'], domain=self.server.url)
+        self.assertEqual(results[0][0].hash, HASHES[0])
+        self.assertIsInstance(results[1], TZKTException)
+        self.assertEqual(results[1].args[0], dict(hash='Invalid operation hash.'))
+
+    def test_by_hash_raises_the_api_error(self):
+        with self.client.use():
+            with self.assertRaises(TZKTException):
+                Transaction.by_hash('oInvalid', domain=self.server.url)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests of the sequential and parallel pagination of list endpoints.
+"""
+import unittest
+from tzktpy.client import get_default_client, set_default_client
+from tzktpy.operation import Transaction
+from .server import StubServer, list_endpoint, count_endpoint
+from .test_client import CountingClient
+
+
+def transaction(id):
+    return dict(type='transaction', id=id, level=100 + id // 10, sender=dict(address='tz1sender%i' % (id % 3)), target=dict(address='KT1target'), amount=id * 10, status='applied')
+
+
+class PaginationTest(unittest.TestCase):
+    rows = [transaction(id) for id in range(1, 46)]
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.server.route(r'v1/operations/transactions', list_endpoint(self.rows))
+        self.server.route(r'v1/operations/transactions/count', count_endpoint(self.rows))
+        self.previous = set_default_client(CountingClient())
+        self.domain = self.server.url
+
+    def tearDown(self):
+        get_default_client().close()
+        set_default_client(self.previous)
+        self.server.stop()
+
+    def test_iter_pages_with_cursor(self):
+        ids = [item.id for item in Transaction.iter(limit=10, domain=self.domain)]
+        self.assertEqual(ids, list(range(1, 46)))
+        offsets = [query.get('offset.cr') for query in self.server.requested(r'v1/operations/transactions')]
+        self.assertEqual(offsets, [None, '10', '20', '30', '40'])
+
+    def test_cursor_is_not_added_to_projections(self):
+        rows = list(Transaction.iter(limit=10, fields=['sender', 'amount'], tuples=True, domain=self.domain))
+        self.assertEqual(rows, [(dict(address='tz1sender%i' % (id % 3)), id * 10) for id in range(1, 46)])
+        self.assertEqual(self.server.requested(r'v1/operations/transactions')[1]['select.values'], 'sender,amount,id')
+
+        items = list(Transaction.iter(limit=10, fields=['amount'], domain=self.domain))
+        self.assertEqual([(item.amount, item.id) for item in items], [(id * 10, None) for id in range(1, 46)])
+
+        pages = list(Transaction.stream(limit=10, columns=['amount'], domain=self.domain))
+        self.assertEqual([page.names for page in pages], [('amount', )] * 5)
+        self.assertEqual([value for page in pages for value in page['amount']], [id * 10 for id in range(1, 46)])
+
+        rows = list(Transaction.iter(limit=10, fields=['id', 'amount'], tuples=True, domain=self.domain))
+        self.assertEqual(rows, [(id, id * 10) for id in range(1, 46)])
+
+    def test_single_column_projection(self):
+        columns = Transaction.get(limit=5, columns=['amount'], domain=self.domain)
+        self.assertEqual(self.server.requests[-1][1]['select'], 'amount')
+        self.assertEqual(list(columns['amount']), [10, 20, 30, 40, 50])
+        rows = Transaction.get(limit=5, fields=['amount'], tuples=True, domain=self.domain)
+        self.assertEqual(rows, [(10, ), (20, ), (30, ), (40, ), (50, )])
+
+    def test_fetch_all_plans_pages_from_count(self):
+        ids = [item.id for item in Transaction.fetch_all(limit=10, concurrency=4, domain=self.domain)]
+        self.assertEqual(ids, list(range(1, 46)))
+        self.assertEqual(len(self.server.requested(r'v1/operations/transactions/count')), 1)
+        self.assertEqual(len(self.server.requested(r'v1/operations/transactions')), 5)
+
+    def test_fetch_all_counts_projected_queries(self):
+        rows = Transaction.fetch_all(limit=10, concurrency=4, fields=['id', 'amount'], tuples=True, domain=self.domain)
+        self.assertEqual(rows, [(id, id * 10) for id in range(1, 46)])
+        self.assertEqual(self.server.requested(r'v1/operations/transactions/count'), [dict()])
+
+        columns = Transaction.fetch_all(limit=10, concurrency=4, columns=['id', 'amount'], domain=self.domain)
+        self.assertEqual(list(columns['id']), list(range(1, 46)))
+        self.assertEqual(len(self.server.requested(r'v1/operations/transactions/count')), 2)
+
+    def test_parallel_pages_use_bound_client(self):
+        default = get_default_client()
+        with CountingClient() as bound:
+            with bound.use():
+                items = Transaction.fetch_all(limit=10, concurrency=4, domain=self.domain)
+        self.assertEqual(len(items), 45)
+        self.assertEqual(sorted(bound.paths), ['v1/operations/transactions/'] * 5 + ['v1/operations/transactions/count'])
+        self.assertEqual(default.paths, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
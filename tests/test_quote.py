@@ -0,0 +1,68 @@
+"""
+Tests of the local quote table.
+"""
+import math
+import unittest
+from tzktpy.client import Client
+from tzktpy.quote import QuoteTable
+from .server import StubServer, list_endpoint
+
+
+def quote(level):
+    return dict(level=level, timestamp='2021-01-01T00:00:00Z', btc=0.0001, eur=level * 0.5, usd=level * 1.0, cny=None, jpy=100.0, krw=1000.0, eth=0.002)
+
+
+class QuoteTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.quotes = [quote(level) for level in range(10, 20)]
+        self.server = StubServer().start()
+        self.server.route(r'v1/quotes', lambda query: list_endpoint(self.quotes, key='level')(query))
+        self.server.route(r'v1/quotes/last', lambda query: self.quotes[-1])
+        self.client = Client()
+        binding = self.client.use()
+        binding.__enter__()
+        self.addCleanup(binding.__exit__, None, None, None)
+        self.table = QuoteTable(domain=self.server.url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_fetch_a_range_of_levels(self):
+        self.assertEqual(self.table.fetch(12, 16, limit=3), 4)
+        self.assertEqual(list(self.table.levels), [12, 13, 14, 15])
+        self.assertEqual(list(self.table.columns['usd']), [12.0, 13.0, 14.0, 15.0])
+        self.assertTrue(all(math.isnan(value) for value in self.table.columns['cny']))
+        query = self.server.requested(r'v1/quotes')[0]
+        self.assertEqual((query['level.ge'], query['level.lt'], query['select.values']), ('12', '16', 'level,btc,eur,usd,cny,jpy,krw,eth'))
+        # the table only grows at its end
+        self.assertEqual(self.table.fetch(10, 17), 1)
+        self.assertEqual(self.table.level, 16)
+
+    def test_refresh(self):
+        self.assertEqual(self.table.refresh(limit=4), 10)
+        self.assertEqual(list(self.table.levels), list(range(10, 20)))
+        self.assertEqual(self.table.refresh(), 0)
+        self.quotes.append(quote(20))
+        requests = len(self.server.requested(r'v1/quotes'))
+        self.assertEqual(self.table.refresh(), 1)
+        self.assertEqual(len(self.server.requested(r'v1/quotes')), requests)
+        self.quotes += [quote(21), quote(22), quote(23)]
+        self.assertEqual(self.table.refresh(), 3)
+        self.assertEqual(self.server.requested(r'v1/quotes')[-1]['level.ge'], '21')
+        self.assertEqual(list(self.table.levels), list(range(10, 24)))
+
+    def test_prices_and_conversions(self):
+        self.table.fetch(12, 20)
+        prices = list(self.table.prices([11, 12, 15, 100], 'usd'))
+        self.assertTrue(math.isnan(prices[0]))
+        self.assertEqual(prices[1:], [12.0, 15.0, 19.0])
+        self.assertEqual(self.table.price(13, 'eur'), 6.5)
+        self.assertEqual(list(self.table.convert([12, 14], [2000000, 500000], 'usd')), [24.0, 7.0])
+        with self.assertRaises(ValueError):
+            self.table.convert([12], [1], 'xtz')
+
+
+if __name__ == '__main__':
+    unittest.main()
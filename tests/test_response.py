@@ -0,0 +1,45 @@
+"""
+Tests of the decoding of response bodies.
+"""
+import json
+import unittest
+from tzktpy.response import Response, get_json_decoder, set_json_decoder
+
+
+class ResponseTest(unittest.TestCase):
+
+    def test_standard_library_decodes_text(self):
+        content = json.dumps(dict(alias='café'), ensure_ascii=False).encode('latin-1')
+        response = Response(200, {}, 'http://stub', content, 'latin-1', json.loads)
+        self.assertEqual(response.json(), dict(alias='café'))
+
+    def test_other_decoders_receive_bytes(self):
+        received = []
+
+        def loads(content):
+            received.append(content)
+            return json.loads(content)
+        previous = set_json_decoder(loads)
+        try:
+            self.assertIs(get_json_decoder(), loads)
+            self.assertEqual(Response(200, {}, 'http://stub', b'[1, 2]').json(), [1, 2])
+        finally:
+            set_json_decoder(previous)
+        self.assertEqual(received, [b'[1, 2]'])
+
+    def test_shared_responses_decode_once(self):
+        calls = []
+
+        def loads(content):
+            calls.append(content)
+            return json.loads(content)
+        response = Response(200, {}, 'http://stub', b'{"level": 1}', 'utf-8', loads)
+        first, second = response.shared(), response.shared()
+        self.assertEqual(first.json(), dict(level=1))
+        self.assertEqual(first.json(), dict(level=1))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second.json(), dict(level=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
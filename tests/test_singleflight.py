@@ -0,0 +1,113 @@
+"""
+Tests of the coalescing of identical requests in flight.
+"""
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from tzktpy.client import Client
+from tzktpy.head import Head
+from tzktpy.singleflight import AsyncSingleFlight, SingleFlight
+from .server import StubServer
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def run_concurrently(self, flight, key, function, count=8, share=None):
+        with ThreadPoolExecutor(count) as executor:
+            futures = [executor.submit(flight.do, key, function, share) for _ in range(count)]
+            return [future.exception() or future.result() for future in futures]
+
+    def test_identical_calls_are_coalesced(self):
+        calls = []
+        release = threading.Event()
+
+        def function():
+            calls.append(1)
+            release.wait(5)
+            return 'result'
+        flight = SingleFlight()
+        timer = threading.Timer(0.2, release.set)
+        timer.start()
+        results = self.run_concurrently(flight, 'key', function, share=lambda result: result.upper())
+        timer.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(set(results), {'RESULT'})
+        self.assertEqual(flight._calls, dict())
+
+    def test_errors_are_raised_in_every_caller(self):
+        def function():
+            time.sleep(0.2)
+            raise ValueError('failed')
+        results = self.run_concurrently(SingleFlight(), 'key', function)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        calls = []
+        for _ in range(3):
+            flight.do('key', lambda: calls.append(1))
+        self.assertEqual(len(calls), 3)
+
+
+class AsyncSingleFlightTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_identical_calls_are_coalesced(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def function():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'result'
+        results = await asyncio.gather(*[flight.do('key', function, share=lambda result: result.upper()) for _ in range(8)])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['RESULT'] * 8)
+
+    async def test_cancelled_caller_does_not_cancel_the_call(self):
+        flight = AsyncSingleFlight()
+
+        async def function():
+            await asyncio.sleep(0.05)
+            return 'result'
+        first = asyncio.ensure_future(flight.do('key', function))
+        second = asyncio.ensure_future(flight.do('key', function))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual(await second, 'result')
+
+
+class ClientCoalescingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+
+        def head(query):
+            time.sleep(0.2)
+            return dict(level=100, cycle=1)
+        self.server.route(r'v1/head', head)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def heads(self, client):
+        def get():
+            with client.use():
+                return Head.get(domain=self.server.url).level
+        with ThreadPoolExecutor(8) as executor:
+            return list(executor.map(lambda _: get(), range(8)))
+
+    def test_concurrent_gets_share_a_request(self):
+        with Client() as client:
+            self.assertEqual(self.heads(client), [100] * 8)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_coalescing_can_be_disabled(self):
+        with Client(coalesce=False) as client:
+            self.assertEqual(self.heads(client), [100] * 8)
+        self.assertEqual(len(self.server.requests), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
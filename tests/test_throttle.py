@@ -0,0 +1,100 @@
+"""
+Tests of the rate limiter and of the retries of the Client.
+"""
+import time
+import unittest
+import requests
+from tzktpy.client import Client
+from tzktpy.head import Head
+from tzktpy.response import Response
+from tzktpy.throttle import RateLimiter, RetryPolicy, TokenBucket
+from .server import StubServer
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_burst_then_debt(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertEqual((bucket.reserve(), bucket.reserve()), (0.0, 0.0))
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_pause_holds_back_requests(self):
+        bucket = TokenBucket(rate=100)
+        bucket.pause(5)
+        self.assertAlmostEqual(bucket.reserve(), 5, delta=0.1)
+
+    def test_limits_per_domain(self):
+        limiter = RateLimiter(limits={'http://limited/': (1, 1)})
+        self.assertIsNone(limiter.bucket('http://free'))
+        self.assertEqual(limiter.reserve('http://free'), 0.0)
+        self.assertIs(limiter.bucket('http://limited'), limiter.bucket('http://limited/'))
+        self.assertEqual(limiter.reserve('http://limited'), 0.0)
+        self.assertGreater(limiter.reserve('http://limited'), 0.9)
+
+
+class RetryPolicyTest(unittest.TestCase):
+
+    def response(self, status_code, headers=None):
+        return Response(status_code, headers or {}, 'http://stub', b'')
+
+    def test_retryable(self):
+        policy = RetryPolicy(retries=2)
+        self.assertTrue(policy.is_retryable('GET', 1))
+        self.assertTrue(policy.is_retryable('get', 2, self.response(503)))
+        self.assertFalse(policy.is_retryable('GET', 3, self.response(503)))
+        self.assertFalse(policy.is_retryable('GET', 1, self.response(404)))
+        self.assertFalse(policy.is_retryable('POST', 1, self.response(503)))
+
+    def test_retry_after_takes_precedence(self):
+        policy = RetryPolicy(backoff=100, max_backoff=10)
+        self.assertEqual(policy.delay(1, self.response(429, {'Retry-After': '3'})), 3)
+        self.assertEqual(policy.delay(1, self.response(429, {'Retry-After': '120'})), 10)
+        self.assertIsNone(policy.retry_after(self.response(429, {'Retry-After': 'soon'})))
+        for attempt in range(1, 6):
+            self.assertLessEqual(policy.delay(attempt), 10)
+        self.assertLessEqual(RetryPolicy(backoff=1).delay(2), 2)
+
+
+class ClientRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer().start()
+        self.failures = 0
+
+        def head(query):
+            if self.failures:
+                self.failures -= 1
+                return 503, dict(error='unavailable')
+            return dict(level=100, cycle=1)
+        self.server.route(r'v1/head', head)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_transient_errors_are_retried(self):
+        self.failures = 2
+        with Client(retry=RetryPolicy(retries=3, backoff=0)) as client, client.use():
+            self.assertEqual(Head.get(domain=self.server.url).level, 100)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_exhausted_retries_raise(self):
+        self.failures = 5
+        with Client(retry=RetryPolicy(retries=1, backoff=0)) as client, client.use():
+            with self.assertRaises(requests.HTTPError):
+                Head.get(domain=self.server.url)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_throttled_requests_pause_the_domain(self):
+        self.server.route(r'v1/head', lambda query: (429, dict(error='slow down'), {'Retry-After': '0.3'}))
+        limiter = RateLimiter(rate=1000)
+        started = time.monotonic()
+        with Client(rate_limiter=limiter, retry=RetryPolicy(retries=1)) as client:
+            with self.assertRaises(requests.HTTPError):
+                client.request('GET', self.server.url, 'v1/head')
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+        self.assertGreaterEqual(limiter.bucket(self.server.url).paused_until, started + 0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
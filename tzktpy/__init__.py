@@ -2,16 +2,31 @@ from . import account
 from . import balance
 from . import bigmap
 from . import block
+from . import cache
+from . import client
+from . import columns
 from . import commitment
 from . import contract
 from . import cycle
 from . import delegate
+from . import events
+from . import follower
 from . import head
+from . import micheline
+from . import mirror
 from . import operation
 from . import protocol
 from . import quote
+from . import response
 from . import reward
 from . import right
+from . import singleflight
 from . import software
 from . import statistics
+from . import throttle
 from . import voting
+from .client import Client
+from .columns import Columns
+from .cache import ResponseCache, SQLiteStore
+from .throttle import RateLimiter, RetryPolicy
+from .response import set_json_decoder
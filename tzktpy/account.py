@@ -4,6 +4,24 @@ __all__ = ('AccountMetadata', 'AccountBase', 'Account')
 
 class AccountMetadata(Base):
     __slots__ = ('kind', 'alias', 'description', 'site', 'support', 'email', 'twitter', 'telegram', 'discord', 'reddit', 'slack', 'github', 'gitlab', 'instagram', 'facebook', 'medium')
+    api_fields = (
+        ('kind', 'kind'),
+        ('alias', 'alias'),
+        ('description', 'description'),
+        ('site', 'site'),
+        ('support', 'support'),
+        ('email', 'email'),
+        ('twitter', 'twitter'),
+        ('telegram', 'telegram'),
+        ('discord', 'discord'),
+        ('reddit', 'reddit'),
+        ('slack', 'slack'),
+        ('github', 'github'),
+        ('gitlab', 'gitlab'),
+        ('instagram', 'instagram'),
+        ('facebook', 'facebook'),
+        ('medium', 'medium'),
+    )
 
     def __init__(self, kind, alias, description, site, support, email, twitter, telegram, discord, reddit, slack, github, gitlab, instagram, facebook, medium):
         self.kind = kind
@@ -29,26 +47,6 @@ class AccountMetadata(Base):
     def __repr__(self):
         return '<%s %s alias=%r, site=%r, support=%s, email=%r>' % (self.__class__.__name__, id(self), self.alias, self.site, self.support, self.email)
 
-    @classmethod
-    def from_api(cls, data):
-        kind = data['kind']
-        alias = data.get('alias')
-        description = data.get('description')
-        site = data.get('site')
-        support = data.get('support')
-        email = data.get('email')
-        twitter = data.get('twitter')
-        telegram = data.get('telegram')
-        discord = data.get('discord')
-        reddit = data.get('reddit')
-        slack = data.get('slack')
-        github = data.get('github')
-        gitlab = data.get('gitlab')
-        instagram = data.get('instagram')
-        facebook = data.get('facebook')
-        medium = data.get('medium')
-        return cls(kind, alias, description, site, support, email, twitter, telegram, discord, reddit, slack, github, gitlab, instagram, facebook, medium)
-
     @classmethod
     def by_address(cls, address, **kwargs):
         """
@@ -75,6 +73,10 @@ class AccountMetadata(Base):
 
 
 class AccountBase(Base):
+    # filters `by_addresses` on the type of account, e.g. `delegate`
+    account_type = None
+    # maximum length of the `address.in` parameter of a single `by_addresses` request, keeping URLs well under common server limits
+    max_addresses_length = 4000
 
     def __init__(self, type, alias, address, public_key, revealed, balance, counter, delegation_level, delegation_time, num_contracts, num_activations, num_delegations, num_originations, num_transactions, num_reveals, num_migrations, first_activity, first_activity_time, last_activity, last_activity_time, contracts, operations, metadata):
         self.type = type
@@ -107,49 +109,112 @@ class AccountBase(Base):
     def __repr__(self):
         return '<%s %s address=%r, alias=%r, type=%r, balance=%r, first_activity_time=%s, last_activity_time=%s>' % (self.__class__.__name__, id(self), self.address, self.alias, self.type, self.balance, self.first_activity_time, self.last_activity_time)
 
+    @classmethod
+    def address_chunks(cls, addresses, max_length=None):
+        """
+        Splits addresses into chunks whose comma-separated length stays under `max_length`.
+
+        Returns:
+            list:  Lists of addresses
+        """
+        max_length = max_length or cls.max_addresses_length
+        chunks = []
+        chunk = []
+        length = 0
+        for address in addresses:
+            if chunk and length + len(address) + 1 > max_length:
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+            chunk.append(address)
+            length += len(address) + 1
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @classmethod
+    def _by_address_chunk(cls, addresses, **kwargs):
+        path = 'v1/accounts'
+        params = {'address.in': ','.join(addresses), 'limit': len(addresses)}
+        if cls.account_type:
+            params['type'] = cls.account_type
+        response = cls._request(path, params=params, **kwargs)
+        data = response.json()
+        return cls.from_api_list(data)
+
+    @classmethod
+    def by_addresses(cls, addresses, **kwargs):
+        """
+        Fetches many accounts at once.  Addresses are deduplicated and split into `address.in` filters short enough for a URL, and the chunks are fetched concurrently.
+
+        Parameters:
+            addresses (iterable):  Addresses of the accounts
+
+        Keyword Parameters:
+            concurrency (int, optional):  Maximum number of chunks fetched at the same time.  Defaults to 8.
+            max_length (int, optional):  Maximum length of the addresses of a single request.  Defaults to the `max_addresses_length` of the class.
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+
+        Returns:
+            dict:  The account of each address, or None for addresses which were not found
+
+        Examples:
+            >>> accounts = Account.by_addresses(['tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE', 'tz1irJKkXS2DBWkU1NnmFQx1c1L7pbGg4yhk'])
+            >>> accounts['tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE'].balance
+        """
+        concurrency = kwargs.pop('concurrency', 8)
+        chunks = cls.address_chunks(dict.fromkeys(addresses), kwargs.pop('max_length', None))
+        output = dict.fromkeys(address for chunk in chunks for address in chunk)
+        for page in cls.map_concurrent(cls._by_address_chunk, chunks, concurrency, **kwargs):
+            for account in page:
+                output[account.address] = account
+        return output
+
+    @classmethod
+    async def aby_addresses(cls, addresses, **kwargs):
+        """
+        Asynchronous version of `by_addresses`, using the default AsyncClient unless a `client` is given.
+        """
+        concurrency = kwargs.pop('concurrency', 8)
+        chunks = cls.address_chunks(dict.fromkeys(addresses), kwargs.pop('max_length', None))
+        output = dict.fromkeys(address for chunk in chunks for address in chunk)
+        for page in await cls.amap_concurrent(cls._by_address_chunk, chunks, concurrency, **kwargs):
+            for account in page:
+                output[account.address] = account
+        return output
+
 
 class Account(AccountBase):
 
+    api_fields = (
+        ('type', 'type'),
+        ('alias', 'alias'),
+        ('address', 'address'),
+        ('publicKey', 'public_key'),
+        ('revealed', 'revealed'),
+        ('balance', 'balance'),
+        ('counter', 'counter'),
+        ('delegationLevel', 'delegation_level'),
+        ('delegationTime', 'delegation_time', 'to_datetime'),
+        ('numContracts', 'num_contracts'),
+        ('numActivations', 'num_activations'),
+        ('numDelegations', 'num_delegations'),
+        ('numOriginations', 'num_originations'),
+        ('numTransactions', 'num_transactions'),
+        ('numReveals', 'num_reveals'),
+        ('numMigrations', 'num_migrations'),
+        ('firstActivity', 'first_activity'),
+        ('firstActivityTime', 'first_activity_time', 'to_datetime'),
+        ('lastActivity', 'last_activity'),
+        ('lastActivityTime', 'last_activity_time', 'to_datetime'),
+        ('contracts', 'contracts'),
+        ('operations', 'operations'),
+        ('metadata', 'metadata'),
+    )
+
     def __init__(self, type, alias, address, public_Key, revealed, balance, counter, delegation_level, delegation_time, num_contracts, num_activations, num_delegations, num_originations, num_transactions, num_reveals, num_migrations, first_activity, first_activity_time, last_activity, last_activity_time, contracts, operations, metadata):
         super(Account, self).__init__(type, alias, address, public_Key, revealed, balance, counter, delegation_level, delegation_time, num_contracts, num_activations, num_delegations, num_originations, num_transactions, num_reveals, num_migrations, first_activity, first_activity_time, last_activity, last_activity_time, contracts, operations, metadata)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Account, cls).from_api(data)
-        type = data['type']
-        alias = data['alias']
-        address = data['address']
-        public_key = data['publicKey']
-        revealed = data['revealed']
-        balance = data['balance']
-        counter = data['counter']
-        delegation_level = data.get('delegationLevel')
-        delegation_time = data.get('delegationTime')
-        if delegation_time:
-            delegation_time = cls.to_datetime(delegation_time)
-        num_contracts = data['numContracts']
-        num_activations = data['numActivations']
-        num_delegations = data['numDelegations']
-        num_originations = data['numOriginations']
-        num_transactions = data['numTransactions']
-        num_reveals = data['numReveals']
-        num_migrations = data['numMigrations']
-        first_activity = data['firstActivity']
-        first_activity_time = data['firstActivityTime']
-        if first_activity_time:
-            first_activity_time = cls.to_datetime(first_activity_time)
-        last_activity = data['lastActivity']
-        last_activity_time = data['lastActivityTime']
-        if last_activity_time:
-            last_activity_time = cls.to_datetime(last_activity_time)
-        contracts = data['contracts']
-        operations = data['operations']
-        metadata = data['metadata']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(type, alias, address, public_key, revealed, balance, counter, delegation_level, delegation_time, num_contracts, num_activations, num_delegations, num_originations, num_transactions, num_reveals, num_migrations, first_activity, first_activity_time, last_activity, last_activity_time, contracts, operations, metadata)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -165,6 +230,9 @@ class Account(AccountBase):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), balance, firstActivity, lastActivity, numTransactions, numContracts.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -176,11 +244,15 @@ class Account(AccountBase):
             >>> tzkt.account.Account.get(type='contract')
         """
         path = 'v1/accounts'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['type', 'kind', 'delegate', 'balance', 'staked', 'lastActivity'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
@@ -208,9 +280,9 @@ class Account(AccountBase):
         path = 'v1/accounts/count'
         optional_base_params = ['type', 'kind', 'balance', 'staked']
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
-        response = cls._request(path, params=params)
+        response = cls._request(path, params=params, **kwargs)
         data = response.content
-        return data
+        return int(data)
 
     @classmethod
     def by_address(cls, address, **kwargs):
@@ -291,6 +363,6 @@ if __name__ == '__main__':
     parser.add_argument('addresses', metavar='N', type=str, nargs='+', help='Accounts of addresses to fetch')
 
     args = parser.parse_args()
+    accounts = Account.by_addresses(args.addresses)
     for address in args.addresses:
-        account = Account.by_address(address)
-        print(repr(account))
+        print(repr(accounts[address]))
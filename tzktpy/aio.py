@@ -0,0 +1,392 @@
+"""
+Asynchronous transport built on aiohttp.
+
+Every endpoint of the library is written as a plain synchronous classmethod.  Rather than maintaining a second copy of each endpoint, an AsyncClient runs the synchronous method against a replaying client, so parameter handling (`prepare_modifiers`) and decoding (`from_api`) are shared with the synchronous API.  The method is first run until it sends its first request, which is awaited with aiohttp, and then run again with the response.  Most endpoints send a single request and are complete at that point.  A method that needs more responses (e.g. `Account.by_addresses`) is run a last time in a worker thread, where each further request is sent on the event loop and waited for, so every response is fetched and decoded once.
+
+Replayed responses are matched on the method, domain, path and parameters of the request which produced them, so they are never returned for another request, whatever the order in which the requests are sent (e.g. by several threads of `map_concurrent`).  A call whose first request differs from one run to the next raises ReplayMismatch.
+
+Examples:
+    >>> async def main():
+    ...     async with AsyncClient(limit=100) as client:
+    ...         blocks = await asyncio.gather(*[client.call(Block.by_level, level) for level in range(100000, 100100)])
+    ...         transactions = await Transaction.aget(level=100000)
+"""
+import asyncio
+import threading
+import contextvars
+from collections import deque
+from .client import use_client
+from .exception import TZKTException
+from .response import Response
+from .cache import ResponseCache
+from .singleflight import AsyncSingleFlight
+from .throttle import RetryPolicy
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+__all__ = ('AsyncClient', 'AsyncResponse', 'ReplayMismatch', 'get_default_async_client', 'set_default_async_client')
+
+
+def request_key(method, domain, path, params=None):
+    """
+    Returns the key identifying a request in a replay:  its method, domain, path and sorted parameters.
+
+    Returns:
+        tuple
+    """
+    return (method, ) + ResponseCache.key(domain, path, params)
+
+
+class PendingRequest(BaseException):
+    """
+    Raised inside a replayed call when the method needs a response that has not been fetched yet.  Derives from BaseException so `except Exception` blocks in endpoint code cannot swallow it.
+    """
+
+    def __init__(self, method, domain, path, kwargs):
+        super(PendingRequest, self).__init__(method, domain, path)
+        self.method = method
+        self.domain = domain
+        self.path = path
+        self.kwargs = kwargs
+        self.key = request_key(method, domain, path, kwargs.get('params'))
+
+
+class ReplayMismatch(TZKTException):
+    """
+    Raised when a replayed call sends a different request than the one whose response is replayed, i.e. the requests of the method are not deterministic.
+    """
+    pass
+
+
+class ReplayClient(object):
+    """
+    Synchronous stand-in client that answers requests with already fetched responses, matched on the method, domain, path and parameters of the request which produced them.  Requests that have no fetched response are passed to `fallback`, or suspend the call if there is none.  The client is thread-safe, so a replayed method may fan out requests over worker threads (e.g. with `map_concurrent`).
+
+    Attributes:
+        responses (list):  `(request key, response)` tuples, in the order the requests were sent.
+        fallback (callable):  Called with `(method, domain, path, kwargs)` to fetch responses past the replayed ones, or None.
+    """
+
+    def __init__(self, responses, fallback=None):
+        self.responses = responses
+        self.fallback = fallback
+        self._remaining = dict()
+        for key, response in responses:
+            self._remaining.setdefault(key, deque()).append(response)
+        self._lock = threading.Lock()
+
+    def request(self, method, domain, path, **kwargs):
+        key = request_key(method, domain, path, kwargs.get('params'))
+        with self._lock:
+            queue = self._remaining.get(key)
+            if queue:
+                return queue.popleft()
+            unused = [expected for expected, queue in self._remaining.items() if queue]
+        if self.fallback is not None:
+            return self.fallback(method, domain, path, kwargs)
+        if unused:
+            raise ReplayMismatch('Request %r does not match the replayed request %r' % (key, unused[0]))
+        raise PendingRequest(method, domain, path, kwargs)
+
+
+class AsyncResponse(Response):
+    """
+    The subset of `requests.Response` used by the endpoints, backed by a fully read aiohttp response.
+    """
+    __slots__ = ()
+
+
+class AsyncClient(object):
+    """
+    Attributes:
+        limit (int):  Maximum number of simultaneous connections (and therefore requests in flight) per domain.
+        timeout (float|tuple):  Default timeout (seconds).  Either a single total value or a `(connect, read)` tuple.
+        headers (dict):  Headers sent with every request.
+        cache (ResponseCache):  Cache consulted before sending GET requests, or None.
+        rate_limiter (RateLimiter):  Limits the rate of requests sent to each domain, or None.  A limiter can be shared with synchronous clients.
+        retry (RetryPolicy):  Decides which failed requests are retried and how long to wait between attempts.
+        json_decoder (callable):  Parses the raw body of responses, or None to use the decoder installed with `set_json_decoder`.
+        single_flight (AsyncSingleFlight):  Coalesces identical GET requests sent concurrently by several tasks, or None.
+    """
+    default_timeout = (5, 60)
+
+    def __init__(self, limit=100, timeout=None, headers=None, cache=None, rate_limiter=None, retry=None, json_decoder=None, coalesce=True):
+        if aiohttp is None:
+            raise ImportError('AsyncClient requires aiohttp.  Install it with `pip install aiohttp`')
+        self.limit = limit
+        self.timeout = self.default_timeout if timeout is None else timeout
+        self.headers = dict(headers or {})
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = RetryPolicy() if retry is None else retry
+        self.json_decoder = json_decoder
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self._sessions = dict()
+        self._loop = None
+
+    def __repr__(self):
+        return '<%s %s limit=%r, timeout=%r, domains=%r>' % (self.__class__.__name__, id(self), self.limit, self.timeout, sorted(self._sessions))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @classmethod
+    def client_timeout(cls, timeout):
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=timeout)
+
+    @classmethod
+    def encode_params(cls, params):
+        """
+        Converts query parameters to the string values aiohttp accepts, matching how requests would encode them.
+        """
+        output = []
+        for key, value in (params or {}).items():
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple)) else (value, )
+            for item in values:
+                output.append((key, str(item)))
+        return output
+
+    def session(self, domain):
+        """
+        Returns the aiohttp session bound to the given domain for the running event loop, creating it on first use.
+
+        Parameters:
+            domain (str):  The tzkt.io domain the session connects to.
+
+        Returns:
+            aiohttp.ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # sessions cannot be shared between event loops
+            self._sessions = dict()
+            self._loop = loop
+
+        session = self._sessions.get(domain)
+        if session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit)
+            session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._sessions[domain] = session
+        return session
+
+    async def request(self, method, domain, path, **kwargs):
+        """
+        Sends a request to the given domain, serving GET requests from the cache of the client when possible.  Identical GET requests sent while one is in flight share its response.
+
+        Parameters:
+            method (str):  The HTTP method to use.
+            domain (str):  The tzkt.io domain to send the request to.
+            path (str):  The path of the endpoint, relative to the domain.
+
+        Returns:
+            AsyncResponse
+        """
+        cache = self.cache
+        single_flight = self.single_flight
+        if method != 'GET' or (cache is None and single_flight is None):
+            return await self.send(method, domain, path, **kwargs)
+
+        key = ResponseCache.key(domain, path, kwargs.get('params'))
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+        if single_flight is None:
+            return await self.fetch(key, method, domain, path, **kwargs)
+        return await single_flight.do(key, lambda: self.fetch(key, method, domain, path, **kwargs), share=Response.shared)
+
+    async def fetch(self, key, method, domain, path, **kwargs):
+        """
+        Sends a request and stores the response in the cache of the client.
+
+        Returns:
+            AsyncResponse
+        """
+        response = await self.send(method, domain, path, **kwargs)
+        cache = self.cache
+        if cache is None:
+            return response
+        head = None
+        if response.status_code == 200 and cache.policy.requires_head(path.strip('/')):
+            head = await self.head(domain)
+        cache.store(key, path, response, head)
+        return response
+
+    async def head(self, domain):
+        """
+        Returns the `(level, cycle)` of the last head observed by the cache for the given domain, fetching the head if none was observed recently.
+
+        Returns:
+            tuple
+        """
+        cache = self.cache
+        head = cache.head(domain, max_age=cache.policy.head_refresh)
+        if head is None:
+            await self.request('GET', domain, 'v1/head')
+            head = cache.head(domain)
+        return head
+
+    async def send(self, method, domain, path, **kwargs):
+        """
+        Sends a request to the given domain and reads the whole response body, waiting for the rate limiter and retrying transient failures.  A `429` or `5xx` response that is still failing once the retries are exhausted raises `requests.HTTPError`.
+
+        Parameters:
+            method (str):  The HTTP method to use.
+            domain (str):  The tzkt.io domain to send the request to.
+            path (str):  The path of the endpoint, relative to the domain.
+
+        Keyword Parameters:
+            params (dict):  Query string parameters.
+            json (object):  JSON body of the request.
+            data (object):  Body of the request.
+            timeout (float|tuple):  Overrides the default timeout of the client.
+
+        Returns:
+            AsyncResponse
+        """
+        timeout = kwargs.pop('timeout', None)
+        if timeout is None:
+            timeout = self.timeout
+        params = self.encode_params(kwargs.pop('params', None))
+        url = '%s/%s' % (domain, path)
+        session = self.session(domain)
+        retry = self.retry
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(domain)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                async with session.request(method, url, params=params, timeout=self.client_timeout(timeout), **kwargs) as response:
+                    content = await response.read()
+                    response = AsyncResponse(response.status, response.headers, str(response.url), content, response.charset, self.json_decoder)
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                if not retry.is_retryable(method, attempt):
+                    raise
+                response = None
+            else:
+                if not retry.is_retryable(method, attempt, response):
+                    if response.status_code in retry.statuses:
+                        response.raise_for_status()
+                    return response
+            await asyncio.sleep(self.backoff(domain, attempt, response))
+
+    def backoff(self, domain, attempt, response=None):
+        """
+        Returns the number of seconds to wait before attempting a failed request again.  When the server throttled the request, every request to the domain sharing the rate limiter is held back for that long.
+
+        Returns:
+            float
+        """
+        delay = self.retry.delay(attempt, response)
+        if self.rate_limiter is not None and response is not None and response.status_code == 429:
+            self.rate_limiter.pause(domain, delay)
+        return delay
+
+    async def call(self, method, *args, **kwargs):
+        """
+        Runs a synchronous endpoint (e.g. `Transaction.get`) without blocking the event loop.
+
+        Parameters:
+            method (callable):  The endpoint to call.
+            *args:  Positional arguments of the endpoint.
+
+        Keyword Parameters:
+            **kwargs:  Keyword arguments of the endpoint.
+
+        Returns:
+            object:  The value the endpoint returns
+
+        Examples:
+            >>> transactions = await client.call(Transaction.get, level=100000)
+        """
+        responses = []
+        while True:
+            try:
+                return self.replay(ReplayClient(responses), method, args, kwargs)
+            except PendingRequest as pending:
+                if responses:
+                    break
+                response = await self.request(pending.method, pending.domain, pending.path, **pending.kwargs)
+                responses.append((pending.key, response))
+
+        # the method sends several requests:  it is run a last time in a worker thread, fetching each further response on the event loop
+        loop = asyncio.get_running_loop()
+
+        def fetch(request_method, domain, path, request_kwargs):
+            return asyncio.run_coroutine_threadsafe(self.request(request_method, domain, path, **request_kwargs), loop).result()
+        replay = ReplayClient(responses, fallback=fetch)
+        return await loop.run_in_executor(None, contextvars.copy_context().run, self.replay, replay, method, args, kwargs)
+
+    @classmethod
+    def replay(cls, client, method, args, kwargs):
+        with use_client(client):
+            # endpoints pop their keyword arguments, so each run gets a fresh copy
+            return method(*args, **dict(kwargs))
+
+    async def close(self):
+        """
+        Closes every session (and the pooled connections) held by the client.
+        """
+        sessions = list(self._sessions.values())
+        self._sessions = dict()
+        for session in sessions:
+            await session.close()
+
+    def install(self):
+        """
+        Installs the client as the transport of the `a`-prefixed twins of every endpoint (e.g. `Transaction.aget`).
+
+        Returns:
+            AsyncClient:  The installed client
+        """
+        set_default_async_client(self)
+        return self
+
+
+_default_async_client = None
+_default_async_client_lock = threading.Lock()
+
+
+def get_default_async_client():
+    """
+    Returns the client used by the `a`-prefixed endpoint twins, creating one on first use.
+
+    Returns:
+        AsyncClient
+    """
+    global _default_async_client
+    if _default_async_client is None:
+        with _default_async_client_lock:
+            if _default_async_client is None:
+                _default_async_client = AsyncClient()
+    return _default_async_client
+
+
+def set_default_async_client(client):
+    """
+    Replaces the client used by the `a`-prefixed endpoint twins.
+
+    Parameters:
+        client (AsyncClient):  The new default client.
+
+    Returns:
+        AsyncClient:  The previous default client, or None
+    """
+    global _default_async_client
+    with _default_async_client_lock:
+        previous = _default_async_client
+        _default_async_client = client
+    return previous
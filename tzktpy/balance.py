@@ -1,9 +1,24 @@
-from .base import Base
-__all__ = ('BalanceShort', 'Balance')
+import sys
+import json
+import bisect
+import calendar
+from array import array
+from datetime import date, datetime, timedelta
+from .base import Base, parse_epoch
+__all__ = ('BalanceShort', 'Balance', 'BalanceSeries')
 
 
-class BalanceShort(object):
+class BalanceShort(Base):
     __slots__ = ('btc', 'usd', 'eth', 'eur', 'cny', 'jpy', 'krw')
+    api_fields = (
+        ('btc', 'btc'),
+        ('usd', 'usd'),
+        ('eth', 'eth'),
+        ('eur', 'eur'),
+        ('cny', 'cny'),
+        ('jpy', 'jpy'),
+        ('krw', 'krw'),
+    )
 
     def __init__(self, btc, usd, eth, eur, cny, jpy, krw):
         self.btc = btc
@@ -14,20 +29,16 @@ class BalanceShort(object):
         self.jpy = jpy
         self.krw = krw
 
-    @classmethod
-    def from_api(cls, data):
-        btc = data.get('btc')
-        usd = data.get('usd')
-        eth = data.get('eth')
-        eur = data.get('eur')
-        cny = data.get('cny')
-        jpy = data.get('jpy')
-        krw = data.get('krw')
-        return cls(btc, usd, eth, eur, cny, jpy, krw)
-
 
 class Balance(Base):
     __slots__ = ('balance', 'level', 'quote', 'timestamp')
+    api_fields = (
+        ('balance', 'balance'),
+        ('level', 'level'),
+        ('quote', 'quote', BalanceShort.from_api),
+        ('timestamp', 'timestamp', 'to_datetime'),
+    )
+    pagination_cursor = 'level'
 
     def __init__(self, balance, level, quote, timestamp):
         self.balance = balance
@@ -35,18 +46,6 @@ class Balance(Base):
         self.quote = quote
         self.timestamp = timestamp
 
-    @classmethod
-    def from_api(cls, data):
-        balance = data['balance']
-        level = data['level']
-        quote = data.get('quote')
-        if quote:
-            quote = BalanceShort.from_api(quote)
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(balance, level, quote, timestamp)
-
     @classmethod
     def history(cls, address, **kwargs):
         """
@@ -60,6 +59,9 @@ class Balance(Base):
             sort (str):  Sorts historical balances by specified field. Supported fields: level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -71,14 +73,18 @@ class Balance(Base):
             >>> balance_history = Balance.history(address, steps=steps)
         """
         path = 'v1/accounts/%s/balance_history' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         quote = kwargs.pop('quote', '')
         optional_base_params = ['step'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
         if quote:
             params['quote'] = ','.join(quote)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -174,10 +180,244 @@ class Balance(Base):
         return output
 
 
+def to_epoch(value):
+    """
+    Converts a timestamp (datetime, date, ISO-8601 string or number of seconds since the Unix epoch) to a number of seconds since the Unix epoch.  Naive datetimes are UTC.
+    """
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    if isinstance(value, date):
+        return calendar.timegm(value.timetuple())
+    if isinstance(value, str):
+        return parse_epoch(value)
+    return int(value)
+
+
+class BalanceSeries(object):
+    """
+    The balance history of an account, paged once into parallel arrays so balances at any level or time are read locally by binary search.
+
+    The history only holds the levels at which the balance changed:  the balance at a level is the one of the last change at or before it, and 0 before the first change.
+
+    Attributes:
+        address (str):  The address of the account.
+        levels (array):  Levels of the balance changes, in order.
+        timestamps (array):  Timestamps of the balance changes (seconds since the Unix epoch).
+        balances (array):  Balances (microtez) after each change.
+    """
+    typecode = 'q'
+    fields = ('level', 'timestamp', 'balance')
+
+    def __init__(self, address, domain=None):
+        """
+        Parameters:
+            address (str):  The address of the account.
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+        """
+        self.address = address
+        self.levels = array(self.typecode)
+        self.timestamps = array(self.typecode)
+        self.balances = array(self.typecode)
+        self.domain = domain
+
+    def __repr__(self):
+        return '<%s %s address=%r, changes=%r, level=%r>' % (self.__class__.__name__, id(self), self.address, len(self.levels), self.level)
+
+    def __len__(self):
+        return len(self.levels)
+
+    @property
+    def level(self):
+        return self.levels[-1] if self.levels else None
+
+    def fetch(self, **kwargs):
+        """
+        Pages the whole balance history of the account.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of changes per page.  Defaults to 10000.
+
+        Returns:
+            BalanceSeries:  The series
+
+        Examples:
+            >>> series = BalanceSeries('tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE').fetch()
+        """
+        self.levels = array(self.typecode)
+        self.timestamps = array(self.typecode)
+        self.balances = array(self.typecode)
+        self.refresh(**kwargs)
+        return self
+
+    def refresh(self, **kwargs):
+        """
+        Appends the balance changes made after the last known level.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of changes per page.  Defaults to 10000.
+
+        Returns:
+            int:  Number of changes appended
+        """
+        limit = kwargs.pop('limit', 10000)
+        if self.domain:
+            kwargs['domain'] = self.domain
+        if self.levels:
+            kwargs['offset__cr'] = self.levels[-1]
+        count = 0
+        for level, timestamp, balance in Balance.iter(self.address, method='history', fields=list(self.fields), tuples=True, limit=limit, **kwargs):
+            self.levels.append(level)
+            self.timestamps.append(to_epoch(timestamp))
+            self.balances.append(balance)
+            count += 1
+        return count
+
+    def index_at_level(self, level):
+        return bisect.bisect_right(self.levels, level) - 1
+
+    def index_at_time(self, timestamp):
+        return bisect.bisect_right(self.timestamps, to_epoch(timestamp)) - 1
+
+    def balance_at(self, index):
+        return self.balances[index] if index >= 0 else 0
+
+    def by_level(self, level):
+        """
+        Returns the balance of the account at a level.
+
+        Returns:
+            int:  Balance (microtez)
+        """
+        return self.balance_at(self.index_at_level(level))
+
+    def by_date(self, timestamp):
+        """
+        Returns the balance of the account at a date (midnight UTC), datetime or epoch timestamp.
+
+        Returns:
+            int:  Balance (microtez)
+        """
+        return self.balance_at(self.index_at_time(timestamp))
+
+    def by_levels(self, levels):
+        """
+        Returns the balance of the account at each level, in order.
+
+        Returns:
+            list
+        """
+        return [self.by_level(level) for level in levels]
+
+    def by_dates(self, timestamps):
+        """
+        Returns the balance of the account at each date, datetime or epoch timestamp, in order.
+
+        Returns:
+            list
+        """
+        return [self.by_date(timestamp) for timestamp in timestamps]
+
+    def resample(self, step, start=None, end=None):
+        """
+        Returns the balance every `step` levels, like the `step` parameter of `Balance.history`.
+
+        Parameters:
+            step (int):  Number of levels between two samples.
+            start (int, optional):  First level sampled.  Defaults to the first multiple of `step` after the first change.
+            end (int, optional):  Level at which the sampling stops (included).  Defaults to the last known level.
+
+        Returns:
+            list:  `(level, balance)` of each sample
+        """
+        if not self.levels:
+            return []
+        if start is None:
+            start = (self.levels[0] // step + 1) * step
+        end = self.levels[-1] if end is None else end
+        return [(level, self.by_level(level)) for level in range(start, end + 1, step)]
+
+    def resample_time(self, interval, start=None, end=None):
+        """
+        Returns the balance at regular intervals of time.
+
+        Parameters:
+            interval (int|timedelta):  Time between two samples (seconds).
+            start (date|datetime|int, optional):  First time sampled.  Defaults to the time of the first change.
+            end (date|datetime|int, optional):  Time at which the sampling stops (included).  Defaults to the time of the last change.
+
+        Returns:
+            list:  `(timestamp, balance)` of each sample, timestamps in seconds since the Unix epoch
+        """
+        if not self.levels:
+            return []
+        if isinstance(interval, timedelta):
+            interval = int(interval.total_seconds())
+        start = self.timestamps[0] if start is None else to_epoch(start)
+        end = self.timestamps[-1] if end is None else to_epoch(end)
+        return [(timestamp, self.by_date(timestamp)) for timestamp in range(start, end + 1, interval)]
+
+    def diff(self, start, end):
+        """
+        Returns the change of balance between two levels.
+
+        Returns:
+            int:  Balance at `end` minus the balance at `start` (microtez)
+        """
+        return self.by_level(end) - self.by_level(start)
+
+    def changes(self, start=None, end=None):
+        """
+        Returns the balance changes between two levels (`start` excluded, `end` included).
+
+        Returns:
+            list:  `(level, timestamp, delta)` of each change
+        """
+        first = 0 if start is None else self.index_at_level(start) + 1
+        last = len(self.levels) if end is None else self.index_at_level(end) + 1
+        output = []
+        for index in range(first, last):
+            output.append((self.levels[index], self.timestamps[index], self.balances[index] - self.balance_at(index - 1)))
+        return output
+
+    def save(self, path):
+        """
+        Writes the series to a file:  a JSON header line, followed by the raw arrays.
+        """
+        header = dict(address=self.address, count=len(self.levels), typecode=self.typecode, byteorder=sys.byteorder)
+        with open(path, 'wb') as output_file:
+            output_file.write(json.dumps(header).encode('utf-8') + b'\n')
+            for values in (self.levels, self.timestamps, self.balances):
+                values.tofile(output_file)
+
+    @classmethod
+    def read(cls, path, domain=None):
+        """
+        Reads a series written by `save`.  Call `refresh` to append the changes made since it was saved.
+
+        Returns:
+            BalanceSeries
+
+        Examples:
+            >>> series = BalanceSeries.read('tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE.series')
+            >>> series.refresh()
+        """
+        with open(path, 'rb') as input_file:
+            header = json.loads(input_file.readline().decode('utf-8'))
+            series = cls(header['address'], domain=domain)
+            arrays = []
+            for _ in cls.fields:
+                values = array(header['typecode'])
+                values.fromfile(input_file, header['count'])
+                if header['byteorder'] != sys.byteorder:
+                    values.byteswap()
+                arrays.append(values)
+        series.levels, series.timestamps, series.balances = arrays
+        return series
+
+
 if __name__ == '__main__':
     import argparse
     import csv
-    from datetime import datetime
 
     parser = argparse.ArgumentParser(description='Fetch balance report by Tezos account address')
     parser.add_argument('-a', '--address', type=str, help='Address of account to report on')
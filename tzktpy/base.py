@@ -1,12 +1,126 @@
-import requests
-from datetime import datetime
+import re
+import asyncio
+import inspect
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from collections import defaultdict
+from .client import get_default_client, get_context_client
+from .pagination import Paginator, ParallelPaginator
+from .micheline import Deferred, DeferredField
+
+EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+DATETIME_FORMATS = ('%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%fZ')
+# number of distinct timestamps memoized:  rows of the same page often share the timestamp of their block
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(text):
+    """
+    Parses an ISO-8601 timestamp as returned by the API (`2021-06-01T12:00:00Z` or `2021-06-01T12:00:00.123Z`) into a naive UTC datetime.
+
+    Parameters:
+        text (str):  The timestamp to parse.
+
+    Returns:
+        datetime:  The parsed timestamp, or None if it cannot be parsed
+    """
+    try:
+        value = datetime.fromisoformat(text[:-1] if text.endswith('Z') else text)
+    except (TypeError, ValueError, AttributeError):
+        for format in DATETIME_FORMATS:
+            try:
+                return datetime.strptime(text, format)
+            except (TypeError, ValueError):
+                pass
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_epoch(text):
+    """
+    Parses an ISO-8601 timestamp as returned by the API into a number of seconds since the Unix epoch.
+
+    Returns:
+        int:  The parsed timestamp, or None if it cannot be parsed
+    """
+    value = parse_timestamp(text)
+    if value is None:
+        return None
+    return (value.toordinal() - EPOCH_ORDINAL) * 86400 + value.hour * 3600 + value.minute * 60 + value.second
+
+
+class AsyncMethod(object):
+    """
+    Async twin of a synchronous endpoint.  `await Transaction.aget(...)` runs `Transaction.get(...)` through the default AsyncClient.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        method = getattr(owner, self.name)
+
+        def coroutine(*args, **kwargs):
+            from .aio import get_default_async_client
+            return get_default_async_client().call(method, *args, **kwargs)
+        coroutine.__name__ = 'a%s' % self.name
+        coroutine.__doc__ = 'Async twin of `%s.%s`' % (owner.__name__, self.name)
+        return coroutine
+
+
+class LazyField(object):
+    """
+    Attribute of a lazy row.  On first access the value is read from the API data of the row, converted and stored in the instance dictionary, which takes precedence over the field on every later access.
+    """
+    __slots__ = ('key', 'attribute', 'converter')
+
+    def __init__(self, key, attribute, converter=None):
+        self.key = key
+        self.attribute = attribute
+        self.converter = converter
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance._data.get(self.key)
+        if isinstance(value, Deferred):
+            value = value.load()
+        converter = self.converter
+        if value and converter is not None:
+            if isinstance(converter, str):
+                converter = getattr(owner, converter)
+            value = converter(value)
+        instance.__dict__[self.attribute] = value
+        return value
+
+
+class LazyRow(object):
+    """
+    Mixin of the classes generated by `Base.lazy_class`.
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        # rows are unpickled as regular objects, including attributes changed since the row was created
+        values = dict((field[1], getattr(self, field[1])) for field in self.eager_class.api_fields)
+        return (self.eager_class.from_api, (self._data, ), (None, values))
 
 
 class Base(object):
     domain = 'https://api.tzkt.io'
+    client = None
     datetime_format = '%Y-%m-%dT%H:%M:%SZ'
     datetime_ms_format = '%Y-%m-%dT%H:%M:%S.%fZ'
+    # how timestamps of the API are returned:  `datetime` (naive UTC datetime), `epoch` (seconds since the Unix epoch) or `raw` (the ISO-8601 string, unparsed)
+    timestamps = 'datetime'
+    # when True, list endpoints return lazy rows that only convert the attributes which are accessed
+    lazy = False
 
     comparator_notation = '%s__%s'
     comparator_modifier_delimiter = '__'
@@ -15,6 +129,33 @@ class Base(object):
     offset_suffixes = ('el', 'pg', 'cr')
     sort_suffixes = ('asc', 'desc')
     pagination_parameters = ('sort', 'offset', 'limit')
+    page_size = 1000
+    pagination_cursor = None
+    pagination_cursors = dict()
+    pagination_id_parameters = dict()
+    count_methods = dict(get='count')
+    # `(api key, attribute)` or `(api key, attribute, converter)` tuples from which `from_api` is generated
+    api_fields = None
+    # attributes holding heavy Micheline values (parameters, storages, diffs, code), and how list endpoints return them:  `decode` (parsed with the page), `defer` (parsed on first access) or `drop` (not requested, None)
+    micheline_fields = ()
+    micheline_mode = 'decode'
+
+    def __init_subclass__(cls, **kwargs):
+        super(Base, cls).__init_subclass__(**kwargs)
+        # give every public endpoint defined on the subclass an `a`-prefixed async twin
+        for name, value in list(vars(cls).items()):
+            is_endpoint = isinstance(value, classmethod) and not name.startswith('_') and name not in vars(Base) and not inspect.iscoroutinefunction(value.__func__) and not inspect.isasyncgenfunction(value.__func__)
+            twin_name = 'a%s' % name
+            if is_endpoint and twin_name not in vars(cls):
+                setattr(cls, twin_name, AsyncMethod(name))
+
+        if cls.api_fields is not None and 'from_api' not in vars(cls):
+            cls.from_api = cls.compile_from_api(cls.api_fields)
+
+        slots = vars(cls).get('__slots__', ())
+        for name in cls.micheline_fields:
+            if name in slots:
+                setattr(cls, name, DeferredField(vars(cls)[name]))
 
     @classmethod
     def tez(cls, mutez):
@@ -91,33 +232,260 @@ class Base(object):
 
     @classmethod
     def validate_request_parameters(cls, parameters):
-        valid_parameters = set(['domain', 'method', 'params', 'json', 'data'])
+        valid_parameters = set(['domain', 'method', 'params', 'json', 'data', 'timeout'])
         included_parameters = set(parameters)
         invalid_parameters = included_parameters - valid_parameters
         if invalid_parameters:
             raise ValueError('The following parameters are invalid: %r' % (invalid_parameters, ))
 
+    @classmethod
+    def get_client(cls):
+        """
+        Returns the client used to send requests for this class.  A client bound with `use_client` takes precedence, and classes without a client of their own use the default client.
+
+        Returns:
+            Client
+        """
+        client = get_context_client()
+        if client is None:
+            client = cls.client
+        if client is None:
+            client = get_default_client()
+        return client
+
     @classmethod
     def _request(cls, path, **kwargs):
         cls.validate_request_parameters(kwargs)
         kwargs = cls.setdefaults(kwargs)
         domain = kwargs.pop('domain')
         method = kwargs.pop('method')
-        url = '%s/%s' % (domain, path)
-        response = requests.request(method, url, **kwargs)
+        client = cls.get_client()
+        response = client.request(method, domain, path, **kwargs)
         return response
 
+    @classmethod
+    def paginator(cls, args, kwargs):
+        method = kwargs.pop('method', 'get')
+        concurrency = kwargs.pop('concurrency', 1)
+        if concurrency > 1:
+            return ParallelPaginator(cls, method, args, kwargs, concurrency=concurrency)
+        return Paginator(cls, method, args, kwargs)
+
+    @classmethod
+    def stream(cls, *args, **kwargs):
+        """
+        Pages through a list endpoint, yielding one page (list) at a time.  Pages are addressed with cursor offsets on the sort field of the class when possible, and element offsets otherwise.
+
+        Parameters:
+            *args:  Positional arguments of the endpoint (e.g. the bigmap id of `BigMapKey.by_bigmap`).
+
+        Keyword Parameters:
+            method (str, optional):  Name of the list endpoint to page through.  Defaults to `get`.
+            limit (int, optional):  Number of items per page.  Defaults to the `page_size` of the class.
+            concurrency (int, optional):  Number of pages fetched concurrently.  When greater than 1, pages are planned up front from the matching count endpoint and fetched ahead on a bounded worker pool, but are still yielded in order.  Defaults to 1.
+            **kwargs:  Filters of the endpoint.
+
+        Returns:
+            generator:  Pages of objects
+
+        Examples:
+            >>> for page in Transaction.stream(target='KT1...', limit=10000):
+            ...     process(page)
+            >>> for page in Transaction.stream(level__ge=1500000, limit=10000, concurrency=8):
+            ...     process(page)
+        """
+        return cls.paginator(args, kwargs).pages()
+
+    @classmethod
+    def iter(cls, *args, **kwargs):
+        """
+        Pages through a list endpoint, yielding one object at a time.  Accepts the same arguments as `stream`.
+
+        Returns:
+            generator:  Objects matching the specified criteria
+
+        Examples:
+            >>> for transaction in Transaction.iter(target='KT1...'):
+            ...     print(transaction.amount)
+            >>> for key in BigMapKey.iter(bigmap_id, method='by_bigmap', active=True):
+            ...     print(key.key, key.value)
+        """
+        for page in cls.stream(*args, **kwargs):
+            for item in page:
+                yield item
+
+    @classmethod
+    def map_concurrent(cls, function, items, concurrency=8, return_exceptions=False, **kwargs):
+        """
+        Calls `function(item, **kwargs)` for each item on a bounded worker pool.  Each call runs in a copy of the caller's context, so a client bound with `use_client` is used.
+
+        Parameters:
+            function (callable):  Called with each item, e.g. an endpoint.
+            items (list):  The first argument of each call.
+            concurrency (int, optional):  Maximum number of calls running at the same time.  Defaults to 8.
+            return_exceptions (bool, optional):  Returns the exception raised by a call in place of its result, instead of raising it.  Defaults to False.
+
+        Returns:
+            list:  The result of each call, in the order of the items
+        """
+        items = list(items)
+        if not items:
+            return []
+        output = []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items)))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, function, item, **kwargs) for item in items]
+            for future in futures:
+                try:
+                    output.append(future.result())
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    output.append(error)
+        return output
+
+    @classmethod
+    async def amap_concurrent(cls, function, items, concurrency=8, return_exceptions=False, client=None, **kwargs):
+        """
+        Asynchronous version of `map_concurrent`, running each call through the default AsyncClient unless a `client` is given.
+        """
+        from .aio import get_default_async_client
+        client = client or get_default_async_client()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def call(item):
+            async with semaphore:
+                return await client.call(function, item, **kwargs)
+        return await asyncio.gather(*[call(item) for item in items], return_exceptions=return_exceptions)
+
+    @classmethod
+    def fetch_all(cls, *args, **kwargs):
+        """
+        Fetches every page of a list endpoint concurrently and returns the merged results in order.  Accepts the same arguments as `stream`, with `concurrency` defaulting to 8.
+
+        Returns:
+            list:  Objects matching the specified criteria
+
+        Examples:
+            >>> transactions = Transaction.fetch_all(level__ge=1500000, level__lt=1510000, limit=10000, concurrency=16)
+        """
+        kwargs.setdefault('concurrency', 8)
+        pages = list(cls.stream(*args, **kwargs))
+        if pages and not isinstance(pages[0], list):
+            from .columns import Columns
+            return Columns.concat(pages)
+        output = []
+        for page in pages:
+            output += page
+        return output
+
+    @classmethod
+    def arrow_batches(cls, *args, **kwargs):
+        """
+        Pages through a list endpoint, yielding one Arrow record batch per page.  Each page is decoded straight into columns named after the attributes of the class, without creating any object, and is released once its batch was built, so memory is bounded by the page size.  Accepts the same arguments as `stream`.  Requires pyarrow.
+
+        Keyword Parameters:
+            columns (list, optional):  Names of the attributes to include.  Defaults to every attribute.
+
+        Returns:
+            generator:  `pyarrow.RecordBatch` objects
+
+        Examples:
+            >>> with pyarrow.parquet.ParquetWriter('transactions.parquet', schema) as writer:
+            ...     for batch in Transaction.arrow_batches(target='KT1...', columns=['level', 'sender', 'amount']):
+            ...         writer.write_batch(batch)
+        """
+        names = kwargs.pop('columns', None)
+        if isinstance(names, (list, tuple)):
+            kwargs.setdefault('fields', names)
+        else:
+            names = None
+        kwargs['columns'] = True
+        for page in cls.stream(*args, **kwargs):
+            yield page.to_arrow(names)
+
+    @classmethod
+    def to_arrow(cls, *args, **kwargs):
+        """
+        Fetches every page of a list endpoint into a single Arrow table.  Accepts the same arguments as `arrow_batches`.
+
+        Returns:
+            pyarrow.Table
+
+        Examples:
+            >>> table = Transaction.to_arrow(level__ge=1500000, level__lt=1510000, limit=10000, concurrency=8)
+        """
+        from .columns import arrow_table
+        names = kwargs.get('columns')
+        if not isinstance(names, (list, tuple)):
+            names = [field[1] for field in cls.api_fields or ()]
+        return arrow_table(cls.arrow_batches(*args, **kwargs), names)
+
+    @classmethod
+    def to_dataframe(cls, *args, **kwargs):
+        """
+        Fetches every page of a list endpoint into a pandas DataFrame, built through Arrow when pyarrow is installed.  Accepts the same arguments as `arrow_batches`.  Requires pandas.
+
+        Returns:
+            pandas.DataFrame
+
+        Examples:
+            >>> df = Transaction.to_dataframe(target='KT1...', columns=['timestamp', 'sender', 'amount'])
+        """
+        from . import columns
+        if columns.pyarrow is not None:
+            return cls.to_arrow(*args, **kwargs).to_pandas()
+        names = kwargs.get('columns')
+        if not isinstance(names, (list, tuple)):
+            kwargs['columns'] = True
+        pages = list(cls.stream(*args, **kwargs))
+        if not pages:
+            return columns.pandas.DataFrame(columns=names or [field[1] for field in cls.api_fields or ()])
+        return columns.Columns.concat(pages).to_dataframe(names)
+
+    @classmethod
+    async def astream(cls, *args, **kwargs):
+        """
+        Asynchronous version of `stream`, using the default AsyncClient unless a `client` is given.
+        """
+        from .aio import get_default_async_client
+        client = kwargs.pop('client', None) or get_default_async_client()
+        paginator = cls.paginator(args, kwargs)
+        async for page in paginator.apages(client):
+            yield page
+
+    @classmethod
+    async def aiter(cls, *args, **kwargs):
+        """
+        Asynchronous version of `iter`, using the default AsyncClient unless a `client` is given.
+        """
+        async for page in cls.astream(*args, **kwargs):
+            for item in page:
+                yield item
+
     @classmethod
     def to_datetime(cls, text):
-        formats = [cls.to_datetime, cls.datetime_format]
-        for format in formats:
-            try:
-                value = datetime.strptime(text, cls.datetime_format)
-            except Exception:
-                pass
-            else:
-                return value
-        return None
+        """
+        Converts a timestamp of the API according to the `timestamps` setting of the class.
+
+        Parameters:
+            text (str):  An ISO-8601 timestamp, e.g. `2021-06-01T12:00:00Z`.
+
+        Returns:
+            datetime|int|str:  The converted timestamp, or None if it cannot be parsed
+
+        Examples:
+            >>> Base.to_datetime('2021-06-01T12:00:00Z')
+            datetime.datetime(2021, 6, 1, 12, 0)
+            >>> Base.timestamps = 'epoch'
+            >>> Base.to_datetime('2021-06-01T12:00:00Z')
+            1622548800
+        """
+        timestamps = cls.timestamps
+        if timestamps == 'datetime':
+            return parse_timestamp(text)
+        if timestamps == 'epoch':
+            return parse_epoch(text)
+        return text
 
     @classmethod
     def from_api(cls, data):
@@ -125,9 +493,228 @@ class Base(object):
         output.update(data)
         return output
 
+    @classmethod
+    def from_api_list(cls, items, columns=False, fields=None, tuples=False):
+        """
+        Creates the objects of a list returned by the API.
+
+        Parameters:
+            items (list):  The decoded items returned by the API.
+            columns (bool|list, optional):  Returns a Columns of typed arrays instead of a list of objects.  A list of attribute names only builds those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes the items were projected on with `select_parameters`.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
+
+        Returns:
+            list|Columns
+        """
+        if fields:
+            if tuples and not columns:
+                return cls.tuples_from_api(items, fields)
+            items = cls.selected_items(items, fields)
+        elif isinstance(columns, (list, tuple)):
+            # the items were projected on the columns (see `select_parameters`)
+            items = cls.selected_items(items, columns)
+        if cls.micheline_mode == 'defer' and cls.micheline_fields and not columns:
+            cls.defer_micheline(items)
+        if columns:
+            from .columns import Columns
+            if columns is True and fields:
+                return Columns(cls, items, list(fields), lazy=True)
+            return Columns(cls, items, columns)
+        if cls.lazy and cls.api_fields is not None:
+            lazy_class = cls.lazy_class()
+            new = object.__new__
+            output = []
+            for item in items:
+                row = new(lazy_class)
+                row._data = item
+                output.append(row)
+            return output
+        return [cls.from_api(item) for item in items]
+
+    @classmethod
+    def to_api_key(cls, attribute):
+        return re.sub('_([a-z])', lambda match: match.group(1).upper(), attribute)
+
+    @classmethod
+    def select_keys(cls, fields):
+        """
+        Returns the API keys of the given attribute names.
+
+        Parameters:
+            fields (list):  Attribute names, e.g. `['sender', 'amount', 'has_internals']`.
+
+        Returns:
+            list:  API keys, e.g. `['sender', 'amount', 'hasInternals']`
+        """
+        if cls.api_fields is None:
+            return [cls.to_api_key(name) for name in fields]
+        keys = dict((field[1], field[0]) for field in cls.api_fields)
+        invalid = [name for name in fields if name not in keys]
+        if invalid:
+            raise ValueError('The following fields are invalid: %s' % ', '.join(invalid))
+        return [keys[name] for name in fields]
+
+    @classmethod
+    def select_parameters(cls, fields=None, tuples=False, columns=False):
+        """
+        Returns the query parameters projecting the items of a list endpoint on the given attributes (the `select` parameter of the API), so only these fields are sent by the server.  When only a list of columns is given, the items are projected on the columns.  Micheline fields are requested as JSON strings when the `micheline_mode` of the class is `defer` and objects are returned (tuples and columns always hold decoded values), and are left out of the projection when it is `drop`.
+
+        Parameters:
+            fields (list, optional):  Names of the attributes to select.  Defaults to every attribute.
+            tuples (bool, optional):  Requests the values of each item as an array (`select.values`) instead of an object.  Defaults to False.
+            columns (bool|list, optional):  The columns requested from the endpoint.  Defaults to False.
+
+        Returns:
+            dict
+
+        Examples:
+            >>> Transaction.select_parameters(['sender', 'amount', 'has_internals'])
+            {'select': 'sender,amount,hasInternals'}
+        """
+        params = dict()
+        mode = cls.micheline_mode if cls.micheline_fields else 'decode'
+        if mode == 'defer' and not columns and not (tuples and fields):
+            # only objects defer the decoding of Micheline fields:  tuples and columns hold the decoded values
+            params['micheline'] = 1
+        if not fields and isinstance(columns, (list, tuple)):
+            fields = columns
+        if not fields and mode == 'drop':
+            fields = [field[1] for field in cls.api_fields if field[1] not in cls.micheline_fields]
+            tuples = False
+        if fields:
+            name = 'select.values' if tuples and not columns else 'select'
+            params[name] = ','.join(cls.select_keys(fields))
+        return params
+
+    @classmethod
+    def defer_micheline(cls, items):
+        """
+        Wraps the Micheline fields of the given items (requested as JSON strings) so they are only parsed when the attribute is accessed.
+
+        Parameters:
+            items (list):  The decoded items returned by the API.
+        """
+        keys = cls.select_keys(cls.micheline_fields)
+        for item in items:
+            for key in keys:
+                value = item.get(key)
+                # items shared by coalesced requests may already be wrapped
+                if value is not None and not isinstance(value, Deferred):
+                    item[key] = Deferred(value)
+
+    @classmethod
+    def selected_items(cls, items, fields):
+        """
+        Returns the items of a projected list as objects keyed by API key.  The API returns a flat list of values when a single field is selected.
+        """
+        keys = cls.select_keys(fields)
+        if len(keys) != 1:
+            return items
+        key = keys[0]
+        # endpoints which do not support `select` return full objects
+        return [item if isinstance(item, dict) and key in item else {key: item} for item in items]
+
+    @classmethod
+    def tuples_from_api(cls, items, fields):
+        """
+        Creates a tuple with the converted values of `fields` for each item of a projected list.
+
+        Parameters:
+            items (list):  The decoded items returned by the API, as arrays of values (`select.values`), single values, or objects.
+            fields (list):  Names of the selected attributes.
+
+        Returns:
+            list
+        """
+        keys = cls.select_keys(fields)
+        converters = dict((field[1], field[2]) for field in cls.api_fields or () if len(field) > 2)
+        converters = [converters.get(name) for name in fields]
+        converters = [getattr(cls, converter) if isinstance(converter, str) else converter for converter in converters]
+        output = []
+        for item in items:
+            if isinstance(item, dict):
+                values = [item.get(key) for key in keys]
+            elif len(keys) == 1:
+                values = [item]
+            else:
+                values = item
+            output.append(tuple(converter(value) if converter is not None and value else value for converter, value in zip(converters, values)))
+        return output
+
+    @classmethod
+    def lazy_class(cls):
+        """
+        Returns the lazy row class of the class.  Lazy rows are instances of a generated subclass which keeps the API data of the row and resolves each attribute of `api_fields` on first access, so rows of which only a few attributes are read skip the conversion (e.g. timestamp parsing) of every other attribute.
+
+        Returns:
+            type
+
+        Examples:
+            >>> Transaction.lazy = True
+            >>> transactions = Transaction.get(level=1500000)
+            >>> isinstance(transactions[0], Transaction)
+            True
+        """
+        lazy_class = vars(cls).get('_lazy_class')
+        if lazy_class is not None:
+            return lazy_class
+
+        # no __slots__:  resolved attributes are stored in the instance dictionary
+        namespace = dict(__module__=cls.__module__, __qualname__=cls.__qualname__, __doc__=cls.__doc__, eager_class=cls)
+        for field in cls.api_fields:
+            key, attribute = field[:2]
+            converter = field[2] if len(field) > 2 else None
+            namespace[attribute] = LazyField(key, attribute, converter)
+        lazy_class = type(cls.__name__, (LazyRow, cls), namespace)
+        cls._lazy_class = lazy_class
+        return lazy_class
+
+    @classmethod
+    def compile_from_api(cls, fields):
+        """
+        Generates a `from_api` constructor from a declarative field map.  The generated constructor reads each API key once and sets the attributes of a new instance directly, without copying the payload or calling `__init__`.  Missing keys become None, and converters are only applied to truthy values.
+
+        Parameters:
+            fields (tuple):  `(api key, attribute)` or `(api key, attribute, converter)` tuples.  A converter is either a callable or the name of a classmethod of the class (e.g. `'to_datetime'`).
+
+        Returns:
+            classmethod
+        """
+        namespace = dict(new=object.__new__)
+        lines = ['def from_api(cls, data):', '    get = data.get', '    self = new(cls)']
+        for index, field in enumerate(fields):
+            key, attribute = field[:2]
+            converter = field[2] if len(field) > 2 else None
+            if converter is None:
+                lines.append('    self.%s = get(%r)' % (attribute, key))
+                continue
+            if isinstance(converter, str):
+                converter = getattr(cls, converter)
+            name = 'convert_%d' % index
+            namespace[name] = converter
+            lines.append('    value = get(%r)' % key)
+            lines.append('    self.%s = %s(value) if value else value' % (attribute, name))
+        lines.append('    return self')
+        exec('\n'.join(lines), namespace)
+        from_api = namespace['from_api']
+        from_api.__qualname__ = '%s.from_api' % cls.__name__
+        from_api.__doc__ = 'Creates a %s from the data returned by the API' % cls.__name__
+        return classmethod(from_api)
+
 
 class Period(Base):
     __slots__ = ('id', 'index', 'epoch', 'kind', 'first_level', 'last_level', 'start_level', 'end_level')
+    api_fields = (
+        ('id', 'id'),
+        ('index', 'index'),
+        ('epoch', 'epoch'),
+        ('kind', 'kind'),
+        ('firstLevel', 'first_level'),
+        ('lastLevel', 'last_level'),
+        ('startLevel', 'start_level'),
+        ('endLevel', 'end_level'),
+    )
 
     def __init__(self, id, index, epoch, kind, first_level, last_level, start_level, end_level):
         self.id = id
@@ -144,15 +731,3 @@ class Period(Base):
 
     def __repr__(self):
         return '<%s %s id=%r, index=%r, epoch=%r, kind=%r, start_level=%r, end_level=%r>' % (self.__class__.__name__, id(self), self.id, self.index, self.epoch, self.kind, self.start_level, self.end_level)
-
-    @classmethod
-    def from_api(cls, data):
-        id = data['id']
-        index = data['index']
-        epoch = data['epoch']
-        kind = data['kind']
-        first_level = data['firstLevel']
-        last_level = data['lastLevel']
-        start_level = data['startLevel']
-        end_level = data['endLevel']
-        return cls(id, index, epoch, kind, first_level, last_level, start_level, end_level)
@@ -8,6 +8,21 @@ __all__ = ('BigMap', 'BigMapType', 'BigMapKey', 'BigMapUpdate')
 
 class BigMap(Base):
     __slots__ = ('ptr', 'contract', 'path', 'tags', 'active', 'first_level', 'last_level', 'total_keys', 'active_keys', 'updates', 'key_type', 'value_type')
+    api_fields = (
+        ('ptr', 'ptr'),
+        ('contract', 'contract'),
+        ('path', 'path'),
+        ('tags', 'tags'),
+        ('active', 'active'),
+        ('firstLevel', 'first_level'),
+        ('lastLevel', 'last_level'),
+        ('totalKeys', 'total_keys'),
+        ('activeKeys', 'active_keys'),
+        ('updates', 'updates'),
+        ('keyType', 'key_type'),
+        ('valueType', 'value_type'),
+    )
+    pagination_cursor = 'ptr'
 
     def __init__(self, ptr, contract, path, tags, active, first_level, last_level, total_keys, active_keys, updates, key_type, value_type):
         self.ptr = ptr
@@ -29,23 +44,6 @@ class BigMap(Base):
     def __repr__(self):
         return '<%s %s ptr=%r, contract=%r, path=%r, tags=%r, active=%r, first_level=%r, last_level=%r>' % (self.__class__.__name__, id(self), self.ptr, self.contract, self.path, self.tags, self.active, self.first_level, self.last_level)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(BigMap, cls).from_api(data)
-        ptr = data['ptr']
-        contract = data['contract']
-        path = data['path']
-        tags = data['tags']
-        active = data['active']
-        first_level = data['firstLevel']
-        last_level = data['lastLevel']
-        total_keys = data['totalKeys']
-        active_keys = data['activeKeys']
-        updates = data['updates']
-        key_type = data['keyType']
-        value_type = data['valueType']
-        return cls(ptr, contract, path, tags, active, first_level, last_level, total_keys, active_keys, updates, key_type, value_type)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -60,6 +58,9 @@ class BigMap(Base):
             sort (str):  Sorts bigmaps by specified field. Supported fields: id (default), ptr, firstLevel, lastLevel, totalKeys, activeKeys, updates.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -69,6 +70,9 @@ class BigMap(Base):
             >>> bigmaps = BigMap.get(active=True)
         """
         path = 'v1/bigmaps'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
         optional_base_params = ['contract', 'path', 'lastLevel', 'tags'] + list(cls.pagination_parameters)
         params, parsed_params = cls.prepare_modifiers(kwargs, include=optional_base_params)
@@ -82,9 +86,10 @@ class BigMap(Base):
         if micheline is not None:
             params['micheline'] = micheline
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_id(cls, id, **kwargs):
@@ -122,6 +127,9 @@ class BigMap(Base):
             sort (str):  Sorts bigmaps by specified field. Supported fields: id (default), ptr, firstLevel, lastLevel, totalKeys, activeKeys, updates.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -132,6 +140,9 @@ class BigMap(Base):
             >>> bigmaps = BigMap.by_contract(contract_address)
         """
         path = 'v1/contracts/%s/bigmaps' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['tags'] + list(cls.pagination_parameters)
         params, parsed_params = cls.prepare_modifiers(kwargs, include=optional_base_params)
         for param in parsed_params.get('tags', []):
@@ -140,6 +151,7 @@ class BigMap(Base):
         micheline = kwargs.pop('micheline', None)
         if micheline is not None:
             params['micheline'] = micheline
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
 
@@ -147,7 +159,7 @@ class BigMap(Base):
             errors = data.get('errors')
             if errors:
                 raise TZKTException(errors)
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_name(cls, address, name, **kwargs):
@@ -182,20 +194,17 @@ class BigMap(Base):
 
 class BigMapType(Base):
     __slots__ = ('prim', 'args', 'annots')
+    api_fields = (
+        ('prim', 'prim'),
+        ('args', 'args'),
+        ('annots', 'annots'),
+    )
 
     def __init__(self, prim, args, annots):
         self.prim = prim
         self.args = args
         self.annots = annots
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(BigMapType, cls).from_api(data)
-        prim = data['prim']
-        args = data['args']
-        annots = data['annots']
-        return cls(prim, args, annots)
-
     @classmethod
     def get(cls, id, **kwargs):
         """
@@ -222,6 +231,17 @@ class BigMapType(Base):
 
 class BigMapUpdate(Base):
     __slots__ = ('id', 'level', 'timestamp', 'bigmap', 'contract', 'path', 'action', 'content')
+    api_fields = (
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('bigmap', 'bigmap'),
+        ('contract', 'contract'),
+        ('path', 'path'),
+        ('action', 'action'),
+        ('content', 'content'),
+    )
+    pagination_cursor = 'id'
 
     def __init__(self, id, level, timestamp, bigmap, contract, path, action, content):
         self.id = id
@@ -239,21 +259,6 @@ class BigMapUpdate(Base):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%r, contract=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.contract)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(BigMapUpdate, cls).from_api(data)
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        bigmap = data['bigmap']
-        contract = data['contract']
-        path = data['path']
-        action = data['action']
-        content = data['content']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(id, level, timestamp, bigmap, contract, path, action, content)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -271,6 +276,9 @@ class BigMapUpdate(Base):
             sort (str):  Sorts bigmap updates by specified field. Supported fields: id (default).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -281,18 +289,33 @@ class BigMapUpdate(Base):
             >>> bigmap_updates = BigMapUpdate.get(level__gt=100000)
         """
         path = 'v1/bigmaps/updates'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['bigmap', 'path', 'contract', 'action', 'value', 'level']  + list(cls.pagination_parameters)
         params, param_mappings = cls.prepare_modifiers(kwargs, include=optional_base_params)
         for param in param_mappings.get('tags', []):
             params[param] = ','.join(params[param])
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
 
 class BigMapKey(Base):
     __slots__ = ('id', 'active', 'hash', 'key', 'value', 'first_level', 'last_level', 'updates')
+    api_fields = (
+        ('id', 'id'),
+        ('active', 'active'),
+        ('hash', 'hash'),
+        ('key', 'key'),
+        ('value', 'value'),
+        ('firstLevel', 'first_level'),
+        ('lastLevel', 'last_level'),
+        ('updates', 'updates'),
+    )
+    pagination_cursor = 'id'
 
     def __init__(self, id, active, hash, key, value, first_level, last_level, updates):
         self.id = id
@@ -307,18 +330,6 @@ class BigMapKey(Base):
     def __repr__(self):
         return '<%s %s active=%r, key=%r, value=%r>' % (self.__class__.__name__, id(self), self.active, self.key, self.value)
 
-    @classmethod
-    def from_api(cls, data):
-        id = data['id']
-        active = data['active']
-        hash = data['hash']
-        key = data['key']
-        value = data['value']
-        first_level = data.get('firstLevel')
-        last_level = data.get('lastLevel')
-        updates = data.get('updates')
-        return cls(id, active, hash, key, value, first_level, last_level, updates)
-
     @classmethod
     def by_bigmap(cls, id, **kwargs):
         """
@@ -338,6 +349,9 @@ class BigMapKey(Base):
             sort (str):  Sorts bigmaps by specified field. Supported fields: id (default), ptr, firstLevel, lastLevel, totalKeys, activeKeys, updates.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -347,13 +361,17 @@ class BigMapKey(Base):
             >>> bigmap_id = 123
             >>> bigmap_keys = BigMapKey.by_bigmap(level__gt=100000)
         """
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         level = kwargs.pop('level', None)
         if level:
             path = 'v1/bigmaps/%s/historical_keys/%s' % (id, level)
         else:
             path = 'v1/bigmaps/%s/keys' % id
-        optional_base_params = ['key', 'value', 'lastLevel', 'level'] + list(cls.pagination_parameters)
+        optional_base_params = ['active', 'key', 'value', 'lastLevel', 'level'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
 
         is_empty = response.status_code == 204
@@ -361,7 +379,7 @@ class BigMapKey(Base):
             return []
 
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_key(cls, id, key, **kwargs):
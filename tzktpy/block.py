@@ -1,9 +1,43 @@
+import asyncio
+import itertools
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from .base import Base
 __all__ = ('Block', )
 
 
 class Block(Base):
     __slots__ = ('level', 'hash', 'timestamp', 'proto', 'priority', 'validations', 'deposit', 'reward', 'fees', 'nonce_revealed', 'baker', 'software', 'endorsements', 'proposals', 'ballots', 'activations', 'doubleBaking', 'doubleEndorsing', 'nonceRevelations', 'delegations', 'originations', 'transactions', 'reveals', 'quote')
+    api_fields = (
+        ('level', 'level'),
+        ('hash', 'hash'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('proto', 'proto'),
+        ('priority', 'priority'),
+        ('validations', 'validations'),
+        ('deposit', 'deposit'),
+        ('reward', 'reward'),
+        ('fees', 'fees'),
+        ('nonceRevealed', 'nonce_revealed'),
+        ('baker', 'baker'),
+        ('software', 'software'),
+        ('endorsements', 'endorsements'),
+        ('proposals', 'proposals'),
+        ('ballots', 'ballots'),
+        ('activations', 'activations'),
+        ('doubleBaking', 'doubleBaking'),
+        ('doubleEndorsing', 'doubleEndorsing'),
+        ('nonceRevelations', 'nonceRevelations'),
+        ('delegations', 'delegations'),
+        ('originations', 'originations'),
+        ('transactions', 'transactions'),
+        ('reveals', 'reveals'),
+        ('quote', 'quote'),
+    )
+    pagination_cursor = 'level'
+    # the API returns at most 10000 items per request
+    max_chunk_size = 10000
 
     def __init__(self, level, hash, timestamp, proto, priority, validations, deposit, reward, fees, nonce_revealed, baker, software, endorsements, proposals, ballots, activations, doubleBaking, doubleEndorsing, nonceRevelations, delegations, originations, transactions, reveals, quote):
         self.level = level
@@ -37,37 +71,6 @@ class Block(Base):
     def __repr__(self):
         return '<%s %s level=%i, hash=%r, timestamp=%r, deposit=%r, baker=%r, fees=%r, reward=%r>' % (self.__class__.__name__, id(self), self.level, self.hash, self.timestamp, self.deposit, self.baker, self.fees, self.reward)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Block, cls).from_api(data)
-        level = data['level']
-        hash = data['hash']
-        timestamp = data['timestamp']
-        proto = data['proto']
-        priority = data['priority']
-        validations = data['validations']
-        deposit = data['deposit']
-        reward = data['reward']
-        fees = data['fees']
-        nonceRevealed = data['nonceRevealed']
-        baker = data['baker']
-        software = data['software']
-        endorsements = data['endorsements']
-        proposals = data['proposals']
-        ballots = data['ballots']
-        activations = data['activations']
-        doubleBaking = data['doubleBaking']
-        doubleEndorsing = data['doubleEndorsing']
-        nonceRevelations = data['nonceRevelations']
-        delegations = data['delegations']
-        originations = data['originations']
-        transactions = data['transactions']
-        reveals = data['reveals']
-        quote = data['quote']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(level, hash, timestamp, proto, priority, validations, deposit, reward, fees, nonceRevealed, baker, software, endorsements, proposals, ballots, activations, doubleBaking, doubleEndorsing, nonceRevelations, delegations, originations, transactions, reveals, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -81,6 +84,9 @@ class Block(Base):
             sort (str):  Sorts blocks by specified field. Supported fields: id (default), level, priority, validations, reward, fees.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -90,11 +96,118 @@ class Block(Base):
             >>> blocks = Block.get(level__gt=100000)
         """
         path = 'v1/blocks'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['baker', 'level', 'timestamp', 'priority', 'quote'] + list(cls.pagination_parameters)
-        params, _ = cls.prepare_modifiers(kwargs, incude=optional_base_params)
-        response = cls._request(path, params=params)
+        params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
+        response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
+
+    @classmethod
+    def _range_chunks(cls, start, end, chunk_size, checkpoint=None):
+        """
+        Returns the `(first level, end level)` of each chunk of a level range, skipping the levels up to `checkpoint`.  Chunks are fetched with a single request each, so `chunk_size` cannot exceed `max_chunk_size`.
+
+        Returns:
+            list
+        """
+        if not 0 < chunk_size <= cls.max_chunk_size:
+            raise ValueError('chunk_size must be between 1 and %i, not %r' % (cls.max_chunk_size, chunk_size))
+        if checkpoint is not None:
+            start = max(start, checkpoint + 1)
+        return [(level, min(level + chunk_size, end)) for level in range(start, end, chunk_size)]
+
+    @classmethod
+    def _head_level(cls, **kwargs):
+        from .head import Head
+        domain = kwargs.get('domain')
+        head = Head.get(domain=domain) if domain else Head.get()
+        return head.level
+
+    @classmethod
+    def _fetch_range_chunk(cls, chunk, **kwargs):
+        first, end = chunk
+        return cls.get(level__ge=first, level__lt=end, sort__asc='level', limit=end - first, **kwargs)
+
+    @classmethod
+    def range(cls, start, end=None, **kwargs):
+        """
+        Yields the blocks of a level range in level order.  The range is split into chunks of `chunk_size` levels which are fetched in parallel, up to `concurrency` chunks ahead of the block being yielded.  A backfill can be resumed by passing the level of the last block it processed as `checkpoint`.
+
+        Parameters:
+            start (int):  First level of the range.
+            end (int, optional):  Level at which the range stops (excluded).  Defaults to the level following the current head.
+
+        Keyword Parameters:
+            chunk_size (int, optional):  Number of levels fetched by each request (at most 10000, otherwise ValueError is raised).  Defaults to 1000.
+            concurrency (int, optional):  Maximum number of chunks fetched at the same time.  Defaults to 8.
+            checkpoint (int, optional):  Level of the last block already processed.  The range resumes at the following level.
+            quote (list|tuple|set):  list of ticker symbols to inject historical prices into response
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+
+        Returns:
+            generator:  Blocks
+
+        Examples:
+            >>> for block in Block.range(1000000, 2000000, chunk_size=5000, checkpoint=load_checkpoint()):
+            ...     process(block)
+            ...     save_checkpoint(block.level)
+        """
+        chunk_size = kwargs.pop('chunk_size', 1000)
+        concurrency = max(1, kwargs.pop('concurrency', 8))
+        checkpoint = kwargs.pop('checkpoint', None)
+        if end is None:
+            end = cls._head_level(**kwargs) + 1
+        chunks = iter(cls._range_chunks(start, end, chunk_size, checkpoint))
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque()
+
+        def submit(chunk):
+            # workers run in a copy of the caller's context, so a client bound with `use_client` is used
+            pending.append(executor.submit(contextvars.copy_context().run, cls._fetch_range_chunk, chunk, **kwargs))
+        try:
+            for chunk in itertools.islice(chunks, concurrency):
+                submit(chunk)
+            while pending:
+                blocks = pending.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    submit(chunk)
+                for block in blocks:
+                    yield block
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    async def arange(cls, start, end=None, **kwargs):
+        """
+        Asynchronous version of `range`, using the default AsyncClient unless a `client` is given.
+        """
+        from .aio import get_default_async_client
+        client = kwargs.pop('client', None) or get_default_async_client()
+        chunk_size = kwargs.pop('chunk_size', 1000)
+        concurrency = max(1, kwargs.pop('concurrency', 8))
+        checkpoint = kwargs.pop('checkpoint', None)
+        if end is None:
+            end = await client.call(cls._head_level, **kwargs) + 1
+        chunks = iter(cls._range_chunks(start, end, chunk_size, checkpoint))
+
+        pending = deque()
+        try:
+            for chunk in itertools.islice(chunks, concurrency):
+                pending.append(asyncio.ensure_future(client.call(cls._fetch_range_chunk, chunk, **kwargs)))
+            while pending:
+                blocks = await pending.popleft()
+                for chunk in itertools.islice(chunks, 1):
+                    pending.append(asyncio.ensure_future(client.call(cls._fetch_range_chunk, chunk, **kwargs)))
+                for block in blocks:
+                    yield block
+        finally:
+            for future in pending:
+                future.cancel()
 
     @classmethod
     def by_hash(cls, hash, **kwargs):
@@ -160,7 +273,7 @@ class Block(Base):
             >>> block_count = Block.count()
         """
         path = 'v1/blocks/count'
-        response = cls._request(path)
+        response = cls._request(path, **kwargs)
         value = response.content
         return int(value)
 
@@ -0,0 +1,404 @@
+"""
+Response caching for the HTTP transport.
+
+Most tzKT data never changes once it is a few levels below the head of the chain:  blocks, operations, finished cycles and historical bigmap keys.  A CachePolicy decides how long a response may be reused:
+
+*  responses about levels (or cycles) that are final are cached indefinitely.
+*  responses about data that changes with every block (`Head.get`, `Quote.last`, `Delegate.by_address`, ...) are cached for a short time.
+*  everything else is not cached.
+
+Finality is judged against the last head observed for the domain, which is a safe lower bound since the head only moves forward.
+
+Responses that are cached indefinitely can also be kept in a SQLiteStore, which survives restarts and can be shared by every process on a host.
+
+Examples:
+    >>> client = Client(cache=ResponseCache(maxsize=10000)).install()
+    >>> block = Block.by_level(1500000)  # fetched
+    >>> block = Block.by_level(1500000)  # served from memory
+
+    >>> store = SQLiteStore('/var/cache/tzktpy.sqlite', max_bytes=2 * 1024 ** 3)
+    >>> client = Client(cache=ResponseCache(maxsize=10000, persistent=store)).install()
+"""
+import re
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from .response import Response
+__all__ = ('FOREVER', 'CachePolicy', 'ResponseCache', 'SQLiteStore')
+
+FOREVER = float('inf')
+
+
+class CachePolicy(object):
+    """
+    Attributes:
+        finality_depth (int):  Number of levels below the head after which a level is considered final.
+        head_refresh (float):  Number of seconds after which the head used to judge finality is fetched again.
+        ttls (list):  `(pattern, seconds)` pairs giving the time to live of responses for mutable resources.  The first matching pattern wins.
+    """
+    finality_depth = 2
+    head_refresh = 60
+    default_ttls = (
+        (r'v1/head', 2),
+        (r'v1/quotes/last', 10),
+        (r'v1/statistics/current', 10),
+        (r'v1/delegates/[^/]+', 30),
+        (r'v1/accounts/[^/]+', 30),
+        (r'v1/accounts/[^/]+/metadata', 300),
+        (r'v1/contracts/[^/]+', 30),
+        (r'v1/protocols/current', 60),
+        (r'v1/voting/(periods|epochs)/current', 60),
+    )
+
+    # resources addressed by level:  final once the level is final
+    level_patterns = (
+        r'v1/blocks/(?P<level>\d+)',
+        r'v1/bigmaps/\d+/historical_keys/(?P<level>\d+)(/.+)?',
+        r'v1/accounts/[^/]+/balance_history/(?P<level>\d+)',
+    )
+    # resources addressed by a block or operation hash (51 base58 characters), whose payload carries the level they belong to
+    payload_patterns = (
+        r'v1/blocks/B[1-9A-HJ-NP-Za-km-z]{50}',
+        r'v1/operations/o[1-9A-HJ-NP-Za-km-z]{50}(/\d+){0,2}',
+        r'v1/operations/\w+/o[1-9A-HJ-NP-Za-km-z]{50}',
+    )
+    # resources addressed by cycle:  final once the cycle is over
+    cycle_patterns = (
+        r'v1/cycles/(?P<cycle>\d+)',
+        r'v1/protocols/cycles/(?P<cycle>\d+)',
+    )
+
+    def __init__(self, finality_depth=None, ttls=None):
+        if finality_depth is not None:
+            self.finality_depth = finality_depth
+        ttls = self.default_ttls if ttls is None else ttls
+        self.ttls = [(re.compile(pattern), seconds) for pattern, seconds in ttls]
+        self.level_rules = [re.compile(pattern) for pattern in self.level_patterns]
+        self.payload_rules = [re.compile(pattern) for pattern in self.payload_patterns]
+        self.cycle_rules = [re.compile(pattern) for pattern in self.cycle_patterns]
+
+    @classmethod
+    def match(cls, rules, path):
+        for rule in rules:
+            match = rule.fullmatch(path)
+            if match:
+                return match
+        return None
+
+    def requires_head(self, path):
+        """
+        Indicates if the time to live of a response for the given path depends on the head of the chain.
+
+        Parameters:
+            path (str):  The path of the endpoint.
+
+        Returns:
+            bool
+        """
+        return any(self.match(rules, path) for rules in (self.level_rules, self.payload_rules, self.cycle_rules))
+
+    @classmethod
+    def payload_level(cls, data):
+        if isinstance(data, dict):
+            return data.get('level')
+        if isinstance(data, list) and data:
+            levels = [item.get('level') for item in data if isinstance(item, dict)]
+            if None not in levels:
+                return max(levels)
+        return None
+
+    def is_final(self, level, head):
+        return level is not None and head is not None and level <= head[0] - self.finality_depth
+
+    def ttl(self, path, response, head=None):
+        """
+        Returns how long (in seconds) a response may be reused.
+
+        Parameters:
+            path (str):  The path of the endpoint.
+            response (requests.Response):  The response to cache.
+            head (tuple, optional):  `(level, cycle)` of the last known head.
+
+        Returns:
+            float:  `FOREVER` for final data, a number of seconds, or None if the response must not be cached
+        """
+        if response.status_code != 200:
+            return None
+
+        match = self.match(self.level_rules, path)
+        if match:
+            level = int(match.group('level'))
+            return FOREVER if self.is_final(level, head) else None
+
+        if self.match(self.payload_rules, path):
+            level = self.payload_level(response.json())
+            return FOREVER if self.is_final(level, head) else None
+
+        match = self.match(self.cycle_rules, path)
+        if match:
+            cycle = int(match.group('cycle'))
+            return FOREVER if head is not None and cycle < head[1] else None
+
+        for rule, seconds in self.ttls:
+            if rule.fullmatch(path):
+                return seconds
+        return None
+
+
+class ResponseCache(object):
+    """
+    Thread-safe, size-bounded LRU cache of responses keyed on (domain, path, normalized parameters).
+
+    Attributes:
+        maxsize (int):  Maximum number of responses kept in memory.
+        policy (CachePolicy):  Decides how long each response may be reused.
+        persistent (SQLiteStore):  Store that keeps responses cached indefinitely across restarts, or None.
+    """
+
+    def __init__(self, maxsize=1024, policy=None, persistent=None):
+        self.maxsize = maxsize
+        self.policy = policy or CachePolicy()
+        self.persistent = persistent
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._heads = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s size=%r, maxsize=%r, hits=%r, misses=%r>' % (self.__class__.__name__, id(self), len(self), self.maxsize, self.hits, self.misses)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @classmethod
+    def key(cls, domain, path, params=None):
+        """
+        Returns the cache key of a request.  Parameters are normalized so their order and value types do not matter.
+
+        Returns:
+            tuple
+        """
+        items = []
+        for name, value in (params or {}).items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = ','.join(str(item) for item in value)
+            items.append((name, str(value)))
+        return (domain.rstrip('/'), path.strip('/'), tuple(sorted(items)))
+
+    def get(self, key):
+        """
+        Returns the cached response for the given key, or None if it is missing or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                response, expires = entry
+                if expires >= now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+
+        response = None
+        if self.persistent is not None:
+            response = self.persistent.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.set(key, response, FOREVER, persist=False)
+        return response
+
+    def set(self, key, response, ttl, persist=True):
+        """
+        Stores a response for `ttl` seconds, evicting the least recently used responses beyond `maxsize`.  Responses cached indefinitely are also written to the persistent store.
+        """
+        expires = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (response, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        if persist and ttl == FOREVER and self.persistent is not None:
+            self.persistent.set(key, response)
+
+    def head(self, domain, max_age=None):
+        """
+        Returns the `(level, cycle)` of the last head observed for the given domain, or None if no head (observed within `max_age` seconds) is known.
+        """
+        observed = self._heads.get(domain.rstrip('/'))
+        if observed is None:
+            return None
+        level, cycle, observed_at = observed
+        if max_age is not None and time.monotonic() - observed_at > max_age:
+            return None
+        return level, cycle
+
+    def observe_head(self, domain, level, cycle):
+        domain = domain.rstrip('/')
+        with self._lock:
+            current = self._heads.get(domain)
+            if current is None or level >= current[0]:
+                self._heads[domain] = (level, cycle, time.monotonic())
+
+    def store(self, key, path, response, head=None):
+        """
+        Caches a response according to the policy of the cache.
+
+        Parameters:
+            key (tuple):  The cache key of the request.
+            path (str):  The path of the endpoint.
+            response (requests.Response):  The response to cache.
+            head (tuple, optional):  `(level, cycle)` of the last known head.
+
+        Returns:
+            float:  The time to live of the response, or None if it was not cached
+        """
+        path = path.strip('/')
+        if path == 'v1/head' and response.status_code == 200:
+            data = response.json()
+            self.observe_head(key[0], data['level'], data['cycle'])
+
+        ttl = self.policy.ttl(path, response, head)
+        if ttl is not None:
+            self.set(key, response, ttl)
+        return ttl
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteStore(object):
+    """
+    Persistent store of immutable responses backed by a SQLite database.  The database runs in WAL mode so it can be shared by several processes on the same host, and is kept under `max_bytes` by evicting the least recently used responses.
+
+    Attributes:
+        path (str):  Path of the database file.
+        max_bytes (int):  Maximum total size of the stored response bodies.
+        timeout (float):  Number of seconds to wait for a lock held by another process.
+    """
+    # reads only refresh the access time of a response when it is older than this many seconds
+    touch_interval = 3600
+
+    def __init__(self, path, max_bytes=1024 ** 3, timeout=30):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        self._size = None
+        self._lock = threading.Lock()
+        connection = self.connection()
+        with connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, url TEXT, content BLOB, size INTEGER, accessed REAL)')
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    def __repr__(self):
+        return '<%s %s path=%r, max_bytes=%r>' % (self.__class__.__name__, id(self), self.path, self.max_bytes)
+
+    def connection(self):
+        """
+        Returns the connection of the current thread, opening it on first use.
+
+        Returns:
+            sqlite3.Connection
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    @classmethod
+    def serialize_key(cls, key):
+        domain, path, params = key
+        return json.dumps([domain, path, [list(item) for item in params]], separators=(',', ':'))
+
+    def get(self, key):
+        """
+        Returns the stored response for the given cache key, or None.
+
+        Returns:
+            Response
+        """
+        serialized_key = self.serialize_key(key)
+        connection = self.connection()
+        row = connection.execute('SELECT url, content, accessed FROM responses WHERE key = ?', (serialized_key, )).fetchone()
+        if row is None:
+            return None
+        url, content, accessed = row
+        now = time.time()
+        if now - accessed > self.touch_interval:
+            with connection:
+                connection.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, serialized_key))
+        return Response(200, {'Content-Type': 'application/json'}, url, bytes(content), 'utf-8')
+
+    def set(self, key, response):
+        """
+        Stores the body of a response under the given cache key, evicting the least recently used responses if the store grows beyond `max_bytes`.
+        """
+        content = response.content
+        size = len(content)
+        connection = self.connection()
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO responses (key, url, content, size, accessed) VALUES (?, ?, ?, ?, ?)', (self.serialize_key(key), str(response.url), content, size, time.time()))
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._size = self.evict()
+
+    def size(self):
+        """
+        Returns the total size of the stored response bodies.
+
+        Returns:
+            int
+        """
+        row = self.connection().execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return row[0]
+
+    def evict(self):
+        """
+        Deletes the least recently used responses until the store is back under 90% of `max_bytes`.
+
+        Returns:
+            int:  The remaining size of the store
+        """
+        connection = self.connection()
+        target = int(self.max_bytes * 0.9)
+        with connection:
+            # the size is recomputed since other processes may share the store
+            size = self.size()
+            rows = connection.execute('SELECT key, size FROM responses ORDER BY accessed')
+            keys = []
+            for key, row_size in rows:
+                if size <= target:
+                    break
+                keys.append((key, ))
+                size -= row_size
+            connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+        return size
+
+    def clear(self):
+        connection = self.connection()
+        with connection:
+            connection.execute('DELETE FROM responses')
+        self._size = 0
+
+    def close(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
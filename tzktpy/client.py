@@ -0,0 +1,291 @@
+"""
+HTTP transport used by every model class.
+
+A Client keeps one pooled, keep-alive `requests.Session` per tzKT domain so consecutive calls reuse open TCP/TLS connections instead of performing a new handshake for every request.  Requests can be throttled with a RateLimiter, and transient failures are retried according to a RetryPolicy (see `tzktpy.throttle`).
+"""
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+import requests
+from requests.adapters import HTTPAdapter
+from .throttle import RetryPolicy
+from .response import Response
+from .cache import ResponseCache
+from .singleflight import SingleFlight
+__all__ = ('Client', 'get_default_client', 'set_default_client', 'get_context_client', 'use_client')
+
+
+class Client(object):
+    """
+    Attributes:
+        pool_connections (int):  The number of connection pools to cache per session.
+        pool_maxsize (int):  The maximum number of connections kept alive in each pool.
+        timeout (float|tuple):  Default timeout (seconds) used when a request does not specify one.  Either a single value or a `(connect, read)` tuple.
+        headers (dict):  Headers sent with every request.
+        cache (ResponseCache):  Cache consulted before sending GET requests, or None.
+        rate_limiter (RateLimiter):  Limits the rate of requests sent to each domain, or None.  A limiter can be shared by several clients.
+        retry (RetryPolicy):  Decides which failed requests are retried and how long to wait between attempts.  Use `RetryPolicy(retries=0)` to disable retries.
+        json_decoder (callable):  Parses the raw body of responses, or None to use the decoder installed with `set_json_decoder`.
+        single_flight (SingleFlight):  Coalesces identical GET requests sent concurrently by several threads, or None.
+    """
+    default_timeout = (5, 60)
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, timeout=None, headers=None, cache=None, rate_limiter=None, retry=None, json_decoder=None, coalesce=True):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = self.default_timeout if timeout is None else timeout
+        self.headers = dict(headers or {})
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = RetryPolicy() if retry is None else retry
+        self.json_decoder = json_decoder
+        self.single_flight = SingleFlight() if coalesce else None
+        self._sessions = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s pool_maxsize=%r, timeout=%r, domains=%r>' % (self.__class__.__name__, id(self), self.pool_maxsize, self.timeout, sorted(self._sessions))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def session(self, domain):
+        """
+        Returns the session bound to the given domain, creating it on first use.
+
+        Parameters:
+            domain (str):  The tzkt.io domain the session connects to.
+
+        Returns:
+            requests.Session
+        """
+        session = self._sessions.get(domain)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(domain)
+            if session is None:
+                session = self.create_session(domain)
+                self._sessions[domain] = session
+        return session
+
+    def create_session(self, domain):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount(domain, adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        session.headers.update(self.headers)
+        return session
+
+    def request(self, method, domain, path, **kwargs):
+        """
+        Sends a request to the given domain, serving GET requests from the cache of the client when possible.  Identical GET requests sent while one is in flight share its response.
+
+        Parameters:
+            method (str):  The HTTP method to use.
+            domain (str):  The tzkt.io domain to send the request to.
+            path (str):  The path of the endpoint, relative to the domain.
+
+        Keyword Parameters:
+            params (dict):  Query string parameters.
+            timeout (float|tuple):  Overrides the default timeout of the client.
+
+        Returns:
+            Response
+        """
+        cache = self.cache
+        single_flight = self.single_flight
+        if method != 'GET' or (cache is None and single_flight is None):
+            return self.send(method, domain, path, **kwargs)
+
+        key = ResponseCache.key(domain, path, kwargs.get('params'))
+        if cache is not None:
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+        if single_flight is None:
+            return self.fetch(key, method, domain, path, **kwargs)
+        return single_flight.do(key, lambda: self.fetch(key, method, domain, path, **kwargs), share=Response.shared)
+
+    def fetch(self, key, method, domain, path, **kwargs):
+        """
+        Sends a request and stores the response in the cache of the client.
+
+        Returns:
+            Response
+        """
+        response = self.send(method, domain, path, **kwargs)
+        cache = self.cache
+        if cache is None:
+            return response
+        head = None
+        if response.status_code == 200 and cache.policy.requires_head(path.strip('/')):
+            head = self.head(domain)
+        cache.store(key, path, response, head)
+        return response
+
+    def head(self, domain):
+        """
+        Returns the `(level, cycle)` of the last head observed by the cache for the given domain, fetching the head if none was observed recently.
+
+        Returns:
+            tuple
+        """
+        cache = self.cache
+        head = cache.head(domain, max_age=cache.policy.head_refresh)
+        if head is None:
+            self.request('GET', domain, 'v1/head')
+            head = cache.head(domain)
+        return head
+
+    def send(self, method, domain, path, **kwargs):
+        """
+        Sends a request to the given domain using that domain's pooled session, waiting for the rate limiter and retrying transient failures.  A `429` or `5xx` response that is still failing once the retries are exhausted raises `requests.HTTPError`.
+
+        Parameters:
+            method (str):  The HTTP method to use.
+            domain (str):  The tzkt.io domain to send the request to.
+            path (str):  The path of the endpoint, relative to the domain.
+
+        Keyword Parameters:
+            params (dict):  Query string parameters.
+            timeout (float|tuple):  Overrides the default timeout of the client.
+
+        Returns:
+            Response
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        url = '%s/%s' % (domain, path)
+        session = self.session(domain)
+        retry = self.retry
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(domain)
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not retry.is_retryable(method, attempt):
+                    raise
+                response = None
+            else:
+                if not retry.is_retryable(method, attempt, response):
+                    if response.status_code in retry.statuses:
+                        response.raise_for_status()
+                    return Response(response.status_code, response.headers, response.url, response.content, response.encoding, self.json_decoder)
+            time.sleep(self.backoff(domain, attempt, response))
+
+    def backoff(self, domain, attempt, response=None):
+        """
+        Returns the number of seconds to wait before attempting a failed request again.  When the server throttled the request, every request to the domain sharing the rate limiter is held back for that long.
+
+        Returns:
+            float
+        """
+        delay = self.retry.delay(attempt, response)
+        if self.rate_limiter is not None and response is not None and response.status_code == 429:
+            self.rate_limiter.pause(domain, delay)
+        return delay
+
+    def close(self):
+        """
+        Closes every session (and the pooled connections) held by the client.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def use(self):
+        """
+        Routes requests made within a `with` block (in the current thread or asyncio task) through this client.
+
+        Examples:
+            >>> with Client(timeout=5).use():
+            ...     head = Head.get()
+        """
+        return use_client(self)
+
+    def install(self):
+        """
+        Installs the client as the default transport of every model class.
+
+        Returns:
+            Client:  The installed client
+
+        Examples:
+            >>> client = Client(pool_maxsize=32, timeout=10).install()
+            >>> transactions = Transaction.get(level__gt=100000)
+        """
+        set_default_client(self)
+        return self
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+_context_client = contextvars.ContextVar('tzktpy_client', default=None)
+
+
+def get_default_client():
+    """
+    Returns the client used by model classes that do not have a client of their own, creating one on first use.
+
+    Returns:
+        Client
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+def set_default_client(client):
+    """
+    Replaces the default client used by model classes.
+
+    Parameters:
+        client (Client):  The new default client.
+
+    Returns:
+        Client:  The previous default client, or None
+    """
+    global _default_client
+    with _default_client_lock:
+        previous = _default_client
+        _default_client = client
+    return previous
+
+
+def get_context_client():
+    """
+    Returns the client bound to the current thread or asyncio task by `use_client`, or None.
+
+    Returns:
+        Client
+    """
+    return _context_client.get()
+
+
+@contextmanager
+def use_client(client):
+    """
+    Binds a client to the current thread or asyncio task for the duration of a `with` block.  The bound client takes precedence over both class and default clients.
+
+    Parameters:
+        client (Client):  The client to bind.
+    """
+    token = _context_client.set(client)
+    try:
+        yield client
+    finally:
+        _context_client.reset(token)
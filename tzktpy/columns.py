@@ -0,0 +1,334 @@
+"""
+Columnar results.
+
+A Columns decodes a page of API results straight into one typed array per attribute, without building an object per row.  Integer fields become int64 arrays, decimal fields float64 arrays and timestamps are stored as seconds since the Unix epoch (`datetime64[s]` with NumPy).  NumPy arrays are used when NumPy is installed, and `array.array` otherwise.  Fields holding strings or nested objects are kept as lists.
+
+Columns are built on first access, so CPU and memory scale with the columns that are actually used.
+
+Columns convert to Arrow record batches (`to_arrow`) and pandas DataFrames (`to_dataframe`) when pyarrow and pandas are installed.  In Arrow, integer columns with missing values stay nullable int64 columns, timestamps become `timestamp[s]` columns and nested objects (e.g. Micheline values) are stored as JSON strings.
+
+Examples:
+    >>> columns = Transaction.get(level__ge=1500000, limit=10000, columns=True)
+    >>> len(columns)
+    10000
+    >>> columns['amount'].sum()
+    >>> columns = Transaction.get(level__ge=1500000, limit=10000, columns=['level', 'amount'])
+"""
+import re
+import json
+from array import array
+from .base import parse_epoch
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+__all__ = ('Columns', 'NAT', 'arrow_table')
+
+# stored in timestamp columns for missing timestamps;  NumPy reads it as NaT
+NAT = -2 ** 63
+NAN = float('nan')
+
+
+class Columns(object):
+    """
+    Columns are built on first access when every column is requested (or when `lazy` is True), and are built at once otherwise, releasing the rows.
+
+    Attributes:
+        model (type):  The model class the rows belong to.
+        names (tuple):  The attribute names of the columns.
+    """
+
+    def __init__(self, model, rows, names=None, lazy=None):
+        self.model = model
+        self.fields = self.model_fields(model, rows)
+        available = tuple(field[1] for field in self.fields)
+        all_names = names is None or names is True
+        if lazy is None:
+            lazy = all_names
+        if all_names:
+            self.names = available
+        else:
+            invalid = [name for name in names if name not in available]
+            if invalid:
+                raise ValueError('The following columns are invalid: %s' % ', '.join(invalid))
+            self.names = tuple(names)
+        self.length = len(rows)
+        self._rows = rows
+        self._columns = dict()
+        if not lazy:
+            # only the requested columns are needed:  build them now and release the rows
+            for name in self.names:
+                self[name]
+            self._rows = None
+
+    def __repr__(self):
+        return '<%s %s model=%s, rows=%r, names=%r>' % (self.__class__.__name__, id(self), self.model.__name__, self.length, self.names)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __getitem__(self, name):
+        column = self._columns.get(name)
+        if column is not None:
+            return column
+        if name not in self.names or self._rows is None:
+            raise KeyError(name)
+        key, converter = self.field(name)
+        column = self.build(key, converter, self._rows)
+        self._columns[name] = column
+        return column
+
+    def keys(self):
+        return self.names
+
+    def items(self):
+        return [(name, self[name]) for name in self.names]
+
+    def drop(self, name):
+        """
+        Removes a column.
+
+        Parameters:
+            name (str):  The attribute name of the column.
+        """
+        self.names = tuple(item for item in self.names if item != name)
+        self._columns.pop(name, None)
+
+    def last_value(self, name):
+        """
+        Returns the value of the given column in the last row, e.g. to paginate with a cursor.
+        """
+        value = self[name][-1]
+        return value.item() if hasattr(value, 'item') else value
+
+    def to_dict(self):
+        """
+        Returns every column keyed by attribute name, e.g. to create a `pandas.DataFrame`.
+
+        Returns:
+            dict
+        """
+        return dict(self.items())
+
+    def to_arrow(self, names=None):
+        """
+        Converts the columns to an Arrow record batch.
+
+        Parameters:
+            names (list, optional):  Names of the columns to convert.  Defaults to every column.
+
+        Returns:
+            pyarrow.RecordBatch
+        """
+        if pyarrow is None:
+            raise ImportError('to_arrow requires pyarrow.  Install it with `pip install pyarrow`')
+        names = list(self.names if names is None else names)
+        return pyarrow.RecordBatch.from_arrays([self.arrow_array(name) for name in names], names=names)
+
+    def to_dataframe(self, names=None):
+        """
+        Converts the columns to a pandas DataFrame, through Arrow when pyarrow is installed.
+
+        Parameters:
+            names (list, optional):  Names of the columns to convert.  Defaults to every column.
+
+        Returns:
+            pandas.DataFrame
+        """
+        if pyarrow is not None:
+            return self.to_arrow(names).to_pandas()
+        if pandas is None:
+            raise ImportError('to_dataframe requires pandas.  Install it with `pip install pandas`')
+        names = list(self.names if names is None else names)
+        return pandas.DataFrame(dict((name, self[name]) for name in names), columns=names)
+
+    def arrow_array(self, name):
+        """
+        Builds the given column as an Arrow array.  The array is built from the rows of the page when they are still available, and from the typed column otherwise.
+
+        Returns:
+            pyarrow.Array
+        """
+        key, converter = self.field(name)
+        if self._rows is None:
+            return self.arrow_from_column(self[name], converter)
+        values = [row.get(key) for row in self._rows]
+        if converter == 'to_datetime':
+            return pyarrow.array([parse_epoch(value) if value else None for value in values], type=pyarrow.timestamp('s'))
+        return self.arrow_from_values(values)
+
+    @classmethod
+    def arrow_from_values(cls, values):
+        if any(isinstance(value, (dict, list)) for value in values):
+            values = [json.dumps(value) if isinstance(value, (dict, list)) else value for value in values]
+        try:
+            return pyarrow.array(values)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+            # mixed types, or integers too large for int64
+            return pyarrow.array([None if value is None else str(value) for value in values], type=pyarrow.string())
+
+    @classmethod
+    def arrow_from_column(cls, column, converter):
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            # NaN (missing integers) and NaT become nulls
+            return pyarrow.array(column, from_pandas=True)
+        if converter == 'to_datetime':
+            return pyarrow.array([None if value == NAT else value for value in column], type=pyarrow.timestamp('s'))
+        if isinstance(column, array):
+            return pyarrow.array(column.tolist(), from_pandas=True)
+        return cls.arrow_from_values(column)
+
+    @classmethod
+    def to_attribute(cls, key):
+        return re.sub('([A-Z])', r'_\1', key).lower()
+
+    @classmethod
+    def model_fields(cls, model, rows):
+        if model.api_fields is not None:
+            return model.api_fields
+        # models without a field map use the keys of the rows
+        keys = []
+        for row in rows[:1]:
+            keys = list(row)
+        return tuple((key, cls.to_attribute(key)) for key in keys)
+
+    def field(self, name):
+        for field in self.fields:
+            if field[1] == name:
+                converter = field[2] if len(field) > 2 else None
+                return field[0], converter
+        raise KeyError(name)
+
+    @classmethod
+    def build(cls, key, converter, rows):
+        """
+        Builds the column of the given API key.
+
+        Parameters:
+            key (str):  The API key of the column.
+            converter (str|callable):  The converter of the field, or None.
+            rows (list):  The decoded rows of the page.
+
+        Returns:
+            numpy.ndarray|array.array|list
+        """
+        values = [row.get(key) for row in rows]
+        if converter == 'to_datetime':
+            return cls.timestamp_column(values)
+
+        types = set(type(value) for value in values)
+        has_missing = type(None) in types
+        types.discard(type(None))
+        try:
+            if types == {bool} and not has_missing:
+                return numpy.array(values, dtype=bool) if numpy is not None else array('b', values)
+            if types == {int} and not has_missing:
+                return numpy.array(values, dtype='int64') if numpy is not None else array('q', values)
+            if types and types <= {int, float}:
+                values = [NAN if value is None else value for value in values]
+                return numpy.array(values, dtype='float64') if numpy is not None else array('d', values)
+        except OverflowError:
+            pass
+        return values
+
+    @classmethod
+    def timestamp_column(cls, values):
+        epochs = array('q', [parse_epoch(value) if value else NAT for value in values])
+        if numpy is not None:
+            return numpy.frombuffer(epochs, dtype='int64').view('datetime64[s]')
+        return epochs
+
+    @classmethod
+    def concat(cls, pages):
+        """
+        Concatenates the columns of several pages of the same model.
+
+        Parameters:
+            pages (list):  Columns to concatenate.
+
+        Returns:
+            Columns
+        """
+        pages = list(pages)
+        first = pages[0]
+        if all(page._rows is not None for page in pages):
+            rows = []
+            for page in pages:
+                rows += page._rows
+            return cls(first.model, rows)
+
+        output = cls.__new__(cls)
+        output.model = first.model
+        output.fields = first.fields
+        output.names = first.names
+        output.length = sum(len(page) for page in pages)
+        output._rows = None
+        output._columns = dict()
+        for name in first.names:
+            parts = [page[name] for page in pages]
+            if numpy is not None and isinstance(parts[0], numpy.ndarray):
+                column = numpy.concatenate(parts)
+            else:
+                column = parts[0][:]
+                for part in parts[1:]:
+                    column.extend(part)
+            output._columns[name] = column
+        return output
+
+
+def unify_arrow_types(types):
+    if not types:
+        return pyarrow.null()
+    if len(types) == 1:
+        return next(iter(types))
+    if all(pyarrow.types.is_integer(type_) or pyarrow.types.is_floating(type_) for type_ in types):
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def arrow_table(batches, names=None):
+    """
+    Combines record batches built from successive pages into a single Arrow table.  The type of a column can differ between pages (e.g. a column without any value on one page), so every batch is cast to a common schema.
+
+    Parameters:
+        batches (iterable):  `pyarrow.RecordBatch` objects, e.g. from `Base.arrow_batches`.
+        names (list, optional):  Names of the columns of an empty table, when there are no batches.
+
+    Returns:
+        pyarrow.Table
+    """
+    if pyarrow is None:
+        raise ImportError('arrow_table requires pyarrow.  Install it with `pip install pyarrow`')
+    batches = list(batches)
+    if not batches:
+        return pyarrow.table(dict((name, pyarrow.array([], type=pyarrow.null())) for name in names or ()))
+
+    types = dict()
+    for batch in batches:
+        for field in batch.schema:
+            field_types = types.setdefault(field.name, set())
+            if not pyarrow.types.is_null(field.type):
+                field_types.add(field.type)
+    schema = pyarrow.schema([(name, unify_arrow_types(field_types)) for name, field_types in types.items()])
+    tables = []
+    for batch in batches:
+        table = pyarrow.Table.from_batches([batch])
+        for name in schema.names:
+            if name not in table.column_names:
+                table = table.append_column(name, pyarrow.nulls(len(table)))
+        tables.append(table.select(schema.names).cast(schema))
+    return pyarrow.concat_tables(tables)
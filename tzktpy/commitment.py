@@ -4,6 +4,14 @@ __all__ = ('Commitment', )
 
 class Commitment(Base):
     __slots__ = ('address', 'balance', 'activated', 'activation_level', 'activation_time', 'activated_account')
+    api_fields = (
+        ('address', 'address'),
+        ('balance', 'balance'),
+        ('activated', 'activated'),
+        ('activationLevel', 'activation_level'),
+        ('activationTime', 'activation_time', 'to_datetime'),
+        ('activatedAccount', 'activated_account'),
+    )
 
     def __init__(self, address, balance, activated, activation_level, activation_time, activated_account):
         self.address = address
@@ -16,19 +24,6 @@ class Commitment(Base):
     def __repr__(self):
         return '<%s %s address=%r, balance=%r, activated=%r, activation_level=%r, activation_time=%r>' % (self.__class__.__name__, id(self), self.address, self.balance, self.activated, self.activation_level, self.activation_time)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Commitment, cls).from_api(data)
-        address = data['address']
-        balance = data['balance']
-        activated = data['activated']
-        activation_level = data['activationLevel']
-        activation_time = data['activationTime']
-        activated_account = data['activatedAccount']
-        if activation_time:
-            activation_time = cls.to_datetime(activation_time)
-        return cls(address, balance, activated, activation_level, activation_time, activated_account)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -41,6 +36,9 @@ class Commitment(Base):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), balance, activationLevel.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -50,11 +48,15 @@ class Commitment(Base):
             >>> commitments = Commitment.get(activated=True, balance__gt=100)
         """
         path = 'v1/commitments'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['activationLevel', 'balance'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
@@ -5,6 +5,13 @@ __all__ = ('EntryPoint', 'Contract')
 
 class EntryPoint(Base):
     __slots__ = ('name', 'json_parameters', 'micheline_parameters', 'michelson_parameters', 'unused')
+    api_fields = (
+        ('name', 'name'),
+        ('jsonParameters', 'json_parameters'),
+        ('michelineParameters', 'micheline_parameters'),
+        ('michelsonParameters', 'michelson_parameters'),
+        ('unused', 'unused'),
+    )
 
     def __init__(self, name, json_parameters, micheline_parameters, michelson_parameters, unused):
         self.name = name
@@ -16,15 +23,6 @@ class EntryPoint(Base):
     def __str__(self):
         return self.name
 
-    @classmethod
-    def from_api(cls, data):
-        name = data['name']
-        json_parameters = data['jsonParameters']
-        micheline_parameters = data['michelineParameters']
-        michelson_parameters = data['michelsonParameters']
-        unused = data['unused']
-        return cls(name, json_parameters, micheline_parameters, michelson_parameters, unused)
-
     @classmethod
     def by_name(cls, address, name, **kwargs):
         """
@@ -59,47 +57,38 @@ class EntryPoint(Base):
 
 
 class Contract(account.AccountBase):
+    account_type = 'contract'
+    api_fields = (
+        ('type', 'type'),
+        ('alias', 'alias'),
+        ('address', 'address'),
+        ('publicKey', 'public_key'),
+        ('revealed', 'revealed'),
+        ('balance', 'balance'),
+        ('counter', 'counter'),
+        ('delegate', 'delegate'),
+        ('delegationLevel', 'delegation_level'),
+        ('delegationTime', 'delegation_time', 'to_datetime'),
+        ('numContracts', 'num_contracts'),
+        ('numActivations', 'num_activations'),
+        ('numDelegations', 'num_delegations'),
+        ('numOriginations', 'num_originations'),
+        ('numTransactions', 'num_transactions'),
+        ('numReveals', 'num_reveals'),
+        ('numMigrations', 'num_migrations'),
+        ('firstActivity', 'first_activity'),
+        ('firstActivityTime', 'first_activity_time', 'to_datetime'),
+        ('lastActivity', 'last_activity'),
+        ('lastActivityTime', 'last_activity_time', 'to_datetime'),
+        ('contracts', 'contracts'),
+        ('operations', 'operations'),
+        ('metadata', 'metadata'),
+    )
+
     def __init__(self, type, alias, address, publicKey, revealed, balance, counter, delegate, delegationLevel, delegationTime, numContracts, numActivations, numDelegations, numOriginations, numTransactions , numReveals, numMigrations, firstActivity, firstActivityTime, lastActivity, lastActivityTime, contracts, operations, metadata):
         super(Contract, self).__init__(type, alias, address, publicKey, revealed, balance, counter, delegationLevel, delegationTime, numContracts, numActivations, numDelegations, numOriginations, numTransactions, numReveals, numMigrations, firstActivity, firstActivityTime, lastActivity, lastActivityTime, contracts, operations, metadata)
         self.delegate = delegate
 
-    @classmethod
-    def from_api(cls, data):
-        type = data['type']
-        alias = data['alias']
-        address = data['address']
-        publicKey = data['publicKey']
-        revealed = data['revealed']
-        balance = data['balance']
-        counter = data['counter']
-        delegate = data['delegate']
-        delegationLevel = data['delegationLevel']
-        delegationTime = data['delegationTime']
-        numContracts = data['numContracts']
-        numActivations = data['numActivations']
-        numDelegations = data['numDelegations']
-        numOriginations = data['numOriginations']
-        numTransactions = data['numTransactions']
-        numReveals = data['numReveals']
-        numMigrations = data['numMigrations']
-        firstActivity = data['firstActivity']
-        firstActivityTime = data['firstActivityTime']
-        lastActivity = data['lastActivity']
-        lastActivityTime = data['lastActivityTime']
-        contracts = data['contracts']
-        operations = data['operations']
-        metadata = data['metadata']
-        if delegationTime:
-          delegationTime = cls.to_datetime(delegationTime)
-
-        if firstActivityTime:
-          firstActivityTime = cls.to_datetime(firstActivityTime)
-
-        if lastActivityTime:
-          lastActivityTime = cls.to_datetime(lastActivityTime)
-
-        return cls(type, alias, address, publicKey, revealed, balance, counter, delegate, delegationLevel, delegationTime, numContracts, numActivations, numDelegations, numOriginations, numTransactions, numReveals, numMigrations, firstActivity, firstActivityTime, lastActivity, lastActivityTime, contracts, operations, metadata)
-
     @classmethod
     def count(cls, kind, **kwargs):
         """
@@ -142,6 +131,9 @@ class Contract(account.AccountBase):
             sort (str):  Sorts contracts by specified field. Supported fields: id (default), balance, firstActivity, lastActivity, numTransactions.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -151,12 +143,16 @@ class Contract(account.AccountBase):
             >>> smart_contracts = Contract.get(kind='smart_contract')
         """
         path = 'v1/contracts'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['kind', 'creator', 'manager', 'delegate', 'lastActivity', 'typeHash', 'codeHash'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_account(cls, address, **kwargs):
@@ -167,6 +163,9 @@ class Contract(account.AccountBase):
             sort (str):  Sorts contracts by specified field. Supported fields: id (default, desc), balance, creationLevel.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -177,10 +176,14 @@ class Contract(account.AccountBase):
             >>> contracts = Contract.by_account(address)
         """
         path = 'v1/accounts/%s/contracts' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params, _ = cls.prepare_modifiers(kwargs, include=cls.pagination_parameters)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_address(cls, address, **kwargs):
@@ -205,10 +208,14 @@ class Contract(account.AccountBase):
     @classmethod
     def similar(cls, address, **kwargs):
         path = 'v1/contracts/%s/similar' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def code(cls, address, format, **kwargs):
@@ -4,6 +4,23 @@ __all__ = ('Cycle', )
 
 class Cycle(Base):
     __slots__ = ('index', 'first_level', 'start_time', 'last_level', 'end_time', 'snapshot_index', 'snapshot_level', 'random_seed', 'total_bakers', 'total_rolls', 'total_staking', 'total_delegators', 'total_delegated', 'quote')
+    api_fields = (
+        ('index', 'index'),
+        ('firstLevel', 'first_level'),
+        ('startTime', 'start_time', 'to_datetime'),
+        ('lastLevel', 'last_level'),
+        ('endTime', 'end_time', 'to_datetime'),
+        ('snapshotIndex', 'snapshot_index'),
+        ('snapshotLevel', 'snapshot_level'),
+        ('randomSeed', 'random_seed'),
+        ('totalBakers', 'total_bakers'),
+        ('totalRolls', 'total_rolls'),
+        ('totalStaking', 'total_staking'),
+        ('totalDelegators', 'total_delegators'),
+        ('totalDelegated', 'total_delegated'),
+        ('quote', 'quote'),
+    )
+    pagination_cursor = 'index'
 
     def __init__(self, index, first_level, start_time, last_level, end_time, snapshot_index, snapshot_level, random_seed, total_bakers, total_rolls, total_staking, total_delegators, total_delegated, quote):
         self.index = index
@@ -24,29 +41,6 @@ class Cycle(Base):
     def __repr__(self):
         return '<%s %s index=%r, first_level=%r, start_time=%r, last_level=%r, end_time=%r, snapshot_index=%r, snapshot_level=%r>' % (self.__class__.__name__, id(self), self.index, self.first_level, self.start_time, self.last_level, self.end_time, self.snapshot_index, self.snapshot_level)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Cycle, cls).from_api(data)
-        index = data['index']
-        first_level = data['firstLevel']
-        start_time = data['startTime']
-        last_level = data['lastLevel']
-        end_time = data['endTime']
-        snapshot_index = data['snapshotIndex']
-        snapshot_level = data['snapshotLevel']
-        random_seed = data['randomSeed']
-        total_bakers = data['totalBakers']
-        total_rolls = data['totalRolls']
-        total_staking = data['totalStaking']
-        total_delegators = data['totalDelegators']
-        total_delegated = data['totalDelegated']
-        quote = data['quote']
-        if start_time:
-            start_time = cls.to_datetime(start_time)
-        if end_time:
-            end_time = cls.to_datetime(end_time)
-        return cls(index, first_level, start_time, last_level, end_time, snapshot_index, snapshot_level, random_seed, total_bakers, total_rolls, total_staking, total_delegators, total_delegated, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -57,6 +51,9 @@ class Cycle(Base):
             sort (str):  Sorts cycles by specified field. Supported fields: index (default, desc).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -65,12 +62,16 @@ class Cycle(Base):
         Example:
             >>> commitments = Commitment.get(activated=True, balance__gt=100)
         """
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['snapshotIndex'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
         path = 'v1/cycles'
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_index(cls, index, **kwargs):
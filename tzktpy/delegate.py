@@ -6,20 +6,59 @@ __all__ = ('ShortSoftware', 'Delegate')
 
 class ShortSoftware(Base):
     __slots__ = ('version', 'date')
+    api_fields = (
+        ('version', 'version'),
+        ('date', 'date', 'to_datetime'),
+    )
 
     def __init__(self, version, date):
         self.version = version
         self.date = date
 
-    @classmethod
-    def from_api(cls, data):
-        version = data['version']
-        date = cls.to_datetime(data['date'])
-        return cls(version, date)
-
 
 class Delegate(account.AccountBase):
     __slots__ = ('type', 'alias', 'address', 'public_key', 'revealed', 'balance', 'frozen_deposits', 'frozen_rewards', 'frozen_fees', 'counter', 'delegate', 'delegation_level', 'delegation_time', 'staking_balance', 'num_contracts', 'num_delegators', 'num_blocks', 'num_endorsements', 'num_ballots', 'num_proposals', 'num_activations', 'num_double_baking', 'num_double_endorsing', 'num_nonce_revelations', 'num_relevation_penalties', 'num_delegations', 'num_originations', 'num_transactions', 'num_reveals', 'num_migrations', 'first_activity', 'first_activity_time', 'last_activity', 'last_activity_time', 'contracts', 'operations', 'metadata', 'software')
+    account_type = 'delegate'
+    api_fields = (
+        ('type', 'type'),
+        ('alias', 'alias'),
+        ('address', 'address'),
+        ('publicKey', 'public_key'),
+        ('revealed', 'revealed'),
+        ('balance', 'balance'),
+        ('frozenDeposits', 'frozen_deposits'),
+        ('frozenRewards', 'frozen_rewards'),
+        ('frozenFees', 'frozen_fees'),
+        ('counter', 'counter'),
+        ('delegate', 'delegate'),
+        ('delegationLevel', 'delegation_level'),
+        ('delegationTime', 'delegation_time'),
+        ('stakingBalance', 'staking_balance'),
+        ('numContracts', 'num_contracts'),
+        ('numDelegators', 'num_delegators'),
+        ('numBlocks', 'num_blocks'),
+        ('numEndorsements', 'num_endorsements'),
+        ('numBallots', 'num_ballots'),
+        ('numProposals', 'num_proposals'),
+        ('numActivations', 'num_activations'),
+        ('numDoubleBaking', 'num_double_baking'),
+        ('numDoubleEndorsing', 'num_double_endorsing'),
+        ('numNonceRevelations', 'num_nonce_revelations'),
+        ('numRelevationPenalties', 'num_relevation_penalties'),
+        ('numDelegations', 'num_delegations'),
+        ('numOriginations', 'num_originations'),
+        ('numTransactions', 'num_transactions'),
+        ('numReveals', 'num_reveals'),
+        ('numMigrations', 'num_migrations'),
+        ('firstActivity', 'first_activity'),
+        ('firstActivityTime', 'first_activity_time', 'to_datetime'),
+        ('lastActivity', 'last_activity'),
+        ('lastActivityTime', 'last_activity_time', 'to_datetime'),
+        ('contracts', 'contracts'),
+        ('operations', 'operations'),
+        ('metadata', 'metadata'),
+        ('software', 'software', ShortSoftware.from_api),
+    )
 
     def __init__(self, type, alias, address, publicKey, revealed, balance, frozen_deposits, frozen_rewards, frozen_fees, counter, delegate, delegationLevel, delegationTime, staking_balance, numContracts, num_delegators, num_blocks, num_endorsements, num_ballots, num_proposals, numActivations, num_double_baking, num_double_endorsing, num_nonce_revelations, num_relevation_penalties, numDelegations, numOriginations, numTransactions, numReveals, numMigrations, firstActivity, firstActivityTime, lastActivity, lastActivityTime, contracts, operations, metadata, software):
         super(Delegate, self).__init__(type, alias, address, publicKey, revealed, balance, counter, delegationLevel, delegationTime, numContracts, numActivations, numDelegations, numOriginations, numTransactions, numReveals, numMigrations, firstActivity, firstActivityTime, lastActivity, lastActivityTime, contracts, operations, metadata)
@@ -39,56 +78,6 @@ class Delegate(account.AccountBase):
         self.num_relevation_penalties = num_relevation_penalties
         self.software = software
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Delegate, cls).from_api(data)
-        type = data['type']
-        alias = data['alias']
-        address = data['address']
-        publicKey = data['publicKey']
-        revealed = data['revealed']
-        balance = data['balance']
-        frozen_deposits = data['frozenDeposits']
-        frozen_rewards = data['frozenRewards']
-        frozen_fees = data['frozenFees']
-        counter = data['counter']
-        delegate = data['delegate']
-        delegationLevel = data['delegationLevel']
-        delegationTime = data['delegationTime']
-        staking_balance = data['stakingBalance']
-        numContracts = data['numContracts']
-        num_delegators = data['numDelegators']
-        num_blocks = data['numBlocks']
-        num_endorsements = data['numEndorsements']
-        num_ballots = data['numBallots']
-        num_proposals = data['numProposals']
-        numActivations = data['numActivations']
-        num_double_baking = data['numDoubleBaking']
-        num_double_endorsing = data['numDoubleEndorsing']
-        num_nonce_revelations = data['numNonceRevelations']
-        num_relevation_penalties = data['numRelevationPenalties']
-        numDelegations = data['numDelegations']
-        numOriginations = data['numOriginations']
-        numTransactions = data['numTransactions']
-        numReveals = data['numReveals']
-        numMigrations = data['numMigrations']
-        firstActivity = data['firstActivity']
-        firstActivityTime = data['firstActivityTime']
-        lastActivity = data['lastActivity']
-        lastActivityTime = data['lastActivityTime']
-        contracts = data['contracts']
-        operations = data['operations']
-        metadata = data['metadata']
-        software = data['software']
-        if software:
-            software = ShortSoftware.from_api(software)
-        if firstActivityTime:
-            firstActivityTime = cls.to_datetime(firstActivityTime)
-        if lastActivityTime:
-            lastActivityTime = cls.to_datetime(lastActivityTime)
-
-        return cls(type, alias, address, publicKey, revealed, balance, frozen_deposits, frozen_rewards, frozen_fees, counter, delegate, delegationLevel, delegationTime, staking_balance, numContracts, num_delegators, num_blocks, num_endorsements, num_ballots, num_proposals, numActivations, num_double_baking, num_double_endorsing, num_nonce_revelations, num_relevation_penalties, numDelegations, numOriginations, numTransactions, numReveals, numMigrations, firstActivity, firstActivityTime, lastActivity, lastActivityTime, contracts, operations, metadata, software)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -100,6 +89,9 @@ class Delegate(account.AccountBase):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), activationLevel, deactivationLevel, stakingBalance, balance, numDelegators.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -109,11 +101,15 @@ class Delegate(account.AccountBase):
             >>> delegates = Delegate.get(active=True)
         """
         path = 'v1/delegates'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['active', 'lastActivity'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
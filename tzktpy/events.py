@@ -0,0 +1,520 @@
+"""
+Real-time events from the tzkt SignalR hub (`/v1/events`).
+
+An EventClient subscribes to channels of the hub (head, blocks, operations and bigmap updates) over a websocket, and delivers each pushed item as the model object the REST endpoints return (Head, Block, Transaction, BigMapUpdate, ...), to a callback or through an async iterator.  A reorganization pushed by the hub is delivered as a `follower.Rollback`.
+
+When the connection drops, the client reconnects with the backoff of its RetryPolicy and subscribes again.  The hub then sends the current level of each channel, and the items of the levels pushed while the client was disconnected are fetched from the REST endpoints and delivered before the new ones, so a consumer sees every level once.
+
+Requires aiohttp (`pip install aiohttp`).
+
+Examples:
+    >>> async def main():
+    ...     async with EventClient() as events:
+    ...         events.subscribe_blocks()
+    ...         events.subscribe_operations(address='KT1...', types=['transaction'])
+    ...         async for item in events:
+    ...             print(item)
+"""
+import json
+import asyncio
+import inspect
+import requests
+from .base import Base
+from .bigmap import BigMapUpdate
+from .block import Block
+from .follower import Rollback
+from .head import Head
+from .response import get_json_decoder
+from .throttle import RetryPolicy
+from . import operation
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+__all__ = ('EventClient', 'Subscription', 'HeadSubscription', 'BlockSubscription', 'OperationSubscription', 'BigMapSubscription')
+
+# SignalR JSON hub protocol:  messages are terminated by a record separator
+RECORD_SEPARATOR = '\x1e'
+INVOCATION = 1
+COMPLETION = 3
+PING = 6
+CLOSE = 7
+
+# types of the messages sent on a tzkt channel
+STATE = 0
+DATA = 1
+REORG = 2
+
+OPERATION_CLASSES = dict(
+    endorsement=operation.Endorsement,
+    ballot=operation.Ballot,
+    proposal=operation.Proposal,
+    activation=operation.Activation,
+    double_baking=operation.DoubleBaking,
+    double_endorsing=operation.DoubleEndorsing,
+    nonce_revelation=operation.NonceRevelation,
+    delegation=operation.Delegation,
+    origination=operation.Origination,
+    transaction=operation.Transaction,
+    reveal=operation.Reveal,
+    migration=operation.Migration,
+    revelation_penalty=operation.RevelationPenalty,
+    baking=operation.Baking,
+)
+
+
+def encode_message(message):
+    return json.dumps(message, separators=(',', ':')) + RECORD_SEPARATOR
+
+
+def decode_messages(text, loads=None):
+    """
+    Splits a websocket frame into the SignalR messages it contains.
+
+    Returns:
+        list
+    """
+    loads = loads or get_json_decoder()
+    return [loads(part) for part in text.split(RECORD_SEPARATOR) if part]
+
+
+class Subscription(object):
+    """
+    A subscription to a channel of the hub.
+
+    Attributes:
+        channel (str):  Name of the channel the hub pushes the items on.
+        method (str):  Name of the hub method subscribing to the channel.
+        arguments (dict):  Filters of the subscription, or None.
+        callback (callable):  Called with each item of the subscription, or None.
+        level (int):  Level of the last state received on the channel, or None before the first one.
+    """
+    channel = None
+    method = None
+
+    def __init__(self, arguments=None, callback=None):
+        self.arguments = arguments
+        self.callback = callback
+        self.level = None
+
+    def __repr__(self):
+        return '<%s %s channel=%r, arguments=%r, level=%r>' % (self.__class__.__name__, id(self), self.channel, self.arguments, self.level)
+
+    def invocation(self, invocation_id):
+        return dict(type=INVOCATION, invocationId=str(invocation_id), target=self.method, arguments=[self.arguments] if self.arguments else [])
+
+    def decode(self, data):
+        """
+        Converts the data of a message to model objects.
+
+        Returns:
+            list
+        """
+        raise NotImplementedError
+
+    async def abackfill(self, first, last, client, **kwargs):
+        """
+        Fetches the items of the levels after `first`, up to `last`, paging through the REST endpoints with the given AsyncClient.
+
+        Returns:
+            list
+        """
+        raise NotImplementedError
+
+
+class HeadSubscription(Subscription):
+    channel = 'head'
+    method = 'SubscribeToHead'
+
+    def decode(self, data):
+        return [Head.from_api(data)]
+
+    async def abackfill(self, first, last, client, **kwargs):
+        # only the current head matters
+        head = await client.call(Head.get, **kwargs)
+        return [head] if head.level > first else []
+
+
+class BlockSubscription(Subscription):
+    channel = 'blocks'
+    method = 'SubscribeToBlocks'
+
+    def decode(self, data):
+        return Block.from_api_list(data if isinstance(data, list) else [data])
+
+    async def abackfill(self, first, last, client, **kwargs):
+        return [block async for block in Block.aiter(level__gt=first, level__le=last, client=client, **kwargs)]
+
+
+class OperationSubscription(Subscription):
+    channel = 'operations'
+    method = 'SubscribeToOperations'
+
+    def decode(self, data):
+        return [OPERATION_CLASSES.get(item.get('type'), operation.Operation).from_api(item) for item in data]
+
+    def endpoints(self, first, last, **kwargs):
+        """
+        Returns the class, positional arguments and filters of each list endpoint paged through by a backfill.
+
+        Returns:
+            list
+        """
+        arguments = self.arguments or dict()
+        address = arguments.get('address')
+        types = arguments['types'].split(',') if arguments.get('types') else list(OPERATION_CLASSES)
+        output = []
+        for name in types:
+            cls = OPERATION_CLASSES[name]
+            if address:
+                output.append((cls, (address, ), dict(method='by_address', type=[name], level__gt=first, level__le=last, **kwargs)))
+            else:
+                output.append((cls, (), dict(level__gt=first, level__le=last, **kwargs)))
+        return output
+
+    async def abackfill(self, first, last, client, **kwargs):
+        output = []
+        for cls, args, filters in self.endpoints(first, last, **kwargs):
+            output.extend([item async for item in cls.aiter(*args, client=client, **filters)])
+        output.sort(key=lambda item: item.id)
+        return output
+
+
+class BigMapSubscription(Subscription):
+    channel = 'bigmaps'
+    method = 'SubscribeToBigMaps'
+
+    def decode(self, data):
+        return BigMapUpdate.from_api_list(data)
+
+    def filters(self):
+        arguments = self.arguments or dict()
+        filters = dict()
+        if arguments.get('ptr') is not None:
+            filters['bigmap'] = arguments['ptr']
+        for key in ('contract', 'path'):
+            if arguments.get(key):
+                filters[key] = arguments[key]
+        return filters
+
+    async def abackfill(self, first, last, client, **kwargs):
+        return [update async for update in BigMapUpdate.aiter(level__gt=first, level__le=last, client=client, **dict(self.filters(), **kwargs))]
+
+
+class EventClient(object):
+    """
+    Attributes:
+        domain (str):  The tzkt.io domain of the hub.
+        client (AsyncClient):  Client used to fetch missed items from the REST endpoints.
+        subscriptions (list):  The subscriptions sent on every connection.
+        reconnect (bool):  Indicates if the client reconnects when the connection drops.
+        backfill (bool):  Indicates if the items missed while disconnected are fetched from the REST endpoints.
+        keepalive (float):  Seconds between two pings sent to the hub.
+        timeout (float):  Seconds without any message from the hub after which the connection is considered lost.
+        retry (RetryPolicy):  Backoff between two connection attempts.
+        connected (bool):  Indicates if the client is connected to the hub.
+    """
+    path = 'v1/events'
+
+    def __init__(self, domain=None, client=None, callback=None, reconnect=True, backfill=True, keepalive=15, timeout=30, retry=None):
+        """
+        Parameters:
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+            client (AsyncClient, optional):  Client used to fetch missed items.  Defaults to the default AsyncClient.
+            callback (callable, optional):  Called with every item, after the callback of its subscription.  Coroutine functions are awaited.
+            reconnect (bool, optional):  Reconnects when the connection drops.  Defaults to True.
+            backfill (bool, optional):  Fetches the items missed while disconnected from the REST endpoints.  Defaults to True.
+            keepalive (float, optional):  Seconds between two pings sent to the hub.  Defaults to 15.
+            timeout (float, optional):  Seconds without any message from the hub after which the client reconnects.  Defaults to 30.
+            retry (RetryPolicy, optional):  Backoff between two connection attempts.  Defaults to `RetryPolicy()`.
+        """
+        if aiohttp is None:
+            raise ImportError('EventClient requires aiohttp.  Install it with `pip install aiohttp`')
+        self.domain = (domain or Base.domain).rstrip('/')
+        self.client = client
+        self.callback = callback
+        self.subscriptions = []
+        self.reconnect = reconnect
+        self.backfill = backfill
+        self.keepalive = keepalive
+        self.timeout = timeout
+        self.retry = RetryPolicy() if retry is None else retry
+        self.connected = False
+        self._session = None
+        self._websocket = None
+        self._queue = None
+        self._task = None
+        self._closed = False
+        self._invocation_id = 0
+
+    def __repr__(self):
+        return '<%s %s domain=%r, connected=%r, subscriptions=%r>' % (self.__class__.__name__, id(self), self.domain, self.connected, [subscription.channel for subscription in self.subscriptions])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __aiter__(self):
+        return self.items()
+
+    def subscribe(self, subscription):
+        """
+        Adds a subscription, sent on every connection (immediately if the client is connected).
+
+        Returns:
+            Subscription
+        """
+        self.subscriptions.append(subscription)
+        if self.connected:
+            asyncio.ensure_future(self.send(subscription.invocation(self.next_invocation_id())))
+        return subscription
+
+    def subscribe_head(self, callback=None):
+        """
+        Subscribes to the head of the chain.  Delivers a Head each time it changes.
+
+        Returns:
+            HeadSubscription
+        """
+        return self.subscribe(HeadSubscription(callback=callback))
+
+    def subscribe_blocks(self, callback=None):
+        """
+        Subscribes to new blocks.  Delivers Blocks.
+
+        Returns:
+            BlockSubscription
+        """
+        return self.subscribe(BlockSubscription(callback=callback))
+
+    def subscribe_operations(self, address=None, types=None, callback=None):
+        """
+        Subscribes to new operations.  Delivers objects of the class of each operation type (e.g. Transaction).
+
+        Parameters:
+            address (str, optional):  Only delivers the operations related to this address.
+            types (list, optional):  Only delivers the operations of these types (e.g. `['transaction', 'origination']`).  Defaults to every type.
+            callback (callable, optional):  Called with each operation.
+
+        Returns:
+            OperationSubscription
+        """
+        arguments = dict()
+        if address:
+            arguments['address'] = address
+        if types:
+            arguments['types'] = types if isinstance(types, str) else ','.join(types)
+        return self.subscribe(OperationSubscription(arguments or None, callback=callback))
+
+    def subscribe_bigmaps(self, ptr=None, contract=None, path=None, tags=None, callback=None):
+        """
+        Subscribes to bigmap updates.  Delivers BigMapUpdates.
+
+        Parameters:
+            ptr (int, optional):  Only delivers the updates of this bigmap.
+            contract (str, optional):  Only delivers the updates of the bigmaps of this contract.
+            path (str, optional):  Only delivers the updates of the bigmaps at this path of the storage (with `contract`).
+            tags (list, optional):  Only delivers the updates of the bigmaps with these tags (e.g. `['token_metadata']`).  Not applied to the items fetched after a disconnection.
+            callback (callable, optional):  Called with each update.
+
+        Returns:
+            BigMapSubscription
+        """
+        arguments = dict()
+        if ptr is not None:
+            arguments['ptr'] = ptr
+        if contract:
+            arguments['contract'] = contract
+        if path:
+            arguments['path'] = path
+        if tags:
+            arguments['tags'] = list(tags)
+        return self.subscribe(BigMapSubscription(arguments or None, callback=callback))
+
+    def next_invocation_id(self):
+        self._invocation_id += 1
+        return self._invocation_id
+
+    def get_client(self):
+        from .aio import get_default_async_client
+        return self.client or get_default_async_client()
+
+    def websocket_url(self, token):
+        url = '%s/%s' % (self.domain, self.path)
+        if url.startswith('http'):
+            url = 'ws' + url[4:]
+        return '%s?id=%s' % (url, token) if token else url
+
+    async def send(self, message):
+        await self._websocket.send_str(encode_message(message))
+
+    async def connect(self):
+        """
+        Negotiates a connection with the hub, opens the websocket and sends the handshake and the subscriptions.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        async with self._session.post('%s/%s/negotiate' % (self.domain, self.path), params=dict(negotiateVersion=1)) as response:
+            response.raise_for_status()
+            negotiation = await response.json(content_type=None)
+        token = negotiation.get('connectionToken') or negotiation.get('connectionId')
+        self._websocket = await self._session.ws_connect(self.websocket_url(token), autoping=True)
+        await self._websocket.send_str(encode_message(dict(protocol='json', version=1)))
+        message = await self._websocket.receive(timeout=self.timeout)
+        handshake = decode_messages(message.data) if message.type == aiohttp.WSMsgType.TEXT else [dict(error='Handshake failed (%s)' % message.type)]
+        if handshake and handshake[0].get('error'):
+            raise ConnectionError(handshake[0]['error'])
+        self.connected = True
+        for subscription in self.subscriptions:
+            await self.send(subscription.invocation(self.next_invocation_id()))
+
+    async def disconnect(self):
+        self.connected = False
+        websocket, self._websocket = self._websocket, None
+        if websocket is not None:
+            await websocket.close()
+
+    async def ping(self):
+        while True:
+            await asyncio.sleep(self.keepalive)
+            await self.send(dict(type=PING))
+
+    async def listen(self):
+        """
+        Dispatches the messages of the hub until the connection closes.
+        """
+        loads = get_json_decoder()
+        pinger = asyncio.ensure_future(self.ping())
+        try:
+            while True:
+                message = await self._websocket.receive(timeout=self.timeout)
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    raise ConnectionError('Connection to %s closed (%s)' % (self.domain, message.type))
+                for item in decode_messages(message.data, loads):
+                    if item.get('type') == CLOSE:
+                        raise ConnectionError('Connection closed by the hub: %s' % item.get('error'))
+                    if item.get('type') == COMPLETION and item.get('error'):
+                        raise ConnectionError('Subscription failed: %s' % item['error'])
+                    if item.get('type') == INVOCATION:
+                        for payload in item.get('arguments') or ():
+                            await self.dispatch(item.get('target'), payload)
+        finally:
+            pinger.cancel()
+
+    async def dispatch(self, channel, payload):
+        for subscription in self.subscriptions:
+            if subscription.channel == channel:
+                await self.handle(subscription, payload)
+
+    async def handle(self, subscription, payload):
+        """
+        Delivers the items of a message of a channel, fetching the items of the levels missed since the last message first.
+        """
+        kind = payload.get('type')
+        state = payload.get('state')
+        previous = subscription.level
+        if kind == REORG or (kind == STATE and previous is not None and state is not None and state < previous):
+            await self.emit(subscription, Rollback(state, None, previous, None))
+        elif kind == STATE and previous is not None and state is not None and state > previous and self.backfill:
+            try:
+                items = await subscription.abackfill(previous, state, self.get_client(), domain=self.domain)
+            except (requests.RequestException, json.JSONDecodeError) as error:
+                # the level of the subscription is left unchanged, so the gap is fetched again after reconnecting
+                raise ConnectionError('Backfill of %s after level %s failed: %s' % (subscription.channel, previous, error)) from error
+            for item in items:
+                await self.emit(subscription, item)
+        elif kind == DATA:
+            for item in subscription.decode(payload.get('data')):
+                await self.emit(subscription, item)
+        if state is not None:
+            subscription.level = state
+
+    async def emit(self, subscription, item):
+        for callback in (subscription.callback, self.callback):
+            if callback is not None:
+                result = callback(item)
+                if inspect.isawaitable(result):
+                    await result
+        if self._queue is not None:
+            await self._queue.put(item)
+
+    async def run(self):
+        """
+        Stays connected to the hub until the client is closed, reconnecting when the connection drops (unless `reconnect` is False).
+        """
+        attempt = 0
+        while not self._closed:
+            try:
+                await self.connect()
+                attempt = 0
+                await self.listen()
+            except (aiohttp.ClientError, ConnectionError, asyncio.TimeoutError):
+                # errors of callbacks and decoding propagate:  reconnecting would deliver the same items again
+                if not self.reconnect or self._closed:
+                    raise
+            finally:
+                await self.disconnect()
+            attempt += 1
+            if self._closed:
+                break
+            await asyncio.sleep(self.retry.delay(attempt))
+
+    def start(self):
+        """
+        Runs the client in a background task.
+
+        Returns:
+            asyncio.Task
+        """
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def items(self):
+        """
+        Yields every delivered item (model objects and Rollbacks), running the client in the background.
+
+        Returns:
+            async generator
+        """
+        self._queue = asyncio.Queue()
+        task = self.start()
+        getter = None
+        try:
+            while True:
+                getter = asyncio.ensure_future(self._queue.get())
+                await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                    continue
+                # the client stopped:  deliver what is left, then its error if any
+                getter.cancel()
+                while not self._queue.empty():
+                    yield self._queue.get_nowait()
+                if not task.cancelled():
+                    task.result()
+                return
+        finally:
+            if getter is not None:
+                getter.cancel()
+            self._queue = None
+
+    async def close(self):
+        """
+        Closes the connection and stops the client.
+        """
+        self._closed = True
+        task = self._task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        await self.disconnect()
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
@@ -0,0 +1,304 @@
+"""
+Following the chain.
+
+A Follower keeps the level and hash of the last block it processed.  Each poll asks for the head (one request) and, only when the head moved, fetches the new blocks, including the last processed one so its hash can be checked, and the operations of the requested types at those levels.  The changes are delivered as events:  a Batch of new blocks and operations, or a Rollback when the chain was reorganized.  A reorganization is detected when the hash of the last processed block changed, and the Rollback names the last level whose block is still on the chain, so the blocks above it can be undone before the new ones are applied.
+
+Examples:
+    >>> follower = Follower(level=checkpoint.level, hash=checkpoint.hash, operations=[Transaction, (Origination, dict(status='applied'))])
+    >>> for event in follower:
+    ...     if isinstance(event, Rollback):
+    ...         undo_above(event.level)
+    ...     else:
+    ...         apply(event.blocks, event.operations[Transaction])
+"""
+import asyncio
+import threading
+from collections import deque
+from .block import Block
+from .head import Head
+from .exception import TZKTException
+__all__ = ('Batch', 'Rollback', 'Follower', 'ReorgTooDeep')
+
+
+class ReorgTooDeep(TZKTException):
+    """
+    Raised when none of the blocks remembered by a Follower is on the chain anymore.
+    """
+    pass
+
+
+class Batch(object):
+    """
+    New blocks, and the operations at their levels.
+
+    Attributes:
+        head (Head):  The head when the batch was fetched.
+        blocks (list):  New blocks, in level order.
+        operations (dict):  The operations at the levels of the blocks (in the order of the API), by operation class.
+    """
+    __slots__ = ('head', 'blocks', 'operations')
+
+    def __init__(self, head, blocks, operations):
+        self.head = head
+        self.blocks = blocks
+        self.operations = operations
+
+    def __repr__(self):
+        return '<%s %s first_level=%r, level=%r, hash=%r, operations=%r>' % (self.__class__.__name__, id(self), self.first_level, self.level, self.hash, dict((cls.__name__, len(items)) for cls, items in self.operations.items()))
+
+    @property
+    def first_level(self):
+        return self.blocks[0].level
+
+    @property
+    def level(self):
+        return self.blocks[-1].level
+
+    @property
+    def hash(self):
+        return self.blocks[-1].hash
+
+    def at_level(self, level):
+        """
+        Returns the operations of the batch at a level.
+
+        Parameters:
+            level (int):  Level of a block of the batch.
+
+        Returns:
+            dict:  Operations at the level, by operation class
+        """
+        return dict((cls, [item for item in items if item.level == level]) for cls, items in self.operations.items())
+
+
+class Rollback(object):
+    """
+    A reorganization of the chain.  Everything processed above `level` is no longer on the chain.
+
+    Attributes:
+        level (int):  Level of the last processed block still on the chain.
+        hash (str):  Hash of the last processed block still on the chain.
+        previous_level (int):  Level of the last processed block before the reorganization.
+        previous_hash (str):  Hash of the last processed block before the reorganization.
+    """
+    __slots__ = ('level', 'hash', 'previous_level', 'previous_hash')
+
+    def __init__(self, level, hash, previous_level, previous_hash):
+        self.level = level
+        self.hash = hash
+        self.previous_level = previous_level
+        self.previous_hash = previous_hash
+
+    def __repr__(self):
+        return '<%s %s level=%r, hash=%r, previous_level=%r, previous_hash=%r>' % (self.__class__.__name__, id(self), self.level, self.hash, self.previous_level, self.previous_hash)
+
+
+class Follower(object):
+    """
+    Follows the chain from a checkpoint, delivering new blocks and operations in batches and reorganizations as rollbacks.
+
+    Attributes:
+        level (int):  Level of the last processed block.
+        hash (str):  Hash of the last processed block.
+        head (Head):  The last head seen.
+        operations (list):  The `(operation class, filters)` fetched with each batch.
+        history (deque):  The `(level, hash)` of the last processed blocks, used to find where a reorganization forked.
+    """
+
+    def __init__(self, level=None, hash=None, operations=None, callback=None, interval=5, max_levels=100, depth=64, domain=None):
+        """
+        Parameters:
+            level (int, optional):  Level of the last processed block.  The follower resumes at the following level.  Defaults to the level of the head when the follower first polls.
+            hash (str, optional):  Hash of the last processed block, checked on the first poll.  Defaults to the hash of the block at `level` when it is first fetched.
+            operations (list, optional):  Operation classes (e.g. `Transaction`) fetched for each batch, or `(operation class, filters)` pairs, such as `(Transaction, dict(target='KT1...'))`.
+            callback (callable, optional):  Called with each event (Batch or Rollback) as it is produced.
+            interval (float, optional):  Seconds between two polls once the follower caught up with the head.  Defaults to 5.
+            max_levels (int, optional):  Maximum number of levels fetched in one batch.  Defaults to 100.
+            depth (int, optional):  Number of processed blocks remembered to find where a reorganization forked.  Defaults to 64.
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+        """
+        self.level = level
+        self.hash = hash
+        self.operations = [item if isinstance(item, (tuple, list)) else (item, dict()) for item in operations or ()]
+        self.callback = callback
+        self.interval = interval
+        self.max_levels = max_levels
+        self.history = deque(maxlen=depth)
+        self.head = None
+        self.kwargs = dict(domain=domain) if domain else dict()
+        self._stopped = threading.Event()
+        if level is not None and hash is not None:
+            self.history.append((level, hash))
+
+    def __repr__(self):
+        return '<%s %s level=%r, hash=%r, operations=%r>' % (self.__class__.__name__, id(self), self.level, self.hash, [cls.__name__ for cls, _ in self.operations])
+
+    def __iter__(self):
+        return self.events()
+
+    def __aiter__(self):
+        return self.aevents()
+
+    @property
+    def caught_up(self):
+        return self.head is not None and self.level is not None and self.level >= self.head.level
+
+    def blocks(self, first, last):
+        return Block.get(level__ge=first, level__le=last, sort__asc='level', limit=last - first + 1, **self.kwargs)
+
+    def fork_point(self, history):
+        """
+        Returns the `(level, hash)` of the highest remembered block still on the chain.
+        """
+        first, last = history[0][0], history[-1][0]
+        hashes = dict(Block.get(level__ge=first, level__le=last, sort__asc='level', limit=last - first + 1, fields=['level', 'hash'], tuples=True, **self.kwargs))
+        for level, hash in reversed(history):
+            if hashes.get(level) == hash:
+                return level, hash
+        raise ReorgTooDeep('None of the %i blocks processed up to level %i is on the chain anymore' % (len(history), last))
+
+    def collect(self):
+        """
+        Fetches the changes since the last processed block, without applying them.
+
+        Returns:
+            tuple:  The head, the `(level, hash)` of the last processed block, and the list of events (Rollback or Batch)
+        """
+        head = Head.get(**self.kwargs)
+        level, hash = self.level, self.hash
+        if level is None:
+            return head, (head.level, head.hash), []
+        if (head.level == level and head.hash == hash) or (head.level < level and hash is None):
+            return head, (level, hash), []
+
+        events = []
+        last = max(level, min(head.level, level + self.max_levels))
+        blocks = self.blocks(level, last)
+        known = blocks[0] if blocks and blocks[0].level == level else None
+        if hash is None and known is not None:
+            hash = known.hash
+        checkpoint = (self.level, hash)
+        if known is None or known.hash != hash:
+            level, hash = self.fork_point(list(self.history) or [(level, hash)])
+            events.append(Rollback(level, hash, self.level, checkpoint[1]))
+            last = max(level, min(head.level, level + self.max_levels))
+            blocks = self.blocks(level + 1, last) if last > level else []
+        else:
+            blocks = blocks[1:]
+
+        if blocks:
+            operations = dict()
+            for cls, filters in self.operations:
+                operations[cls] = list(cls.iter(level__gt=level, level__le=blocks[-1].level, **dict(filters, **self.kwargs)))
+            events.append(Batch(head, blocks, operations))
+        return head, checkpoint, events
+
+    def apply(self, head, checkpoint, events):
+        """
+        Moves the checkpoint of the follower past the collected events, and passes each event to the callback.
+
+        Returns:
+            list:  The events
+        """
+        self.head = head
+        self.level, self.hash = checkpoint
+        if not self.history:
+            self.history.append(checkpoint)
+        for event in events:
+            if isinstance(event, Rollback):
+                while self.history and self.history[-1][0] > event.level:
+                    self.history.pop()
+            else:
+                self.history.extend((block.level, block.hash) for block in event.blocks)
+            self.level, self.hash = event.level, event.hash
+            if self.callback is not None:
+                self.callback(event)
+        return events
+
+    def poll(self):
+        """
+        Fetches and applies the changes since the last processed block.
+
+        Returns:
+            list:  Events (Rollback or Batch), in order
+
+        Examples:
+            >>> follower = Follower(level=2000000, operations=[Transaction])
+            >>> events = follower.poll()
+        """
+        return self.apply(*self.collect())
+
+    async def apoll(self, client=None):
+        """
+        Asynchronous version of `poll`, using the default AsyncClient unless a `client` is given.
+        """
+        from .aio import get_default_async_client
+        client = client or get_default_async_client()
+        return self.apply(*await client.call(self.collect))
+
+    def stop(self):
+        """
+        Stops `run`, `events` and their asynchronous versions after the current poll.
+        """
+        self._stopped.set()
+
+    def events(self):
+        """
+        Polls the chain until the follower is stopped, yielding each event.  Polls follow each other without waiting until the follower caught up with the head.
+
+        Returns:
+            generator:  Events (Rollback or Batch)
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            for event in self.poll():
+                yield event
+            if self.caught_up:
+                self._stopped.wait(self.interval)
+
+    async def aevents(self, client=None):
+        """
+        Asynchronous version of `events`, using the default AsyncClient unless a `client` is given.
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            for event in await self.apoll(client):
+                yield event
+            if self.caught_up and not self._stopped.is_set():
+                await asyncio.sleep(self.interval)
+
+    def run(self):
+        """
+        Polls the chain until the follower is stopped, passing each event to the callback.
+
+        Examples:
+            >>> follower = Follower(operations=[Transaction], callback=handle)
+            >>> threading.Thread(target=follower.run).start()
+        """
+        for _ in self.events():
+            pass
+
+    async def arun(self, client=None):
+        """
+        Asynchronous version of `run`.
+        """
+        async for _ in self.aevents(client):
+            pass
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Follow new blocks')
+    parser.add_argument('-d', '--domain', type=str, default=Block.domain, help='tzKT domain to fetch data from')
+    parser.add_argument('-l', '--level', type=int, default=None, help='Level of the last processed block')
+    parser.add_argument('-i', '--interval', type=float, default=5, help='Seconds between two polls')
+
+    args = parser.parse_args()
+    follower = Follower(level=args.level, interval=args.interval, domain=args.domain)
+    for event in follower:
+        if isinstance(event, Rollback):
+            print('rollback to %i (%s)' % (event.level, event.hash))
+        else:
+            for block in event.blocks:
+                print('%i %s %s' % (block.level, block.hash, block.timestamp))
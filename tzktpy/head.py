@@ -4,6 +4,26 @@ __all__ = ('Head', )
 
 class Head(Base):
     __slots__ = ('cycle', 'level', 'hash', 'protocol', 'timestamp', 'voting_epoch', 'voting_period', 'known_level', 'last_sync', 'synced', 'quote_level', 'quote_btc', 'quote_eur', 'quote_usd', 'quote_cny', 'quote_jpy', 'quote_krw', 'quote_eth')
+    api_fields = (
+        ('cycle', 'cycle'),
+        ('level', 'level'),
+        ('hash', 'hash'),
+        ('protocol', 'protocol'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('votingEpoch', 'voting_epoch'),
+        ('votingPeriod', 'voting_period'),
+        ('knownLevel', 'known_level'),
+        ('lastSync', 'last_sync', 'to_datetime'),
+        ('synced', 'synced'),
+        ('quoteLevel', 'quote_level'),
+        ('quoteBtc', 'quote_btc'),
+        ('quoteEur', 'quote_eur'),
+        ('quoteUsd', 'quote_usd'),
+        ('quoteCny', 'quote_cny'),
+        ('quoteJpy', 'quote_jpy'),
+        ('quoteKrw', 'quote_krw'),
+        ('quoteEth', 'quote_eth'),
+    )
 
     def __init__(self, cycle, level, hash, protocol, timestamp, voting_epoch, voting_period, known_level, last_sync, synced, quote_level, quote_btc, quote_eur, quote_usd, quote_cny, quote_jpy, quote_krw, quote_eth):
         self.cycle = cycle
@@ -28,32 +48,6 @@ class Head(Base):
     def __repr__(self):
         return '<%s %s cycle=%r, level=%r, hash=%r, protocol=%r, timestamp=%s, usd=%r>' % (self.__class__.__name__, id(self), self.cycle, self.level, self.hash, self.protocol, self.timestamp, self.quote_usd)
 
-    @classmethod
-    def from_api(cls, data):
-        cycle = data['cycle']
-        level = data['level']
-        hash = data['hash']
-        protocol = data['protocol']
-        timestamp = data['timestamp']
-        voting_epoch = data['votingEpoch']
-        voting_period = data['votingPeriod']
-        known_level = data['knownLevel']
-        last_sync = data['lastSync']
-        synced = data['synced']
-        quote_level = data['quoteLevel']
-        quote_btc = data['quoteBtc']
-        quote_eur = data['quoteEur']
-        quote_usd = data['quoteUsd']
-        quote_cny = data['quoteCny']
-        quote_jpy = data['quoteJpy']
-        quote_krw = data['quoteKrw']
-        quote_eth = data['quoteEth']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        if last_sync:
-            last_sync = cls.to_datetime(last_sync)
-        return cls(cycle, level, hash, protocol, timestamp, voting_epoch, voting_period, known_level, last_sync, synced, quote_level, quote_btc, quote_eur, quote_usd, quote_cny, quote_jpy, quote_krw, quote_eth)
-
     @classmethod
     def get(cls, **kwargs):
         """
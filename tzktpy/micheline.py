@@ -0,0 +1,90 @@
+"""
+Deferred decoding of heavy Micheline fields.
+
+Parameters, storages, bigmap diffs and contract code make up most of the size of transaction and origination pages, and are rarely read.  When the `micheline_mode` of a class is `defer`, list endpoints request these fields as JSON strings (`micheline=1`), so decoding a page only allocates one string per field instead of a nested structure, and each field is parsed the first time it is accessed.  Only objects defer the decoding:  results returned as tuples (`tuples=True`) or columns (`columns=...`) hold the decoded fields.  When the mode is `drop`, the fields are not requested at all (with `select`) and are None.
+
+Examples:
+    >>> Transaction.micheline_mode = 'defer'
+    >>> transactions = Transaction.get(target='KT1...', limit=10000)
+    >>> transactions[0].parameter  # parsed on access
+    {'entrypoint': 'transfer', 'value': {...}}
+"""
+from .response import get_json_decoder
+__all__ = ('Deferred', 'DeferredField', 'decode_micheline')
+
+# keys holding Micheline values sent as JSON strings:  the value of a parameter, and the key and value of a bigmap diff
+MICHELINE_KEYS = ('key', 'value')
+
+
+def decode_micheline(value, loads=None):
+    """
+    Decodes a Micheline field returned as JSON strings (`micheline=1`):  a storage or code string, a parameter (`{'entrypoint': ..., 'value': '...'}`) or a list of bigmap diffs (`[{'content': {'key': '...', 'value': '...'}}, ...]`).
+
+    Parameters:
+        value (str|dict|list):  The field as returned by the API.
+        loads (callable, optional):  Parses a JSON string.  Defaults to the installed JSON decoder.
+
+    Returns:
+        object:  The field as it is returned without `micheline=1`
+    """
+    loads = loads or get_json_decoder()
+    if isinstance(value, str):
+        try:
+            return loads(value)
+        except ValueError:
+            return value
+    if isinstance(value, list):
+        return [decode_micheline(item, loads) for item in value]
+    if isinstance(value, dict):
+        output = dict(value)
+        for key in MICHELINE_KEYS:
+            if isinstance(output.get(key), str):
+                output[key] = decode_micheline(output[key], loads)
+        if isinstance(output.get('content'), dict):
+            output['content'] = decode_micheline(output['content'], loads)
+        return output
+    return value
+
+
+class Deferred(object):
+    """
+    A Micheline field kept in the form returned by the API until it is accessed.
+
+    Attributes:
+        raw (str|dict|list):  The field as returned by the API with `micheline=1`.
+    """
+    __slots__ = ('raw', )
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def __repr__(self):
+        return '<%s %s size=%r>' % (self.__class__.__name__, id(self), len(self.raw) if isinstance(self.raw, str) else None)
+
+    def load(self):
+        return decode_micheline(self.raw)
+
+
+class DeferredField(object):
+    """
+    Replaces the slot of a Micheline attribute so a Deferred value is decoded (once) when the attribute is read.
+    """
+    __slots__ = ('slot', )
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if isinstance(value, Deferred):
+            value = value.load()
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
@@ -0,0 +1,531 @@
+"""
+Local mirrors of bigmaps.
+
+Looking up keys with `BigMapKey.by_key` costs one request per key.  A BigMapMirror copies the active keys of a bigmap once (`BigMapKey.by_bigmap`), then stays current by replaying the `BigMapUpdate`s of the levels since the last sync, so point lookups are dictionary reads and value filters are reads of a ValueIndex.
+
+The keys are copied at the head level read before the copy starts.  Keys changed while the copy is paged are then updated a second time by the replay, which converges since every update carries the full value of its key.
+
+Examples:
+    >>> ledger = BigMapMirror(1775)
+    >>> ledger.bootstrap()
+    >>> balances = ledger.add_index(convert=int)
+    >>> ledger['tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE']
+    '1000000'
+    >>> holders = balances.range(1000000)  # hashes of the keys with a balance >= 1000000
+    >>> ledger.refresh()  # replays the updates since the last sync
+
+A BigMapHistory keeps every update of a bigmap instead, to answer the value of keys at past levels (the `historical_keys` endpoints) without requests.
+"""
+import json
+import bisect
+from array import array
+from .bigmap import BigMapKey, BigMapUpdate
+from .head import Head
+__all__ = ('BigMapMirror', 'BigMapHistory', 'ValueIndex')
+
+ADD_ACTIONS = frozenset(('add_key', 'update_key'))
+REMOVE_ACTIONS = frozenset(('remove_key', ))
+CLEAR_ACTIONS = frozenset(('allocate', 'remove'))
+
+
+def key_id(key):
+    """
+    Returns a hashable identifier of a bigmap key, which is the key itself unless it is complex (an object or an array).
+    """
+    if isinstance(key, (dict, list)):
+        return json.dumps(key, sort_keys=True, separators=(',', ':'))
+    return key
+
+
+def value_at(value, path):
+    for part in path:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return None
+    return value
+
+
+class ValueIndex(object):
+    """
+    Index of the keys of a mirror by a field of their value.
+
+    Attributes:
+        path (tuple):  Path of the indexed field in the value (e.g. `('balance', )`), or an empty tuple to index the whole value.
+        convert (callable):  Converts the indexed field (e.g. `int` for the string amounts of the API), or None.
+        entries (dict):  The hashes of the keys by indexed value.
+    """
+
+    def __init__(self, path=None, convert=None):
+        self.path = tuple(path.split('.')) if isinstance(path, str) else tuple(path or ())
+        self.convert = convert
+        self.entries = dict()
+        self._sorted = None
+
+    def __repr__(self):
+        return '<%s %s path=%r, values=%r>' % (self.__class__.__name__, id(self), '.'.join(self.path), len(self.entries))
+
+    def indexed_value(self, value):
+        value = value_at(value, self.path)
+        if value is None:
+            return None
+        if self.convert is not None:
+            value = self.convert(value)
+        return key_id(value)
+
+    def add(self, hash, value):
+        value = self.indexed_value(value)
+        if value is None:
+            return
+        hashes = self.entries.get(value)
+        if hashes is None:
+            hashes = self.entries[value] = set()
+            self._sorted = None
+        hashes.add(hash)
+
+    def discard(self, hash, value):
+        value = self.indexed_value(value)
+        hashes = self.entries.get(value)
+        if hashes is None:
+            return
+        hashes.discard(hash)
+        if not hashes:
+            del self.entries[value]
+            self._sorted = None
+
+    def clear(self):
+        self.entries = dict()
+        self._sorted = None
+
+    def eq(self, value):
+        """
+        Returns the hashes of the keys whose indexed field equals `value`.
+
+        Returns:
+            set
+        """
+        if self.convert is not None:
+            value = self.convert(value)
+        return set(self.entries.get(key_id(value), ()))
+
+    def range(self, low=None, high=None):
+        """
+        Returns the hashes of the keys whose indexed field is between `low` (included) and `high` (excluded).
+
+        Returns:
+            set
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self.entries)
+        values = self._sorted
+        start = 0 if low is None else bisect.bisect_left(values, low)
+        end = len(values) if high is None else bisect.bisect_left(values, high)
+        output = set()
+        for value in values[start:end]:
+            output.update(self.entries[value])
+        return output
+
+
+class BigMapMirror(object):
+    """
+    Attributes:
+        ptr (int):  Id of the mirrored bigmap.
+        level (int):  Level the mirror is synced to, or None before `bootstrap`.
+        keys (dict):  The key of each active key hash.
+        values (dict):  The value of each active key hash.
+        hashes (dict):  The hash of each active key, by `key_id` of the key.
+        indexes (dict):  ValueIndexes of the mirror, by path.
+    """
+
+    def __init__(self, ptr, domain=None):
+        """
+        Parameters:
+            ptr (int):  Id of the bigmap to mirror.
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+        """
+        self.ptr = ptr
+        self.level = None
+        self.keys = dict()
+        self.values = dict()
+        self.hashes = dict()
+        self.indexes = dict()
+        self.kwargs = dict(domain=domain) if domain else dict()
+
+    def __repr__(self):
+        return '<%s %s ptr=%r, level=%r, keys=%r>' % (self.__class__.__name__, id(self), self.ptr, self.level, len(self.values))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.keys.values())
+
+    def __contains__(self, key):
+        return self.hash_of(key) is not None
+
+    def __getitem__(self, key):
+        hash = self.hash_of(key)
+        if hash is None:
+            raise KeyError(key)
+        return self.values[hash]
+
+    def hash_of(self, key):
+        """
+        Returns the hash of an active key given as a hash (`expr...`) or as a plain key, or None.
+        """
+        if isinstance(key, str) and key in self.values:
+            return key
+        return self.hashes.get(key_id(key))
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a key given as a hash (`expr...`) or as a plain key.
+
+        Parameters:
+            key (str|dict|list):  The key, or its hash.
+            default (object, optional):  Returned when the key is not active.  Defaults to None.
+
+        Returns:
+            object
+        """
+        hash = self.hash_of(key)
+        return default if hash is None else self.values[hash]
+
+    def get_many(self, keys, default=None):
+        """
+        Returns the value of each key, in order.
+
+        Returns:
+            list
+        """
+        return [self.get(key, default) for key in keys]
+
+    def items(self):
+        """
+        Returns the `(key, value)` of every active key.
+
+        Returns:
+            generator
+        """
+        for hash, key in self.keys.items():
+            yield key, self.values[hash]
+
+    def add_index(self, path=None, convert=None):
+        """
+        Indexes the keys of the mirror by a field of their value.  The index is kept current as updates are applied.
+
+        Parameters:
+            path (str, optional):  Dot-separated path of the field in the value (e.g. `balance` or `metadata.decimals`).  Defaults to the whole value.
+            convert (callable, optional):  Converts the indexed field, e.g. `int` so amounts are compared as numbers.
+
+        Returns:
+            ValueIndex
+        """
+        index = ValueIndex(path, convert)
+        for hash, value in self.values.items():
+            index.add(hash, value)
+        self.indexes['.'.join(index.path)] = index
+        return index
+
+    def find(self, value, path=None):
+        """
+        Returns the keys whose value (or the field of their value at `path`) equals `value`, using the index of `path`.
+
+        Returns:
+            list
+        """
+        index = self.indexes[path or '']
+        return [self.keys[hash] for hash in index.eq(value)]
+
+    def where(self, predicate):
+        """
+        Returns the `(key, value)` of the keys whose value matches `predicate(value)`, scanning every key.
+
+        Returns:
+            list
+        """
+        return [(self.keys[hash], value) for hash, value in self.values.items() if predicate(value)]
+
+    def set(self, hash, key, value):
+        previous = self.values.get(hash)
+        if hash in self.values:
+            for index in self.indexes.values():
+                index.discard(hash, previous)
+        self.keys[hash] = key
+        self.values[hash] = value
+        self.hashes[key_id(key)] = hash
+        for index in self.indexes.values():
+            index.add(hash, value)
+
+    def remove(self, hash):
+        if hash not in self.values:
+            return
+        value = self.values.pop(hash)
+        key = self.keys.pop(hash)
+        self.hashes.pop(key_id(key), None)
+        for index in self.indexes.values():
+            index.discard(hash, value)
+
+    def clear(self):
+        self.keys = dict()
+        self.values = dict()
+        self.hashes = dict()
+        for index in self.indexes.values():
+            index.clear()
+
+    def apply(self, updates):
+        """
+        Applies BigMapUpdates (e.g. the ones delivered by `events.EventClient.subscribe_bigmaps`), in order.  Updates of other bigmaps are ignored.
+
+        Returns:
+            int:  Number of updates applied
+        """
+        count = 0
+        for update in updates:
+            if update.bigmap != self.ptr:
+                continue
+            content = update.content or dict()
+            if update.action in ADD_ACTIONS:
+                self.set(content.get('hash'), content.get('key'), content.get('value'))
+            elif update.action in REMOVE_ACTIONS:
+                self.remove(content.get('hash'))
+            elif update.action in CLEAR_ACTIONS:
+                self.clear()
+            if self.level is None or update.level > self.level:
+                self.level = update.level
+            count += 1
+        return count
+
+    def bootstrap(self, **kwargs):
+        """
+        Copies the active keys of the bigmap, and replays the updates made while they were paged.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of keys per page.  Defaults to 10000.
+
+        Returns:
+            BigMapMirror:  The mirror
+        """
+        limit = kwargs.pop('limit', 10000)
+        level = Head.get(**self.kwargs).level
+        self.clear()
+        for key in BigMapKey.iter(self.ptr, method='by_bigmap', active=True, limit=limit, **self.kwargs):
+            self.set(key.hash, key.key, key.value)
+        self.level = level
+        self.refresh()
+        return self
+
+    def refresh(self, **kwargs):
+        """
+        Applies the updates of the levels after the level of the mirror, up to the current head.  A mirror that was not bootstrapped yet is bootstrapped instead.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of updates per page.  Defaults to 10000.
+
+        Returns:
+            int:  Number of updates applied
+        """
+        if self.level is None:
+            self.bootstrap(**kwargs)
+            return 0
+        limit = kwargs.pop('limit', 10000)
+        head = Head.get(**self.kwargs)
+        if head.level <= self.level:
+            return 0
+        updates = BigMapUpdate.iter(bigmap=self.ptr, level__gt=self.level, level__le=head.level, limit=limit, **self.kwargs)
+        count = self.apply(updates)
+        self.level = head.level
+        return count
+
+
+class BigMapHistory(object):
+    """
+    Versioned index of a bigmap built from its update history, answering point-in-time queries without requests.
+
+    The updates of each key are stored as parallel arrays sorted by level (and update id within a level), so the value of a key at a level is found by binary search.  Removals store a None value, and the updates clearing the whole bigmap (`allocate`, `remove`) are kept apart.
+
+    Attributes:
+        ptr (int):  Id of the bigmap.
+        level (int):  Level the history is synced to, or None before `load`.
+        keys (dict):  The key of each key hash.
+        levels (dict):  The levels of the updates of each key hash (`array` of int).
+        ids (dict):  The ids of the updates of each key hash (`array` of int).
+        values (dict):  The values set by the updates of each key hash (None for removals).
+        clears (list):  The `(level, id)` of the updates clearing the bigmap.
+    """
+
+    def __init__(self, ptr, domain=None):
+        """
+        Parameters:
+            ptr (int):  Id of the bigmap.
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+        """
+        self.ptr = ptr
+        self.level = None
+        self.keys = dict()
+        self.hashes = dict()
+        self.levels = dict()
+        self.ids = dict()
+        self.values = dict()
+        self.clears = []
+        self.kwargs = dict(domain=domain) if domain else dict()
+
+    def __repr__(self):
+        return '<%s %s ptr=%r, level=%r, keys=%r, updates=%r>' % (self.__class__.__name__, id(self), self.ptr, self.level, len(self.keys), sum(len(levels) for levels in self.levels.values()))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def hash_of(self, key):
+        """
+        Returns the hash of a key given as a hash (`expr...`) or as a plain key, or None if the key was never set.
+        """
+        if isinstance(key, str) and key in self.levels:
+            return key
+        return self.hashes.get(key_id(key))
+
+    def record(self, hash, key, level, id, value):
+        levels = self.levels.get(hash)
+        if levels is None:
+            levels = self.levels[hash] = array('q')
+            self.ids[hash] = array('q')
+            self.values[hash] = []
+            self.keys[hash] = key
+            self.hashes[key_id(key)] = hash
+        levels.append(level)
+        self.ids[hash].append(id)
+        self.values[hash].append(value)
+
+    def apply(self, updates):
+        """
+        Records BigMapUpdates, which must be given in order (of their ids).  Updates of other bigmaps are ignored.
+
+        Returns:
+            int:  Number of updates recorded
+        """
+        count = 0
+        for update in updates:
+            if update.bigmap != self.ptr:
+                continue
+            content = update.content or dict()
+            if update.action in ADD_ACTIONS:
+                self.record(content.get('hash'), content.get('key'), update.level, update.id, content.get('value'))
+            elif update.action in REMOVE_ACTIONS:
+                self.record(content.get('hash'), content.get('key'), update.level, update.id, None)
+            elif update.action in CLEAR_ACTIONS:
+                self.clears.append((update.level, update.id))
+            if self.level is None or update.level > self.level:
+                self.level = update.level
+            count += 1
+        return count
+
+    def load(self, **kwargs):
+        """
+        Pages the whole update history of the bigmap, up to the current head.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of updates per page.  Defaults to 10000.
+
+        Returns:
+            BigMapHistory:  The history
+        """
+        self.refresh(**kwargs)
+        return self
+
+    def refresh(self, **kwargs):
+        """
+        Records the updates of the levels after the level of the history, up to the current head.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of updates per page.  Defaults to 10000.
+
+        Returns:
+            int:  Number of updates recorded
+        """
+        limit = kwargs.pop('limit', 10000)
+        head = Head.get(**self.kwargs)
+        if self.level is not None and head.level <= self.level:
+            return 0
+        filters = dict(level__le=head.level)
+        if self.level is not None:
+            filters['level__gt'] = self.level
+        count = self.apply(BigMapUpdate.iter(bigmap=self.ptr, limit=limit, **dict(filters, **self.kwargs)))
+        self.level = head.level
+        return count
+
+    def last_clear(self, level):
+        index = bisect.bisect_right(self.clears, (level, float('inf'))) - 1
+        return self.clears[index] if index >= 0 else None
+
+    def hash_value_at(self, hash, level, clear=None):
+        levels = self.levels[hash]
+        index = bisect.bisect_right(levels, level) - 1
+        if index < 0:
+            return None
+        if clear is not None and clear > (levels[index], self.ids[hash][index]):
+            return None
+        return self.values[hash][index]
+
+    def value_at(self, key, level, default=None):
+        """
+        Returns the value of a key at a level.
+
+        Parameters:
+            key (str|dict|list):  The key, or its hash.
+            level (int):  The level.
+            default (object, optional):  Returned when the key is not active at the level.  Defaults to None.
+
+        Returns:
+            object
+
+        Examples:
+            >>> history = BigMapHistory(1775).load()
+            >>> balance = history.value_at('tz1WEHHVMWxQUtkWAgrJBFGXjJ5YqZVgfPVE', 1600000)
+        """
+        hash = self.hash_of(key)
+        if hash is None:
+            return default
+        value = self.hash_value_at(hash, level, self.last_clear(level))
+        return default if value is None else value
+
+    def values_at(self, key, levels, default=None):
+        """
+        Returns the value of a key at each level, in order.
+
+        Returns:
+            list
+        """
+        return [self.value_at(key, level, default) for level in levels]
+
+    def state_at(self, level):
+        """
+        Reconstructs the active keys of the bigmap at a level.
+
+        Returns:
+            dict:  The value of each active key hash
+
+        Examples:
+            >>> snapshot = history.state_at(1600000)
+            >>> balances = dict((history.keys[hash], value) for hash, value in snapshot.items())
+        """
+        clear = self.last_clear(level)
+        output = dict()
+        for hash in self.levels:
+            value = self.hash_value_at(hash, level, clear)
+            if value is not None:
+                output[hash] = value
+        return output
+
+    def changes(self, key):
+        """
+        Returns the `(level, value)` of every update of a key, in order (None for removals).
+
+        Returns:
+            list
+        """
+        hash = self.hash_of(key)
+        if hash is None:
+            return []
+        return list(zip(self.levels[hash], self.values[hash]))
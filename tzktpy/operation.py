@@ -38,6 +38,7 @@ Baking
 """
 
 from .base import Base, Period
+from .exception import TZKTException
 __all__ = ('Operation', 'Endorsement', 'Ballot', 'Proposal', 'Activation', 'DoubleBaking', 'DoubleEndorsing', 'NonceRevelation', 'Delegation', 'Origination', 'Transaction', 'Reveal', 'Migration', 'RevelationPenalty', 'Baking')
 
 
@@ -51,6 +52,8 @@ class OperationBase(Base):
         block (str):  The hash representing the block that stores the operation
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block')
+    pagination_cursor = 'id'
+    pagination_id_parameters = dict(by_address='lastId')
 
     def __init__(self, type, id, level, timestamp, block):
         self.type = type
@@ -75,6 +78,9 @@ class OperationBase(Base):
 
         Keyword Parameters:
             micheline (int):  Format of the parameters, storage and diffs: 0 - JSON, 1 - JSON string, 2 - raw micheline, 3 - raw micheline string
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -85,16 +91,60 @@ class OperationBase(Base):
             >>> operations_group = Operation.by_hash(hash)
         """
         path = 'v1/operations/%s' % hash
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = dict()
         quote = kwargs.pop('quote', None)
         if quote:
             params['quote'] = quote
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
+        cls._raise_for_error(response)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
+    @classmethod
+    def by_hashes(cls, hashes, **kwargs):
+        """
+        Fetches the operations of many hashes at once using `by_hash` of the class (e.g. `Transaction.by_hashes` only returns transactions).  Hashes are deduplicated, responses cached by the client are reused, and the other hashes are fetched concurrently.  A hash that cannot be fetched (e.g. a malformed or unknown hash, reported with a TZKTException carrying the errors of the API) does not abort the batch:  the exception it raised is returned in its place.
+
+        Parameters:
+            hashes (iterable):  Operation hashes
+
+        Keyword Parameters:
+            concurrency (int, optional):  Maximum number of hashes fetched at the same time.  Defaults to 8.
+            quote (list|tuple|set):  list of ticker symbols to inject historical prices into response
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+
+        Returns:
+            list:  The operations of each hash (a list, or the exception raised while fetching them), in the order of `hashes`
+
+        Examples:
+            >>> results = Transaction.by_hashes(hashes, concurrency=16)
+            >>> failed = [hash for hash, result in zip(hashes, results) if isinstance(result, Exception)]
+        """
+        concurrency = kwargs.pop('concurrency', 8)
+        hashes = list(hashes)
+        unique = list(dict.fromkeys(hashes))
+        results = cls.map_concurrent(cls.by_hash, unique, concurrency, return_exceptions=True, **kwargs)
+        results = dict(zip(unique, results))
+        return [results[hash] for hash in hashes]
+
+    @classmethod
+    async def aby_hashes(cls, hashes, **kwargs):
+        """
+        Asynchronous version of `by_hashes`, using the default AsyncClient unless a `client` is given.
+        """
+        concurrency = kwargs.pop('concurrency', 8)
+        hashes = list(hashes)
+        unique = list(dict.fromkeys(hashes))
+        results = await cls.amap_concurrent(cls.by_hash, unique, concurrency, return_exceptions=True, **kwargs)
+        results = dict(zip(unique, results))
+        return [results[hash] for hash in hashes]
+
     @classmethod
     def by_hash_counter(cls, hash, counter, **kwargs):
         """
@@ -106,6 +156,9 @@ class OperationBase(Base):
 
         Keyword Parameters:
             micheline (int):  Format of the parameters, storage and diffs: 0 - JSON, 1 - JSON string, 2 - raw micheline, 3 - raw micheline string
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -117,6 +170,9 @@ class OperationBase(Base):
             >>> operations = Operation.by_hash_counter(hash, counter)
         """
         path = 'v1/operations/%s/%s' % (hash, counter)
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
 
         params = dict()
         micheline = kwargs.pop('micheline', None)
@@ -126,9 +182,10 @@ class OperationBase(Base):
         quote = kwargs.pop('quote', None)
         if quote:
             params['quote'] = quote
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -143,6 +200,9 @@ class OperationBase(Base):
 
         Keyword Parameters:
             micheline (int):  Format of the parameters, storage and diffs: 0 - JSON, 1 - JSON string, 2 - raw micheline, 3 - raw micheline string
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -155,6 +215,9 @@ class OperationBase(Base):
             >>> operations = Operation.by_hash_counter_nonce(hash, counter, nonce)
         """
         path = 'v1/operations/%s/%s/%s' % (hash, counter, nonce)
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
 
         params = dict()
         micheline = kwargs.pop('micheline', None)
@@ -164,9 +227,10 @@ class OperationBase(Base):
         quote = kwargs.pop('quote', None)
         if quote:
             params['quote'] = quote
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -198,6 +262,9 @@ class OperationBase(Base):
             micheline (int):  Format of the parameters, storage and diffs: 0 - JSON, 1 - JSON string, 2 - raw micheline, 3 - raw micheline string
             lastId (int):  Id of the last operation received, which is used as an offset for pagination
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -208,28 +275,51 @@ class OperationBase(Base):
             >>> operations = Operation.by_address(address)
         """
         path = 'v1/accounts/%s/operations' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['type', 'initiator', 'target', 'prevDelegate', 'newDelegate', 'contractManager', 'contractDelegate', 'originatedContract', 'accuser', 'offender', 'baker', 'level', 'timestamp', 'entrypoint', 'parameter', 'status', 'lastId'] + list(cls.pagination_parameters)
         params, param_mappings = cls.prepare_modifiers(kwargs, include=optional_base_params)
         for param in param_mappings.get('type', []):
             params[param] = ','.join(params[param])
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
     def _type_by_hash(cls, type, hash, **kwargs):
         path = 'v1/operations/%s/%s' % (type, hash)
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = dict()
         quote = kwargs.pop('quote', None)
         if quote:
             params['quote'] = quote
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
+        cls._raise_for_error(response)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
+    @classmethod
+    def _raise_for_error(cls, response):
+        """
+        Raises a TZKTException with the errors returned by the API when a request failed, e.g. for a malformed or unknown hash.
+        """
+        if response.ok:
+            return
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        errors = data.get('errors') if isinstance(data, dict) else None
+        raise TZKTException(errors or '%s Error for url: %s' % (response.status_code, response.url))
+
     @classmethod
     def _type_count(cls, type, **kwargs):
         params = dict()
@@ -252,6 +342,14 @@ class Operation(OperationBase):
         hash (str):  The hash representing the operations group containing the operation.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash):
         super(Operation, self).__init__(type, id, level, timestamp, block)
@@ -260,18 +358,6 @@ class Operation(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, block=%r, hash=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.block, self.hash)
 
-    @classmethod
-    def from_api(cls, data):
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        return cls(type, id, level, timestamp, block, hash)
-
 
 class Endorsement(OperationBase):
     """
@@ -287,6 +373,19 @@ class Endorsement(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'delegate', 'slots', 'deposit', 'rewards', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('delegate', 'delegate'),
+        ('slots', 'slots'),
+        ('deposit', 'deposit'),
+        ('rewards', 'rewards'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, delegate, slots, deposit, rewards, quote):
         super(Endorsement, self).__init__(type, id, level, timestamp, block)
@@ -303,24 +402,6 @@ class Endorsement(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, deposit=%r, rewards=%r>' % (self.__class__.__name__, id(self), self.type, self.id, self.level, self.timestamp, self.hash, self.deposit, self.rewards)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Endorsement, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        delegate = data['delegate']
-        slots = data['slots']
-        deposit = data['deposit']
-        rewards = data['rewards']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, delegate, slots, deposit, rewards, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -333,6 +414,9 @@ class Endorsement(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -343,12 +427,16 @@ class Endorsement(OperationBase):
             >>> endorsements = Endorsement.get(level__gt=level)
         """
         path = 'v1/operations/endorsements/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['delegate', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -408,6 +496,20 @@ class Ballot(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'period', 'proposal', 'delegate', 'rolls', 'vote', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('period', 'period', Period.from_api),
+        ('proposal', 'proposal'),
+        ('delegate', 'delegate'),
+        ('rolls', 'rolls'),
+        ('vote', 'vote'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, period, proposal, delegate, rolls, vote, quote):
         super(Ballot, self).__init__(type, id, level, timestamp, block)
@@ -422,28 +524,6 @@ class Ballot(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, period=%r, proposal=%r, vote=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.period, self.proposal, self.vote)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Ballot, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        raw_period = data['period']
-        period = None
-        if raw_period:
-            period = Period.from_api(raw_period)
-        proposal = data['proposal']
-        delegate = data['delegate']
-        rolls = data['rolls']
-        vote = data['vote']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, period, proposal, delegate, rolls, vote, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -459,6 +539,9 @@ class Ballot(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -469,12 +552,16 @@ class Ballot(OperationBase):
             >>> ballots = Ballot.get(level__gt=level)
         """
         path = 'v1/operations/ballots/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['delegate', 'level', 'epoch', 'period', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -534,6 +621,20 @@ class Proposal(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'period', 'proposal', 'delegate', 'rolls','duplicated', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('period', 'period', Period.from_api),
+        ('proposal', 'proposal'),
+        ('delegate', 'delegate'),
+        ('rolls', 'rolls'),
+        ('duplicated', 'duplicated'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, period, proposal, delegate, rolls,duplicated, quote):
         super(Proposal, self).__init__(type, id, level, timestamp, block)
@@ -548,30 +649,6 @@ class Proposal(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, period=%r, proposal=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.period, self.proposal)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Proposal, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-
-        raw_period = data['period']
-        period = None
-        if raw_period:
-            period = Period.from_api(raw_period)
-
-        proposal = data['proposal']
-        delegate = data['delegate']
-        rolls = data['rolls']
-        duplicated = data['duplicated']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, period, proposal, delegate, rolls, duplicated, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -588,6 +665,9 @@ class Proposal(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -598,12 +678,16 @@ class Proposal(OperationBase):
             >>> proposals = Proposal.get(level__gt=level)
         """
         path = 'v1/operations/proposals/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['delegate', 'level', 'epoch', 'period', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -661,6 +745,17 @@ class Activation(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'account', 'balance', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('account', 'account'),
+        ('balance', 'balance'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, account, balance, quote):
         super(Activation, self).__init__(type, id, level, timestamp, block)
@@ -672,22 +767,6 @@ class Activation(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, account=%r, balance=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.account, self.balance)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Activation, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        account = data['account']
-        balance = data['balance']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, account, balance, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -700,6 +779,9 @@ class Activation(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -710,12 +792,16 @@ class Activation(OperationBase):
             >>> activations = Activation.get(level__gt=level)
         """
         path = 'v1/operations/activations/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['account', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -778,6 +864,22 @@ class DoubleBaking(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'accused_level', 'accuser', 'accuser_rewards', 'offender', 'offender_lost_deposits', 'offender_lost_rewards', 'offender_lost_fees', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('accusedLevel', 'accused_level'),
+        ('accuser', 'accuser'),
+        ('accuserRewards', 'accuser_rewards'),
+        ('offender', 'offender'),
+        ('offenderLostDeposits', 'offender_lost_deposits'),
+        ('offenderLostRewards', 'offender_lost_rewards'),
+        ('offenderLostFees', 'offender_lost_fees'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, accused_level, accuser, accuser_rewards, offender, offender_lost_deposits, offender_lost_rewards, offender_lost_fees, quote):
         super(DoubleBaking, self).__init__(type, id, level, timestamp, block)
@@ -794,27 +896,6 @@ class DoubleBaking(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, offender=%r, accuser=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.offender, self.accuser)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(DoubleBaking, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        accused_level = data['accusedLevel']
-        accuser = data['accuser']
-        accuser_rewards = data['accuserRewards']
-        offender = data['offender']
-        offender_lost_deposits = data['offenderLostDeposits']
-        offender_lost_rewards = data['offenderLostRewards']
-        offender_lost_fees = data['offenderLostFees']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, accused_level, accuser, accuser_rewards, offender, offender_lost_deposits, offender_lost_rewards, offender_lost_fees, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -829,6 +910,9 @@ class DoubleBaking(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -839,12 +923,16 @@ class DoubleBaking(OperationBase):
             >>> double_bakings = DoubleBaking.get(level__gt=level)
         """
         path = 'v1/operations/double_baking/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['anyof', 'accuser', 'offender', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -907,6 +995,22 @@ class DoubleEndorsing(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'accused_level', 'accuser', 'accuser_rewards', 'offender', 'offender_lost_deposits', 'offender_lost_rewards', 'offender_lost_fees', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('accusedLevel', 'accused_level'),
+        ('accuser', 'accuser'),
+        ('accuserRewards', 'accuser_rewards'),
+        ('offender', 'offender'),
+        ('offenderLostDeposits', 'offender_lost_deposits'),
+        ('offenderLostRewards', 'offender_lost_rewards'),
+        ('offenderLostFees', 'offender_lost_fees'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, accused_level, accuser, accuser_rewards, offender, offender_lost_deposits, offender_lost_rewards, offender_lost_fees, quote):
         super(DoubleEndorsing, self).__init__(type, id, level, timestamp, block)
@@ -923,27 +1027,6 @@ class DoubleEndorsing(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, offender=%r, accuser=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.offender, self.accuser)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(DoubleEndorsing, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        accused_level = data['accusedLevel']
-        accuser = data['accuser']
-        accuser_rewards = data['accuserRewards']
-        offender = data['offender']
-        offender_lost_deposits = data['offenderLostDeposits']
-        offender_lost_rewards = data['offenderLostRewards']
-        offender_lost_fees = data['offenderLostFees']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, accused_level, accuser, accuser_rewards, offender, offender_lost_deposits, offender_lost_rewards, offender_lost_fees, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -958,6 +1041,9 @@ class DoubleEndorsing(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -968,12 +1054,16 @@ class DoubleEndorsing(OperationBase):
             >>> double_endorsings = DoubleEndorsing.get(level__gt=level)
         """
         path = 'v1/operations/double_endorsing/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['anyof', 'accuser', 'offender', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1019,6 +1109,19 @@ class DoubleEndorsing(OperationBase):
 
 class NonceRevelation(OperationBase):
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'baker', 'baker_rewards', 'sender', 'revealed_level', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('baker', 'baker'),
+        ('bakerRewards', 'baker_rewards'),
+        ('sender', 'sender'),
+        ('revealedLevel', 'revealed_level'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, baker, baker_rewards, sender, revealed_level, quote):
         super(NonceRevelation, self).__init__(type, id, level, timestamp, block)
@@ -1032,24 +1135,6 @@ class NonceRevelation(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, sender=%r, baker=%r, baker_rewards=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.sender, self.baker, self.baker_rewards)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(NonceRevelation, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        baker = data['baker']
-        baker_rewards = data['bakerRewards']
-        sender = data['sender']
-        revealed_level = data['revealedLevel']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, baker, baker_rewards, sender, revealed_level, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1064,6 +1149,9 @@ class NonceRevelation(OperationBase):
             sort (str):  Sorts endorsements by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1074,12 +1162,16 @@ class NonceRevelation(OperationBase):
             >>> nonce_revelations = NonceRevelation.get(level__gt=level)
         """
         path = 'v1/operations/nonce_revelations/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['anyof', 'baker', 'sender', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1147,6 +1239,29 @@ class Delegation(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'counter', 'initiator', 'sender', 'nonce', 'gas_limit', 'gas_used', 'storage_limit', 'storage_used', 'baker_fee', 'amount', 'prev_delegate', 'new_delegate', 'status', 'errors', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('counter', 'counter'),
+        ('initiator', 'initiator'),
+        ('sender', 'sender'),
+        ('nonce', 'nonce'),
+        ('gasLimit', 'gas_limit'),
+        ('gasUsed', 'gas_used'),
+        ('storageLimit', 'storage_limit'),
+        ('storageUsed', 'storage_used'),
+        ('bakerFee', 'baker_fee'),
+        ('amount', 'amount'),
+        ('prevDelegate', 'prev_delegate'),
+        ('newDelegate', 'new_delegate'),
+        ('status', 'status'),
+        ('errors', 'errors'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, counter, initiator, sender, nonce, gas_limit, gas_used, storage_limit, storage_used, baker_fee, amount, prev_delegate, new_delegate, status, errors, quote):
         super(Delegation, self).__init__(type, id, level, timestamp, block)
@@ -1170,34 +1285,6 @@ class Delegation(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, sender=%r, amount=%r, new_delegate=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.sender, self.amount, self.new_delegate)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Delegation, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        counter = data['counter']
-        initiator = data['initiator']
-        sender = data['sender']
-        nonce = data['nonce']
-        gas_limit = data['gasLimit']
-        gas_used = data['gasUsed']
-        storage_limit = data['storageLimit']
-        storage_used = data['storageUsed']
-        baker_fee = data['bakerFee']
-        amount = data['amount']
-        prev_delegate = data['prevDelegate']
-        new_delegate = data['newDelegate']
-        status = data['status']
-        errors = data['errors']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, counter, initiator, sender, nonce, gas_limit, gas_used, storage_limit, storage_used, baker_fee, amount, prev_delegate, new_delegate, status, errors, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1215,6 +1302,9 @@ class Delegation(OperationBase):
             sort (str):  Sorts delegations by specified field. Supported fields: id (default), level, gasUsed, bakerFee.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1225,12 +1315,16 @@ class Delegation(OperationBase):
             >>> delegations = Delegation.get(level__gt=level)
         """
         path = 'v1/operations/delegations/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['anyof', 'initiator', 'sender', 'prevDelegate', 'newDelegate', 'level', 'status', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1276,6 +1370,36 @@ class Delegation(OperationBase):
 
 class Origination(OperationBase):
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'counter', 'initiator', 'sender', 'nonce', 'gas_limit', 'gas_used', 'storage_limit', 'storage_used', 'baker_fee', 'storage_fee', 'allocation_fee', 'contract_balance', 'contract_manager', 'contract_delegate', 'code', 'storage', 'diffs', 'status', 'errors', 'originated_contract', 'quote')
+    micheline_fields = ('code', 'storage', 'diffs')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('counter', 'counter'),
+        ('initiator', 'initiator'),
+        ('sender', 'sender'),
+        ('nonce', 'nonce'),
+        ('gasLimit', 'gas_limit'),
+        ('gasUsed', 'gas_used'),
+        ('storageLimit', 'storage_limit'),
+        ('storageUsed', 'storage_used'),
+        ('bakerFee', 'baker_fee'),
+        ('storageFee', 'storage_fee'),
+        ('allocationFee', 'allocation_fee'),
+        ('contractBalance', 'contract_balance'),
+        ('contractManager', 'contract_manager'),
+        ('contractDelegate', 'contract_delegate'),
+        ('code', 'code'),
+        ('storage', 'storage'),
+        ('diffs', 'diffs'),
+        ('status', 'status'),
+        ('errors', 'errors'),
+        ('originatedContract', 'originated_contract'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, counter, initiator, sender, nonce, gas_limit, gas_used, storage_limit, storage_used, baker_fee, storage_fee, allocation_fee, contract_balance, contract_manager, contract_delegate, code, storage, diffs, status, errors, originated_contract, quote):
         super(Origination, self).__init__(type, id, level, timestamp, block)
@@ -1305,40 +1429,6 @@ class Origination(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, sender=%r, contract_balance=%r, originated_contract=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.sender, self.contract_balance, self.originated_contract)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Origination, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        counter = data['counter']
-        initiator = data['initiator']
-        sender = data['sender']
-        nonce = data['nonce']
-        gas_limit = data['gasLimit']
-        gas_used = data['gasUsed']
-        storage_limit = data['storageLimit']
-        storage_used = data['storageUsed']
-        baker_fee = data['bakerFee']
-        storage_fee = data['storageFee']
-        allocation_fee = data['allocationFee']
-        contract_balance = data['contractBalance']
-        contract_manager = data['contractManager']
-        contract_delegate = data['contractDelegate']
-        code = data['code']
-        storage = data['storage']
-        diffs = data['diffs']
-        status = data['status']
-        errors = data['errors']
-        originated_contract = data['originatedContract']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, counter, initiator, sender, nonce, gas_limit, gas_used, storage_limit, storage_used, baker_fee, storage_fee, allocation_fee, contract_balance, contract_manager, contract_delegate, code, storage, diffs, status, errors, originated_contract, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1359,6 +1449,9 @@ class Origination(OperationBase):
             sort (str):  Sorts originations by specified field. Supported fields: id (default), level, gasUsed, storageUsed, bakerFee, storageFee, allocationFee, contractBalance.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1369,12 +1462,16 @@ class Origination(OperationBase):
             >>> originations = Origination.get(level__gt=level)
         """
         path = 'v1/operations/originations/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['anyof', 'initiator', 'sender', 'contractManager', 'contractDelegate', 'originatedContract', 'typeHash', 'codeHash', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1447,6 +1544,35 @@ class Transaction(OperationBase):
         has_internals (bool):  Indicates if the operation is internal or not.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'counter', 'initiator', 'sender', 'target', 'quote', 'nonce', 'gas_limit', 'gas_used', 'storage_limit', 'storage_used', 'baker_fee', 'storage_fee', 'allocation_fee', 'amount', 'parameter', 'parameters', 'storage', 'diffs', 'status', 'has_internals')
+    micheline_fields = ('parameter', 'storage', 'diffs')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('counter', 'counter'),
+        ('initiator', 'initiator'),
+        ('sender', 'sender'),
+        ('target', 'target'),
+        ('quote', 'quote'),
+        ('nonce', 'nonce'),
+        ('gasLimit', 'gas_limit'),
+        ('gasUsed', 'gas_used'),
+        ('storageLimit', 'storage_limit'),
+        ('storageUsed', 'storage_used'),
+        ('bakerFee', 'baker_fee'),
+        ('storageFee', 'storage_fee'),
+        ('allocationFee', 'allocation_fee'),
+        ('amount', 'amount'),
+        ('parameter', 'parameter'),
+        ('parameters', 'parameters'),
+        ('storage', 'storage'),
+        ('diffs', 'diffs'),
+        ('status', 'status'),
+        ('hasInternals', 'has_internals'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, counter, initiator, sender, target, quote, nonce, gas_limit, gas_used, storage_limit, storage_used, baker_fee, storage_fee, allocation_fee, amount, parameter, parameters, storage, diffs, status, has_internals):
         super(Transaction, self).__init__(type, id, level, timestamp, block)
@@ -1475,39 +1601,6 @@ class Transaction(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, sender=%r, target=%r, amount=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.sender, self.target, self.amount)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Transaction, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        counter = data['counter']
-        initiator = data['initiator']
-        sender = data['sender']
-        target = data['target']
-        quote = data['quote']
-        nonce = data['nonce']
-        gas_limit = data['gasLimit']
-        gas_used = data['gasUsed']
-        storage_limit = data['storageLimit']
-        storage_used = data['storageUsed']
-        baker_fee = data['bakerFee']
-        storage_fee = data['storageFee']
-        allocation_fee = data['allocationFee']
-        amount = data['amount']
-        parameter = data['parameter']
-        parameters = data.get('parameters')
-        storage = data['storage']
-        diffs = data['diffs']
-        status = data['status']
-        has_internals = data['hasInternals']
-        return cls(type, id, level, timestamp, block, hash, counter, initiator, sender, target, quote, nonce, gas_limit, gas_used, storage_limit, storage_used, baker_fee, storage_fee, allocation_fee, amount, parameter, parameters, storage, diffs, status, has_internals)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1528,6 +1621,9 @@ class Transaction(OperationBase):
             sort (str):  Sorts transactions by specified field. Supported fields: id (default), level, gasUsed, storageUsed, bakerFee, storageFee, allocationFee, amount.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1538,11 +1634,15 @@ class Transaction(OperationBase):
             >>> transactions = Transaction.get(level__gt=level)
         """
         path = 'v1/operations/transactions/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['anyof', 'initiator', 'sender', 'target', 'amount', 'level', 'entrypoint', 'parameter', 'status', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1606,6 +1706,22 @@ class Reveal(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'hash', 'sender', 'counter', 'gas_limit', 'gas_used', 'baker_fee', 'status', 'errors', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('hash', 'hash'),
+        ('sender', 'sender'),
+        ('counter', 'counter'),
+        ('gasLimit', 'gas_limit'),
+        ('gasUsed', 'gas_used'),
+        ('bakerFee', 'baker_fee'),
+        ('status', 'status'),
+        ('errors', 'errors'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, hash, sender, counter, gas_limit, gas_used, baker_fee, status, errors, quote):
         super(Reveal, self).__init__(type, id, level, timestamp, block)
@@ -1622,27 +1738,6 @@ class Reveal(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, hash=%r, sender=%r, gas_used=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.hash, self.sender, self.gas_used)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Reveal, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        hash = data['hash']
-        sender = data['sender']
-        counter = data['counter']
-        gas_limit = data['gasLimit']
-        gas_used = data['gasUsed']
-        baker_fee = data['bakerFee']
-        status = data['status']
-        errors = data['errors']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, hash, sender, counter, gas_limit, gas_used, baker_fee, status, errors, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1656,6 +1751,9 @@ class Reveal(OperationBase):
             sort (str):  Sorts reveals by specified field. Supported fields: id (default), level, gasUsed, bakerFee.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1666,12 +1764,16 @@ class Reveal(OperationBase):
             >>> reveals =  Reveal.get(level__gt=level)
         """
         path = 'v1/operations/reveals/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['sender', 'level',  'status', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1729,6 +1831,17 @@ class Migration(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'kind', 'account', 'balance_change', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('kind', 'kind'),
+        ('account', 'account'),
+        ('balanceChange', 'balance_change'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, kind, account, balance_change, quote):
         super(Migration, self).__init__(type, id, level, timestamp, block)
@@ -1740,22 +1853,6 @@ class Migration(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s, kind=%r, account=%r, balance_change=%r,>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.kind, self.account, self.balance_change)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Migration, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        kind = data['kind']
-        account = data['account']
-        balance_change = data['balanceChange']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, kind, account, balance_change, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1771,6 +1868,9 @@ class Migration(OperationBase):
             sort (str):  Sorts migrations by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1781,12 +1881,16 @@ class Migration(OperationBase):
             >>> migrations = Migration.get(level__gt=level)
         """
         path = 'v1/operations/migrations/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['account', 'kind', 'balanceChange', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1832,6 +1936,18 @@ class Migration(OperationBase):
 
 class RevelationPenalty(OperationBase):
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'baker', 'missed_level', 'lost_reward', 'lost_fees', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('baker', 'baker'),
+        ('missedLevel', 'missed_level'),
+        ('lostReward', 'lost_reward'),
+        ('lostFees', 'lost_fees'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, baker, missed_level, lost_reward, lost_fees, quote):
         super(RevelationPenalty, self).__init__(type, id, level, timestamp, block)
@@ -1844,23 +1960,6 @@ class RevelationPenalty(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s baker=%r, missed_level=%r, lost_reward=%s>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.baker, self.missed_level, self.lost_reward)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(RevelationPenalty, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        baker = data['baker']
-        missed_level = data['missedLevel']
-        lost_reward = data['lostReward']
-        lost_fees = data['lostFees']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, baker, missed_level, lost_reward, lost_fees, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1874,6 +1973,9 @@ class RevelationPenalty(OperationBase):
             sort (str):  Sorts migrations by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -1884,12 +1986,16 @@ class RevelationPenalty(OperationBase):
             >>> revelation_penalties = RevelationPenalty.get(level__gt=level)
         """
         path = 'v1/operations/revelation_penalties/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['baker', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -1948,6 +2054,19 @@ class Baking(OperationBase):
         quote (float):  The value of 1.0 tez denominated in the chosen currency.
     """
     __slots__ = ('type', 'id', 'level', 'timestamp', 'block', 'baker', 'priority', 'deposit', 'reward', 'fees', 'quote')
+    api_fields = (
+        ('type', 'type'),
+        ('id', 'id'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('block', 'block'),
+        ('baker', 'baker'),
+        ('priority', 'priority'),
+        ('deposit', 'deposit'),
+        ('reward', 'reward'),
+        ('fees', 'fees'),
+        ('quote', 'quote'),
+    )
 
     def __init__(self, type, id, level, timestamp, block, baker, priority, deposit, reward, fees, quote):
         super(Baking, self).__init__(type, id, level, timestamp, block)
@@ -1961,24 +2080,6 @@ class Baking(OperationBase):
     def __repr__(self):
         return '<%s %s id=%r, level=%r, timestamp=%s baker=%r, priority=%r, reward=%r, fees=%r>' % (self.__class__.__name__, id(self), self.id, self.level, self.timestamp, self.baker, self.priority, self.reward, self.fees)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Baking, cls).from_api(data)
-        type = data['type']
-        id = data['id']
-        level = data['level']
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        block = data['block']
-        baker = data['baker']
-        priority = data['priority']
-        deposit = data['deposit']
-        reward = data['reward']
-        fees = data['fees']
-        quote = data['quote']
-        return cls(type, id, level, timestamp, block, baker, priority, deposit, reward, fees, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -1992,6 +2093,9 @@ class Baking(OperationBase):
             sort (str):  Sorts baking operations by specified field. Supported fields: id (default), level.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -2002,11 +2106,15 @@ class Baking(OperationBase):
             >>> bakings = Baking.get(level__gt=level)
         """
         path = 'v1/operations/baking/'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['baker', 'level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        output = [cls.from_api(item) for item in data]
+        output = cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
         return output
 
     @classmethod
@@ -2058,16 +2166,7 @@ if __name__ == '__main__':
     parser.add_argument('--domain', type=str, default=Operation.domain, help='tzKT domain to fetch data from')
 
     args = parser.parse_args()
-    kwargs = dict(anyof__sender__target=args.address, offset__pg=0, domain=args.domain, limit=args.limit)
-    # page through all pages of operations
-    operations = []
-    transactions_page = Transaction.get(**kwargs)
-    operations += transactions_page
-    while transactions_page:
-        kwargs['offset__pg'] += 1
-        transactions_page = Transaction.get(**kwargs)
-        operations += transactions_page
-
-    operations = sorted(operations, key=lambda x: x.timestamp)
-    for operation in operations:
+    kwargs = dict(anyof__sender__target=args.address, domain=args.domain, limit=args.limit)
+    # page through all operations, in order of id, one page at a time
+    for operation in Transaction.iter(**kwargs):
         print('%r' % operation)
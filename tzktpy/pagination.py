@@ -0,0 +1,287 @@
+"""
+Pagination over list endpoints.
+
+Deep `offset` (and `offset.pg`) pagination gets slower the further the server has to skip, so whenever the endpoint is sorted by a unique, sequential field the Paginator uses cursor offsets (`offset.cr`) on that field instead.  Endpoints that paginate with an explicit id (e.g. `lastId` for `Operation.by_address`) use that parameter.  Results are fetched one page at a time, so memory stays constant regardless of the number of rows scanned.
+
+When the size of a result is large and known in advance, a ParallelPaginator plans every page up front (using the `count` endpoint matching the list endpoint) and fetches pages concurrently on a bounded worker pool, while still yielding them in order.
+"""
+import re
+import asyncio
+import itertools
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+__all__ = ('Paginator', 'ParallelPaginator')
+
+
+class Paginator(object):
+    """
+    Plans the successive requests needed to page through a list endpoint.
+
+    Attributes:
+        endpoint (callable):  The list endpoint, e.g. `Transaction.get`.
+        args (tuple):  Positional arguments passed to the endpoint on every page.
+        kwargs (dict):  Filters passed to the endpoint on every page.
+        limit (int):  Number of items per page.
+        mode (str):  How pages are addressed:  `cursor` (offset.cr), `last_id` (an explicit id parameter) or `offset` (element offset).
+        cursor (str):  The API field used as cursor.
+        done (bool):  Indicates if the last page was fetched.
+        injected (bool):  Indicates if the cursor attribute was added to the requested fields or columns.
+    """
+    sort_keys = ('sort', 'sort__asc', 'sort__desc')
+    offset_keys = ('offset', 'offset__el', 'offset__pg', 'offset__cr')
+
+    def __init__(self, model, method, args, kwargs, limit=None, use_cursor=True):
+        self.model = model
+        self.method = method
+        self.endpoint = getattr(model, method)
+        self.args = args
+        kwargs = dict(kwargs)
+        self.limit = limit or kwargs.pop('limit', None) or model.page_size
+        kwargs.pop('limit', None)
+
+        self.cursor = model.pagination_cursors.get(method, model.pagination_cursor) if use_cursor else None
+        self.attribute = self.to_attribute(self.cursor) if self.cursor else None
+        self.mode = 'offset'
+        self.position = 0
+        self.done = False
+
+        id_parameter = model.pagination_id_parameters.get(method) if use_cursor else None
+        sort_fields = [kwargs[key] for key in self.sort_keys if key in kwargs]
+        if id_parameter:
+            self.mode = 'last_id'
+            self.id_parameter = id_parameter
+            self.position = kwargs.pop(id_parameter, None)
+        elif self.cursor and (not sort_fields or sort_fields == [self.cursor]):
+            self.mode = 'cursor'
+            if not sort_fields:
+                kwargs['sort__asc'] = self.cursor
+            self.position = kwargs.pop('offset__cr', None)
+
+        # the cursor of each page is read from the last row, so it has to be selected;  when it was not requested, it is removed from each page
+        self.cursor_index = None
+        self.injected = False
+        for key in ('columns', 'fields'):
+            names = kwargs.get(key)
+            if self.mode != 'offset' and isinstance(names, (list, tuple)):
+                if self.attribute not in names:
+                    names = kwargs[key] = list(names) + [self.attribute]
+                    self.injected = True
+                if key == 'fields':
+                    self.cursor_index = list(names).index(self.attribute)
+
+        if self.mode == 'offset':
+            self.position = self.pop_offset(kwargs)
+        for key in self.offset_keys:
+            kwargs.pop(key, None)
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return '<%s %s endpoint=%s, mode=%r, cursor=%r, limit=%r, position=%r>' % (self.__class__.__name__, id(self), self.endpoint.__name__, self.mode, self.cursor, self.limit, self.position)
+
+    @classmethod
+    def to_attribute(cls, field):
+        return re.sub('([A-Z])', r'_\1', field).lower()
+
+    def pop_offset(self, kwargs):
+        offset = kwargs.pop('offset', None) or kwargs.pop('offset__el', None)
+        if offset:
+            return offset
+        page = kwargs.pop('offset__pg', None)
+        if page:
+            return page * self.limit
+        return 0
+
+    def next_kwargs(self):
+        """
+        Returns the keyword arguments of the next page request, or None once every page was fetched.
+
+        Returns:
+            dict
+        """
+        if self.done:
+            return None
+        kwargs = dict(self.kwargs)
+        kwargs['limit'] = self.limit
+        if self.mode == 'cursor':
+            if self.position is not None:
+                kwargs['offset__cr'] = self.position
+        elif self.mode == 'last_id':
+            if self.position is not None:
+                kwargs[self.id_parameter] = self.position
+        else:
+            kwargs['offset__el'] = self.position
+        return kwargs
+
+    def advance(self, page):
+        """
+        Moves the paginator past a fetched page.
+
+        Parameters:
+            page (list):  The items returned by the last request.
+        """
+        if len(page) < self.limit:
+            self.done = True
+        if not page:
+            return
+
+        if self.mode == 'offset':
+            self.position += len(page)
+        elif isinstance(page, list):
+            last = page[-1]
+            self.position = last[self.cursor_index] if isinstance(last, tuple) else getattr(last, self.attribute)
+        else:
+            self.position = page.last_value(self.attribute)
+
+    def strip(self, page):
+        """
+        Removes the cursor attribute from a page when it was only selected to paginate.
+
+        Parameters:
+            page (list|Columns):  The items returned by the last request.
+
+        Returns:
+            list|Columns
+        """
+        if not self.injected or not page:
+            return page
+        if not isinstance(page, list):
+            page.drop(self.attribute)
+            return page
+        if isinstance(page[0], tuple):
+            index = self.cursor_index
+            return [item[:index] + item[index + 1:] for item in page]
+        for item in page:
+            setattr(item, self.attribute, None)
+        return page
+
+    def pages(self):
+        """
+        Yields each page of results, fetching the next page only once the previous one was consumed.
+        """
+        kwargs = self.next_kwargs()
+        while kwargs is not None:
+            page = self.endpoint(*self.args, **kwargs)
+            self.advance(page)
+            if page:
+                yield self.strip(page)
+            kwargs = self.next_kwargs()
+
+    async def apages(self, client):
+        """
+        Asynchronous version of `pages`.
+
+        Parameters:
+            client (AsyncClient):  The client used to fetch each page.
+        """
+        kwargs = self.next_kwargs()
+        while kwargs is not None:
+            page = await client.call(self.endpoint, *self.args, **kwargs)
+            self.advance(page)
+            if page:
+                yield self.strip(page)
+            kwargs = self.next_kwargs()
+
+
+class ParallelPaginator(Paginator):
+    """
+    Fetches the pages of a list endpoint concurrently using element offsets.  The number of pages is planned from the matching count endpoint (see `count_methods` on the model class);  when the count is not available (e.g. the count endpoint does not accept the given filters), pages are requested in waves until a partial page is returned.
+
+    Attributes:
+        concurrency (int):  Maximum number of pages requested at the same time.
+        total (int):  Number of items to fetch, or None if unknown.
+    """
+    count_ignored_keys = ('fields', 'columns', 'tuples', 'limit')
+
+    def __init__(self, model, method, args, kwargs, limit=None, concurrency=8):
+        if method in model.pagination_id_parameters:
+            raise ValueError('%s.%s paginates by id and cannot be fetched in parallel' % (model.__name__, method))
+        super(ParallelPaginator, self).__init__(model, method, args, kwargs, limit=limit, use_cursor=False)
+        self.concurrency = max(1, concurrency)
+        self.total = None
+
+    def count(self):
+        """
+        Returns the number of items matching the filters of the paginator using the matching count endpoint, or None if it cannot be counted.
+
+        Returns:
+            int
+        """
+        count_method = self.model.count_methods.get(self.method)
+        count_endpoint = getattr(self.model, count_method, None) if count_method else None
+        if count_endpoint is None:
+            return None
+        # sorting, paging and projections of the list endpoint are not accepted by count endpoints
+        filters = dict((key, value) for key, value in self.kwargs.items() if not key.startswith('sort') and key not in self.count_ignored_keys)
+        try:
+            return int(count_endpoint(*self.args, **filters))
+        except (ValueError, TypeError):
+            # the count endpoint does not support every filter of the list endpoint
+            return None
+
+    def offsets(self):
+        start = self.position
+        if self.total is None:
+            return itertools.count(start, self.limit)
+        return iter(range(start, self.total, self.limit))
+
+    def fetch(self, offset):
+        kwargs = dict(self.kwargs)
+        kwargs['limit'] = self.limit
+        kwargs['offset__el'] = offset
+        return self.endpoint(*self.args, **kwargs)
+
+    def pages(self):
+        """
+        Yields each page of results in order, while up to `concurrency` pages are being fetched ahead.  Workers run in a copy of the caller's context, so a client bound with `use_client` is used.
+        """
+        self.total = self.count()
+        offsets = self.offsets()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        pending = deque()
+        try:
+            for offset in itertools.islice(offsets, self.concurrency):
+                pending.append(executor.submit(contextvars.copy_context().run, self.fetch, offset))
+
+            while pending:
+                page = pending.popleft().result()
+                if len(page) < self.limit and self.total is None:
+                    self.done = True
+                if page:
+                    yield page
+                if self.done:
+                    break
+                for offset in itertools.islice(offsets, 1):
+                    pending.append(executor.submit(contextvars.copy_context().run, self.fetch, offset))
+            self.done = True
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def apages(self, client):
+        """
+        Asynchronous version of `pages`.
+
+        Parameters:
+            client (AsyncClient):  The client used to fetch each page.
+        """
+        self.total = await client.call(self.count)
+        offsets = self.offsets()
+        pending = deque()
+        try:
+            for offset in itertools.islice(offsets, self.concurrency):
+                pending.append(asyncio.ensure_future(client.call(self.fetch, offset)))
+
+            while pending:
+                page = await pending.popleft()
+                if len(page) < self.limit and self.total is None:
+                    self.done = True
+                if page:
+                    yield page
+                if self.done:
+                    break
+                for offset in itertools.islice(offsets, 1):
+                    pending.append(asyncio.ensure_future(client.call(self.fetch, offset)))
+            self.done = True
+        finally:
+            for future in pending:
+                future.cancel()
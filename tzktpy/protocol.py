@@ -4,6 +4,15 @@ __all__ = ('Protocol', )
 
 class Protocol(Base):
     __slots__ = ('code', 'hash', 'first_level', 'last_level', 'constants', 'metadata')
+    api_fields = (
+        ('code', 'code'),
+        ('hash', 'hash'),
+        ('firstLevel', 'first_level'),
+        ('lastLevel', 'last_level'),
+        ('constants', 'constants'),
+        ('metadata', 'metadata'),
+    )
+    pagination_cursor = 'code'
 
     def __init__(self, code, hash, first_level, last_level, constants, metadata):
         self.code = code
@@ -20,17 +29,6 @@ class Protocol(Base):
         alias = self.metadata.get('alias')
         return '<%s %s code=%r, hash=%r, first_level=%r, last_level=%s, alias=%r>' % (self.__class__.__name__, id(self), self.code, self.hash, self.first_level, self.last_level, alias)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Protocol, cls).from_api(data)
-        code = data['code']
-        hash = data['hash']
-        first_level = data['firstLevel']
-        last_level = data['lastLevel']
-        constants = data['constants']
-        metadata = data['metadata']
-        return cls(code, hash, first_level, last_level, constants, metadata)
-
     @classmethod
     def count(cls, **kwargs):
         """
@@ -59,6 +57,9 @@ class Protocol(Base):
             sort (str):  Sorts protocols by specified field. Supported fields: id (default), code, firstLevel, lastLevel.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -68,10 +69,14 @@ class Protocol(Base):
             >>> protocols = Protocol.get()
         """
         path = 'v1/protocols'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params, _ = cls.prepare_modifiers(kwargs, include=cls.pagination_parameters)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_code(cls, code, **kwargs):
@@ -1,9 +1,29 @@
+import bisect
+from array import array
 from .base import Base
-__all__ = ('Quote', )
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+__all__ = ('Quote', 'QuoteTable')
+
+NAN = float('nan')
 
 
 class Quote(Base):
     __slots__ = ('level', 'timestamp', 'btc', 'eur', 'usd', 'cny', 'jpy', 'krw', 'eth')
+    api_fields = (
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('btc', 'btc'),
+        ('eur', 'eur'),
+        ('usd', 'usd'),
+        ('cny', 'cny'),
+        ('jpy', 'jpy'),
+        ('krw', 'krw'),
+        ('eth', 'eth'),
+    )
+    pagination_cursor = 'level'
 
     def __init__(self, level, timestamp, btc, eur, usd, cny, jpy, krw, eth):
         self.level = level
@@ -19,22 +39,6 @@ class Quote(Base):
     def __repr__(self):
         return '<%s %s level=%r, timestamp=%r, usd=%r>' % (self.__class__.__name__, id(self), self.level, self.timestamp, self.usd)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Quote, cls).from_api(data)
-        level = data['level']
-        timestamp = data['timestamp']
-        btc = data['btc']
-        eur = data['eur']
-        usd = data['usd']
-        cny = data['cny']
-        jpy = data['jpy']
-        krw = data['krw']
-        eth = data['eth']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(level, timestamp, btc, eur, usd, cny, jpy, krw, eth)
-
     @classmethod
     def last(cls, **kwargs):
         """
@@ -65,6 +69,9 @@ class Quote(Base):
             sort (str):  Sorts quotes by specified field. Supported fields: level (default).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -74,11 +81,15 @@ class Quote(Base):
             >>> quotes = Quote.get(level__gt=150000)
         """
         path = 'v1/quotes'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
@@ -100,6 +111,149 @@ class Quote(Base):
         return int(value)
 
 
+class QuoteTable(object):
+    """
+    Historical quotes of a range of levels, stored as one column (`array` of floats) per currency keyed by level, to value amounts at their levels without passing `quote` to every request.
+
+    Attributes:
+        currencies (tuple):  Currencies of the table.
+        levels (array):  Levels of the quotes, in order.
+        columns (dict):  The quotes of each currency, aligned with `levels` (NaN where the API has no quote).
+    """
+    currencies = ('btc', 'eur', 'usd', 'cny', 'jpy', 'krw', 'eth')
+
+    def __init__(self, domain=None):
+        """
+        Parameters:
+            domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
+        """
+        self.levels = array('q')
+        self.columns = dict((currency, array('d')) for currency in self.currencies)
+        self.domain = domain
+
+    def __repr__(self):
+        return '<%s %s first_level=%r, level=%r, quotes=%r>' % (self.__class__.__name__, id(self), self.levels[0] if self.levels else None, self.level, len(self.levels))
+
+    def __len__(self):
+        return len(self.levels)
+
+    @property
+    def level(self):
+        return self.levels[-1] if self.levels else None
+
+    def append(self, level, values):
+        self.levels.append(level)
+        for currency, value in zip(self.currencies, values):
+            self.columns[currency].append(NAN if value is None else value)
+
+    def fetch(self, start=None, end=None, **kwargs):
+        """
+        Pages the quotes of a range of levels.
+
+        Parameters:
+            start (int, optional):  First level of the range.  Defaults to the first quote.
+            end (int, optional):  Level at which the range stops (excluded).  Defaults to the last quote.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of quotes per page.  Defaults to 10000.
+
+        Returns:
+            int:  Number of quotes added
+
+        Examples:
+            >>> table = QuoteTable()
+            >>> table.fetch(2000000)
+        """
+        limit = kwargs.pop('limit', 10000)
+        if self.domain:
+            kwargs['domain'] = self.domain
+        if self.levels:
+            # quotes are kept in level order, so the table only grows at its end
+            start = self.levels[-1] + 1 if start is None else max(start, self.levels[-1] + 1)
+        if start is not None:
+            kwargs['level__ge'] = start
+        if end is not None:
+            kwargs['level__lt'] = end
+        count = 0
+        for row in Quote.iter(fields=['level'] + list(self.currencies), tuples=True, limit=limit, **kwargs):
+            self.append(row[0], row[1:])
+            count += 1
+        return count
+
+    def refresh(self, **kwargs):
+        """
+        Adds the quotes of the levels after the last level of the table, up to the last known quote.  The last quote (`Quote.last`) is checked first, and appended directly when it immediately follows the table.  An empty table fetches every quote.
+
+        Keyword Parameters:
+            limit (int, optional):  Number of quotes per page.  Defaults to 10000.
+
+        Returns:
+            int:  Number of quotes added
+        """
+        count = len(self.levels)
+        last = Quote.last(domain=self.domain) if self.domain else Quote.last()
+        if self.levels and last.level <= self.levels[-1]:
+            return 0
+        if not self.levels or last.level > self.levels[-1] + 1:
+            self.fetch(end=last.level, **kwargs)
+        self.append(last.level, [getattr(last, currency) for currency in self.currencies])
+        return len(self.levels) - count
+
+    def index_of(self, level):
+        return bisect.bisect_right(self.levels, level) - 1
+
+    def price(self, level, currency):
+        """
+        Returns the price of 1 tez in a currency at a level (the last quote at or before the level).
+
+        Returns:
+            float:  The price, or NaN when the table has no quote at or before the level
+        """
+        index = self.index_of(level)
+        return self.columns[currency][index] if index >= 0 else NAN
+
+    def prices(self, levels, currency):
+        """
+        Returns the price of 1 tez in a currency at each level.
+
+        Returns:
+            numpy.ndarray|list:  float64 array when NumPy is installed
+        """
+        column = self.columns[currency]
+        if numpy is not None:
+            levels = numpy.asarray(levels, dtype='int64')
+            indexes = numpy.searchsorted(numpy.frombuffer(self.levels, dtype='int64'), levels, side='right') - 1
+            prices = numpy.frombuffer(column, dtype='float64')
+            output = numpy.full(len(levels), NAN)
+            found = indexes >= 0
+            output[found] = prices[indexes[found]]
+            return output
+        return [self.price(level, currency) for level in levels]
+
+    def convert(self, levels, mutez, currency):
+        """
+        Values amounts at the price of their levels.
+
+        Parameters:
+            levels (list|numpy.ndarray):  Level of each amount (e.g. the `level` column of operations).
+            mutez (list|numpy.ndarray):  The amounts, in microtez.
+            currency (str):  One of btc, eur, usd, cny, jpy, krw or eth.
+
+        Returns:
+            numpy.ndarray|list:  The value of each amount in the currency (float64 array when NumPy is installed)
+
+        Examples:
+            >>> columns = Transaction.get(sender='tz1...', columns=['level', 'amount'])
+            >>> values = table.convert(columns['level'], columns['amount'], 'usd')
+        """
+        if currency not in self.columns:
+            raise ValueError('%r is not a valid currency.  Valid currencies are: %s' % (currency, ', '.join(self.currencies)))
+        prices = self.prices(levels, currency)
+        if numpy is not None:
+            return numpy.asarray(mutez, dtype='float64') / 1000000 * prices
+        return [amount / 1000000 * price if amount is not None else NAN for amount, price in zip(mutez, prices)]
+
+
 if __name__ == '__main__':
     import argparse
     parser = argparse.ArgumentParser(description='Fetch latest Quote')
@@ -0,0 +1,121 @@
+"""
+Lightweight response returned by the clients.  It implements the subset of `requests.Response` used by the endpoints, and parses the raw body bytes with a pluggable JSON decoder.
+
+The default decoder is `orjson.loads` when orjson is installed, and the standard library `json.loads` otherwise, which is given the body decoded to text (as `requests` does) since it parses text faster than bytes.  Any callable accepting bytes can be installed with `set_json_decoder`, or given to a single client.
+
+Examples:
+    >>> import simdjson
+    >>> set_json_decoder(simdjson.loads)
+    >>> client = Client(json_decoder=json.loads)  # this client keeps using the standard library
+"""
+import json
+import threading
+import requests
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+__all__ = ('Response', 'get_json_decoder', 'set_json_decoder')
+
+default_json_decoder = orjson.loads if orjson is not None else json.loads
+_json_decoder = default_json_decoder
+
+
+def get_json_decoder():
+    """
+    Returns the callable used to parse the body of responses.
+
+    Returns:
+        callable
+    """
+    return _json_decoder
+
+
+def set_json_decoder(loads):
+    """
+    Replaces the callable used to parse the body of responses.
+
+    Parameters:
+        loads (callable):  Parses JSON from bytes, e.g. `orjson.loads`.  None restores the default decoder.
+
+    Returns:
+        callable:  The previous decoder
+    """
+    global _json_decoder
+    previous = _json_decoder
+    _json_decoder = default_json_decoder if loads is None else loads
+    return previous
+
+
+class SharedJSON(object):
+    """
+    Decodes the body of a response once on behalf of every caller sharing it (see `Response.shared`).
+    """
+    __slots__ = ('value', 'done', 'lock')
+
+    def __init__(self):
+        self.value = None
+        self.done = False
+        self.lock = threading.Lock()
+
+    def get(self, decode):
+        if not self.done:
+            with self.lock:
+                if not self.done:
+                    self.value = decode()
+                    self.done = True
+        return self.value
+
+
+class Response(object):
+    __slots__ = ('status_code', 'headers', 'url', 'content', 'encoding', 'decoder', 'memo')
+
+    def __init__(self, status_code, headers, url, content, encoding=None, decoder=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+        self.decoder = decoder
+        self.memo = None
+
+    def __repr__(self):
+        return '<%s [%s]>' % (self.__class__.__name__, self.status_code)
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', 'replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError('%s Error for url: %s' % (self.status_code, self.url), response=self)
+
+    def json(self, **kwargs):
+        if kwargs:
+            # options are specific to the standard library decoder
+            return json.loads(self.text, **kwargs)
+        if self.memo is not None:
+            return self.memo.get(self.decode)
+        return self.decode()
+
+    def decode(self):
+        decoder = self.decoder or _json_decoder
+        if decoder is json.loads:
+            # the standard library parses text faster than bytes, whose encoding it has to detect first
+            return decoder(self.text)
+        return decoder(self.content)
+
+    def shared(self):
+        """
+        Returns a copy of the response for callers sharing a single request (see `SingleFlight`).  The body of the copy is decoded once, and every caller receives the same decoded value, which must therefore be treated as read-only.
+
+        Returns:
+            Response
+        """
+        output = self.__class__(self.status_code, self.headers, self.url, self.content, self.encoding, self.decoder)
+        output.memo = SharedJSON()
+        return output
@@ -4,6 +4,58 @@ __all__ = ('Reward', )
 
 class Reward(Base):
     __slots__ = ('cycle', 'staking_balance', 'delegated_balance', 'num_delegators', 'expected_blocks', 'expected_endorsements', 'future_blocks', 'future_block_rewards', 'future_block_deposits', 'own_blocks', 'own_block_rewards', 'extra_blocks', 'extra_block_rewards', 'missed_own_blocks', 'missed_own_block_rewards', 'missed_extra_blocks', 'missed_extra_block_rewards', 'uncovered_own_blocks', 'uncovered_own_block_rewards', 'uncovered_extra_blocks', 'uncovered_extra_block_rewards', 'block_deposits', 'future_endorsements', 'future_endorsement_rewards', 'future_endorsement_deposits', 'endorsements', 'endorsement_rewards', 'missed_endorsements', 'missed_endorsement_rewards', 'uncovered_endorsements', 'uncovered_endorsement_rewards', 'endorsement_deposits', 'own_block_fees', 'extra_block_fees', 'missed_own_block_fees', 'missed_extra_block_fees', 'uncovered_own_block_fees', 'uncovered_extra_block_fees', 'double_baking_rewards', 'double_baking_lost_deposits', 'double_baking_lost_rewards', 'double_baking_lost_fees', 'double_endorsing_rewards', 'double_endorsing_lost_deposits', 'double_endorsing_lost_fees', 'revelation_rewards', 'revelation_lost_fees', 'quote')
+    api_fields = (
+        ('cycle', 'cycle'),
+        ('stakingBalance', 'staking_balance'),
+        ('delegatedBalance', 'delegated_balance'),
+        ('numDelegators', 'num_delegators'),
+        ('expectedBlocks', 'expected_blocks'),
+        ('expectedEndorsements', 'expected_endorsements'),
+        ('futureBlocks', 'future_blocks'),
+        ('futureBlockRewards', 'future_block_rewards'),
+        ('futureBlockDeposits', 'future_block_deposits'),
+        ('ownBlocks', 'own_blocks'),
+        ('ownBlockRewards', 'own_block_rewards'),
+        ('extraBlocks', 'extra_blocks'),
+        ('extraBlockRewards', 'extra_block_rewards'),
+        ('missedOwnBlocks', 'missed_own_blocks'),
+        ('missedOwnBlockRewards', 'missed_own_block_rewards'),
+        ('missedExtraBlocks', 'missed_extra_blocks'),
+        ('missedExtraBlockRewards', 'missed_extra_block_rewards'),
+        ('uncoveredOwnblocks', 'uncovered_own_blocks'),
+        ('uncoveredOwnBlockRewards', 'uncovered_own_block_rewards'),
+        ('uncoveredExtraBlocks', 'uncovered_extra_blocks'),
+        ('uncoveredExtraBlockRewards', 'uncovered_extra_block_rewards'),
+        ('blockDeposits', 'block_deposits'),
+        ('futureEndorsements', 'future_endorsements'),
+        ('futureEndorsementRewards', 'future_endorsement_rewards'),
+        ('futureEndorsementDeposits', 'future_endorsement_deposits'),
+        ('endorsements', 'endorsements'),
+        ('endorsementRewards', 'endorsement_rewards'),
+        ('missedEndorsements', 'missed_endorsements'),
+        ('missedEndorsementRewards', 'missed_endorsement_rewards'),
+        ('uncoveredEndorsements', 'uncovered_endorsements'),
+        ('uncoveredEndorsementRewards', 'uncovered_endorsement_rewards'),
+        ('endorsementDeposits', 'endorsement_deposits'),
+        ('ownBlockFees', 'own_block_fees'),
+        ('extraBlockFees', 'extra_block_fees'),
+        ('missedOwnBlockFees', 'missed_own_block_fees'),
+        ('missedExtraBlockFees', 'missed_extra_block_fees'),
+        ('uncoveredOwnBlockFees', 'uncovered_own_block_fees'),
+        ('uncoveredExtraBlockFees', 'uncovered_extra_block_fees'),
+        ('doubleBakingRewards', 'double_baking_rewards'),
+        ('doubleBakingLostDeposits', 'double_baking_lost_deposits'),
+        ('doubleBakingLostRewards', 'double_baking_lost_rewards'),
+        ('doubleBakingLostFees', 'double_baking_lost_fees'),
+        ('doubleEndorsingRewards', 'double_endorsing_rewards'),
+        ('doubleEndorsingLostDeposits', 'double_endorsing_lost_deposits'),
+        ('doubleEndorsingLostFees', 'double_endorsing_lost_fees'),
+        ('revelationRewards', 'revelation_rewards'),
+        ('revelationLostFees', 'revelation_lost_fees'),
+        ('quote', 'quote'),
+    )
+    pagination_cursor = 'cycle'
+    count_methods = dict(by_baker='baker_count', by_delegator='delegator_count')
 
     def __init__(self, cycle, staking_balance, delegated_balance, num_delegators, expected_blocks, expected_endorsements, future_blocks, future_block_rewards, future_block_deposits, own_blocks, own_block_rewards, extra_blocks, extra_block_rewards, missed_own_blocks, missed_own_block_rewards, missed_extra_blocks, missed_extra_block_rewards, uncovered_own_blocks, uncovered_own_block_rewards, uncovered_extra_blocks, uncovered_extra_block_rewards, block_deposits, future_endorsements, future_endorsement_rewards, future_endorsement_deposits, endorsements, endorsement_rewards, missed_endorsements, missed_endorsement_rewards, uncovered_endorsements, uncovered_endorsement_rewards, endorsement_deposits, own_block_fees, extra_block_fees, missed_own_block_fees, missed_extra_block_fees, uncovered_own_block_fees, uncovered_extra_block_fees, double_baking_rewards, double_baking_lost_deposits, double_baking_lost_rewards, double_baking_lost_fees, double_endorsing_rewards, double_endorsing_lost_deposits, double_endorsing_lost_fees, revelation_rewards, revelation_lost_fees, quote):
         self.cycle = cycle
@@ -58,59 +110,6 @@ class Reward(Base):
     def __repr__(self):
         return '<%s %s cycle=%s, staking_balance=%r, num_delegators=%r, delegated_balance=%s, expected_blocks=%s, expected_endorsements=%s>' % (self.__class__.__name__, id(self), self.cycle, self.staking_balance, self.delegated_balance, self.num_delegators, self.expected_blocks, self.expected_endorsements)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Reward, cls).from_api(data)
-        cycle = data['cycle']
-        staking_balance = data['stakingBalance']
-        delegated_balance = data['delegatedBalance']
-        num_delegators = data['numDelegators']
-        expected_blocks = data['expectedBlocks']
-        expected_endorsements = data['expectedEndorsements']
-        future_blocks = data['futureBlocks']
-        future_block_rewards = data['futureBlockRewards']
-        future_block_deposits = data['futureBlockDeposits']
-        own_blocks = data['ownBlocks']
-        own_block_rewards = data['ownBlockRewards']
-        extra_blocks = data['extraBlocks']
-        extra_block_rewards = data['extraBlockRewards']
-        missed_own_blocks = data['missedOwnBlocks']
-        missed_own_block_rewards = data['missedOwnBlockRewards']
-        missed_extra_blocks = data['missedExtraBlocks']
-        missed_extra_block_rewards = data['missedExtraBlockRewards']
-        uncovered_own_blocks = data['uncoveredOwnblocks']
-        uncovered_own_block_rewards = data['uncoveredOwnBlockRewards']
-        uncovered_extra_blocks = data['uncoveredExtraBlocks']
-        uncovered_extra_block_rewards = data['uncoveredExtraBlockRewards']
-        block_deposits = data['blockDeposits']
-        future_endorsements = data['futureEndorsements']
-        future_endorsement_rewards = data['futureEndorsementRewards']
-        future_endorsement_deposits = data['futureEndorsementDeposits']
-        endorsements = data['endorsements']
-        endorsement_rewards = data['endorsementRewards']
-        missed_endorsements = data['missedEndorsements']
-        missed_endorsement_rewards = data['missedEndorsementRewards']
-        uncovered_endorsements = data['uncoveredEndorsements']
-        uncovered_endorsement_rewards = data['uncoveredEndorsementRewards']
-        endorsement_deposits = data['endorsementDeposits']
-        own_block_fees = data['ownBlockFees']
-        extra_block_fees = data['extraBlockFees']
-        missed_own_block_fees = data['missedOwnBlockFees']
-        missed_extra_block_fees = data['missedExtraBlockFees']
-        uncovered_own_block_fees = data['uncoveredOwnBlockFees']
-        uncovered_extra_block_fees = data['uncoveredExtraBlockFees']
-        double_baking_rewards = data['doubleBakingRewards']
-        double_baking_lost_deposits = data['doubleBakingLostDeposits']
-        double_baking_lost_rewards = data['doubleBakingLostRewards']
-        double_baking_lost_fees = data['doubleBakingLostFees']
-        double_endorsing_rewards = data['doubleEndorsingRewards']
-        double_endorsing_lost_deposits = data['doubleEndorsingLostDeposits']
-        double_endorsing_lost_fees = data['doubleEndorsingLostFees']
-        revelation_rewards = data['revelationRewards']
-        revelation_lost_fees = data['revelationLostFees']
-        quote = data['quote']
-        return cls(cycle, staking_balance, delegated_balance, num_delegators, expected_blocks, expected_endorsements, future_blocks, future_block_rewards, future_block_deposits, own_blocks, own_block_rewards, extra_blocks, extra_block_rewards, missed_own_blocks, missed_own_block_rewards, missed_extra_blocks, missed_extra_block_rewards, uncovered_own_blocks, uncovered_own_block_rewards, uncovered_extra_blocks, uncovered_extra_block_rewards, block_deposits, future_endorsements, future_endorsement_rewards, future_endorsement_deposits, endorsements, endorsement_rewards, missed_endorsements, missed_endorsement_rewards, uncovered_endorsements, uncovered_endorsement_rewards, endorsement_deposits, own_block_fees, extra_block_fees, missed_own_block_fees, missed_extra_block_fees, uncovered_own_block_fees, uncovered_extra_block_fees, double_baking_rewards, double_baking_lost_deposits, double_baking_lost_rewards, double_baking_lost_fees, double_endorsing_rewards, double_endorsing_lost_deposits, double_endorsing_lost_fees, revelation_rewards, revelation_lost_fees, quote)
-
     @classmethod
     def baker_count(cls, address, **kwargs):
         """
@@ -147,6 +146,9 @@ class Reward(Base):
             sort (str):  Sorts cycle rewards by specified field. Supported fields: cycle (default, desc).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -157,11 +159,15 @@ class Reward(Base):
             >>> baker_cycle_rewards_count = Reward.by_baker(address)
         """
         path = 'v1/rewards/bakers/%s' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params, _ = cls.prepare_modifiers(kwargs, include=cls.pagination_parameters)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_baker_cycle(cls, address, cycle, **kwargs):
@@ -231,6 +237,9 @@ class Reward(Base):
             sort (str):  Sorts cycle rewards by specified field. Supported fields: cycle (default, desc).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -241,11 +250,15 @@ class Reward(Base):
             >>> delegator_cycle_rewards = Reward.by_delegator(address)
         """
         path = 'v1/rewards/delegators/%s' % address
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params, _ = cls.prepare_modifiers(kwargs, include=cls.pagination_parameters)
 
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_delegator_cycle(cls, address, cycle, **kwargs):
@@ -4,6 +4,16 @@ __all__ = ('Right', )
 
 class Right(Base):
     __slots__ = ('type', 'cycle', 'level', 'timestamp', 'priority', 'slots', 'baker', 'status')
+    api_fields = (
+        ('type', 'type'),
+        ('cycle', 'cycle'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('priority', 'priority'),
+        ('slots', 'slots'),
+        ('baker', 'baker'),
+        ('status', 'status'),
+    )
 
     def __init__(self, type, cycle, level, timestamp, priority, slots, baker, status):
         self.type = type
@@ -18,21 +28,6 @@ class Right(Base):
     def __repr__(self):
         return '<%s %s type=%r, cycle=%r, level=%r, timestamp=%r, priority=%r, status=%r>' % (self.__class__.__name__, id(self), self.type, self.cycle, self.level, self.timestamp, self.priority, self.status)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Right, cls).from_api(data)
-        type = data['type'],
-        cycle = data['cycle'],
-        level = data['level'],
-        timestamp = data['timestamp'],
-        priority = data['priority'],
-        slots = data['slots'],
-        baker = data['baker'],
-        status = data['status']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(type, cycle, level, timestamp, priority, slots, baker, status)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -49,6 +44,9 @@ class Right(Base):
             sort (str):  Sorts rights by specified field. Supported fields: level (default). Support sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -57,12 +55,16 @@ class Right(Base):
         Example:
             >>> baking_rights = Right.get(type='baking')
         """
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_params = ['type', 'baker', 'cycle', 'level', 'slots', 'priority', 'status'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_params)
         path = 'v1/rights'
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
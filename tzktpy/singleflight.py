@@ -0,0 +1,126 @@
+"""
+Coalescing of identical requests in flight.
+
+Workers following the chain often ask for the same thing at the same moment (`Head.get()`, `Protocol.current()`, `Block.by_level(n)` for a level every worker just saw).  A SingleFlight lets the first caller send the request while every identical request arriving before it completes waits for, and shares, that result.  Callers sharing a response also share its decoded body, so a hot key is fetched and parsed once however many threads (or asyncio tasks, with AsyncSingleFlight) ask for it.
+
+Both clients coalesce GET requests by default.
+
+Examples:
+    >>> client = Client(coalesce=False)  # every call sends its own request
+"""
+import asyncio
+import threading
+import weakref
+__all__ = ('SingleFlight', 'AsyncSingleFlight')
+
+
+class Call(object):
+    __slots__ = ('event', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Thread-safe coalescing of calls by key.
+    """
+
+    def __init__(self):
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s in_flight=%r>' % (self.__class__.__name__, id(self), len(self._calls))
+
+    def do(self, key, function, share=None):
+        """
+        Calls `function`, unless a call with the same key is already in flight, in which case its result is awaited instead.  Exceptions raised by the call are raised in every caller.
+
+        Parameters:
+            key (hashable):  Identifies identical calls, e.g. the cache key of a request.
+            function (callable):  Called without arguments.
+            share (callable, optional):  Called on the result when it is shared by several callers, e.g. `Response.shared`.  The value it returns is given to every caller.
+
+        Returns:
+            object:  The result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            if call.error is None and shared and share is not None:
+                result = share(result)
+            call.result = None if call.error is not None else result
+            call.event.set()
+        return result
+
+
+class AsyncSingleFlight(object):
+    """
+    Coalescing of coroutine calls by key within each event loop.  The call runs in a task of its own, so a caller being cancelled does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        self._calls = weakref.WeakKeyDictionary()
+
+    def __repr__(self):
+        return '<%s %s in_flight=%r>' % (self.__class__.__name__, id(self), sum(len(calls) for calls in self._calls.values()))
+
+    async def do(self, key, function, share=None):
+        """
+        Asynchronous version of `SingleFlight.do`.
+
+        Parameters:
+            key (hashable):  Identifies identical calls.
+            function (callable):  Returns the awaitable to run, called without arguments.
+            share (callable, optional):  Called on the result when it is shared by several callers.
+
+        Returns:
+            object:  The result of the call
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._calls.get(loop)
+        if calls is None:
+            calls = self._calls[loop] = dict()
+
+        entry = calls.get(key)
+        if entry is None:
+            entry = [None, 0]
+
+            async def run():
+                try:
+                    result = await function()
+                finally:
+                    if calls.get(key) is entry:
+                        del calls[key]
+                if entry[1] and share is not None:
+                    result = share(result)
+                return result
+            entry[0] = asyncio.ensure_future(run())
+            calls[key] = entry
+        else:
+            entry[1] += 1
+        return await asyncio.shield(entry[0])
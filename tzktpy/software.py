@@ -4,6 +4,15 @@ __all__ = ('Software', )
 
 class Software(Base):
     __slots__ = ('short_hash', 'first_level', 'first_time', 'last_level', 'last_time', 'blocks_count', 'metadata')
+    api_fields = (
+        ('shortHash', 'short_hash'),
+        ('firstLevel', 'first_level'),
+        ('firstTime', 'first_time', 'to_datetime'),
+        ('lastLevel', 'last_level'),
+        ('lastTime', 'last_time', 'to_datetime'),
+        ('blocksCount', 'blocks_count'),
+        ('metadata', 'metadata'),
+    )
 
     def __init__(self, short_hash, first_level, first_time, last_level, last_time, blocks_count, metadata):
         self.short_hash = short_hash
@@ -20,22 +29,6 @@ class Software(Base):
             version = self.metadata['version']
         return '<%s %s short_hash=%r, version=%r, first_level=%r, last_level=%r, block_count=%r>' % (self.__class__.__name__, id(self), self.short_hash, version, self.first_level, self.last_level, self.blocks_count)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Software, cls).from_api(data)
-        shortHash = data['shortHash']
-        firstLevel = data['firstLevel']
-        firstTime = data['firstTime']
-        lastLevel = data['lastLevel']
-        lastTime = data['lastTime']
-        blocksCount = data['blocksCount']
-        metadata = data['metadata']
-        if firstTime:
-            firstTime = cls.to_datetime(firstTime)
-        if lastTime:
-            lastTime = cls.to_datetime(lastTime)
-        return cls(shortHash, firstLevel, firstTime, lastLevel, lastTime, blocksCount, metadata)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -45,6 +38,9 @@ class Software(Base):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), firstLevel, lastLevel, blocksCount.  Support sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -54,10 +50,14 @@ class Software(Base):
             >>> software = Software.get()
         """
         path = 'v1/software'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
@@ -74,7 +74,7 @@ class Software(Base):
             >>> software_count = Software.count()
         """
         path = 'v1/software/count'
-        response = cls._request(path)
+        response = cls._request(path, **kwargs)
         data = response.content
         return int(data)
 
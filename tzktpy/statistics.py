@@ -4,6 +4,23 @@ __all__ = ('Statistics', )
 
 class Statistics(Base):
     __slots__ = ('cycle', 'date', 'level', 'timestamp', 'total_supply', 'circulating_supply', 'total_bootstrapped', 'total_commitments', 'total_activated', 'total_created', 'total_burned', 'total_vested', 'total_frozen', 'quote')
+    api_fields = (
+        ('cycle', 'cycle'),
+        ('date', 'date', 'to_datetime'),
+        ('level', 'level'),
+        ('timestamp', 'timestamp', 'to_datetime'),
+        ('totalSupply', 'total_supply'),
+        ('circulatingSupply', 'circulating_supply'),
+        ('totalBootstrapped', 'total_bootstrapped'),
+        ('totalCommitments', 'total_commitments'),
+        ('totalActivated', 'total_activated'),
+        ('totalCreated', 'total_created'),
+        ('totalBurned', 'total_burned'),
+        ('totalVested', 'total_vested'),
+        ('totalFrozen', 'total_frozen'),
+        ('quote', 'quote'),
+    )
+    pagination_cursors = dict(get='level', cyclic='cycle')
 
     def __init__(self, cycle, date, level, timestamp, total_supply, circulating_supply, total_bootstrapped, total_commitments, total_activated, total_created, total_burned, total_vested, total_frozen, quote):
         self.cycle = cycle
@@ -24,32 +41,6 @@ class Statistics(Base):
     def __repr__(self):
         return '<%s %s cycle=%r, date=%r, level=%r, timestamp=%r, total_supply=%r, circulating_supply=%r>' % (self.__class__.__name__, id(self), self.cycle, self.date, self.level, self.timestamp, self.total_supply, self.circulating_supply)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Statistics, cls).from_api(data)
-        cycle = data['cycle']
-        date = data['date']
-        level = data['level']
-        timestamp = data['timestamp']
-        total_supply = data['totalSupply']
-        circulating_supply = data['circulatingSupply']
-        total_bootstrapped = data['totalBootstrapped']
-        total_commitments = data['totalCommitments']
-        total_activated = data['totalActivated']
-        total_created = data['totalCreated']
-        total_burned = data['totalBurned']
-        total_vested = data['totalVested']
-        total_frozen = data['totalFrozen']
-        quote = data['quote']
-        date = data['date']
-        if date:
-            date = cls.to_datetime(date)
-
-        timestamp = data['timestamp']
-        if timestamp:
-            timestamp = cls.to_datetime(timestamp)
-        return cls(cycle, date, level, timestamp, total_supply, circulating_supply, total_bootstrapped, total_commitments, total_activated, total_created, total_burned, total_vested, total_frozen, quote)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -61,6 +52,9 @@ class Statistics(Base):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), level, cycle, date. Support sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -70,14 +64,18 @@ class Statistics(Base):
             >>> statistics = Statistics.get(level__gt=150000)
         """
         path = 'v1/statistics'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['level', 'timestamp'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
         quote = kwargs.get('quote')
         if quote:
             params['quote'] = quote
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def daily(cls, **kwargs):
@@ -89,6 +87,9 @@ class Statistics(Base):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), level, cycle, date.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -98,14 +99,18 @@ class Statistics(Base):
             >>> daily_statistics = Statistics.daily()
         """
         path = 'v1/statistics/daily'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         quote = kwargs.pop('quote', None)
         optional_base_params = ['date'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
         if quote:
             params['quote'] = quote
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def cyclic(cls, **kwargs):
@@ -117,6 +122,9 @@ class Statistics(Base):
             sort (str):  Sorts delegators by specified field. Supported fields: id (default), level, cycle, date.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -126,14 +134,18 @@ class Statistics(Base):
             >>> daily_statistics = Statistics.cyclic()
         """
         path = 'v1/statistics/cyclic'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         quote = kwargs.pop('quote', None)
         optional_base_params = ['cycle'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
         if quote:
             params['quote'] = quote
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def current(cls, **kwargs):
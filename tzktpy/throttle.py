@@ -0,0 +1,201 @@
+"""
+Rate limiting and retries used by the clients.
+
+A RateLimiter keeps one token bucket per tzKT domain.  Buckets are thread-safe and are shared by every thread (and every model class) sending requests through the clients the limiter is given to, so a scan running on many workers stays under the limits of the API as a whole.  When the API throttles a request anyway, the bucket of that domain is paused for the time given by the `Retry-After` header of the response.
+
+A RetryPolicy retries idempotent requests that failed with a transient error (a connection error, a timeout, `429 Too Many Requests` or a `5xx` status) using exponential backoff with full jitter.
+
+Examples:
+    >>> limiter = RateLimiter(rate=10, burst=20, limits={'https://api.ghostnet.tzkt.io': (5, 5)})
+    >>> client = Client(rate_limiter=limiter, retry=RetryPolicy(retries=8)).install()
+"""
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+__all__ = ('TokenBucket', 'RateLimiter', 'RetryPolicy')
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket.
+
+    Attributes:
+        rate (float):  Number of tokens added per second.
+        burst (int):  Maximum number of tokens in the bucket, i.e. the number of requests that can be sent at once.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst or rate))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s rate=%r, burst=%r>' % (self.__class__.__name__, id(self), self.rate, self.burst)
+
+    def reserve(self):
+        """
+        Takes a token from the bucket, going into debt when the bucket is empty.
+
+        Returns:
+            float:  Number of seconds to wait before the request may be sent
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(delay, self.paused_until - now)
+
+    def pause(self, seconds):
+        """
+        Holds back every request for the given number of seconds, e.g. after the API answered `429 Too Many Requests`.
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class RateLimiter(object):
+    """
+    Per-domain rate limits.
+
+    Attributes:
+        rate (float):  Default number of requests per second for each domain, or None for no limit.
+        burst (int):  Default number of requests that can be sent at once.  Defaults to `rate`.
+        limits (dict):  `(rate, burst)` tuples overriding the default limits for specific domains.
+    """
+
+    def __init__(self, rate=None, burst=None, limits=None):
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict((domain.rstrip('/'), limit) for domain, limit in (limits or {}).items())
+        self._buckets = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s rate=%r, burst=%r, limits=%r>' % (self.__class__.__name__, id(self), self.rate, self.burst, self.limits)
+
+    def bucket(self, domain):
+        """
+        Returns the token bucket of the given domain, or None if requests to the domain are not limited.
+
+        Returns:
+            TokenBucket
+        """
+        domain = domain.rstrip('/')
+        bucket = self._buckets.get(domain)
+        if bucket is not None or domain in self._buckets:
+            return bucket
+
+        with self._lock:
+            if domain not in self._buckets:
+                rate, burst = self.limits.get(domain, (self.rate, self.burst))
+                self._buckets[domain] = TokenBucket(rate, burst) if rate else None
+            return self._buckets[domain]
+
+    def reserve(self, domain):
+        """
+        Returns the number of seconds to wait before a request to the given domain may be sent.
+
+        Returns:
+            float
+        """
+        bucket = self.bucket(domain)
+        if bucket is None:
+            return 0.0
+        return bucket.reserve()
+
+    def acquire(self, domain):
+        """
+        Blocks until a request to the given domain may be sent.
+        """
+        delay = self.reserve(domain)
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, domain, seconds):
+        bucket = self.bucket(domain)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+
+class RetryPolicy(object):
+    """
+    Attributes:
+        retries (int):  Maximum number of retries of a request.
+        backoff (float):  Base delay (seconds) of the exponential backoff.
+        max_backoff (float):  Maximum delay (seconds) between two attempts.
+        statuses (frozenset):  HTTP statuses that are retried.
+        methods (frozenset):  HTTP methods that are retried.
+    """
+    default_statuses = frozenset((429, 500, 502, 503, 504))
+    default_methods = frozenset(('GET', 'HEAD', 'OPTIONS'))
+
+    def __init__(self, retries=5, backoff=0.5, max_backoff=60, statuses=None, methods=None):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = self.default_statuses if statuses is None else frozenset(statuses)
+        self.methods = self.default_methods if methods is None else frozenset(methods)
+
+    def __repr__(self):
+        return '<%s %s retries=%r, backoff=%r, max_backoff=%r>' % (self.__class__.__name__, id(self), self.retries, self.backoff, self.max_backoff)
+
+    def is_retryable(self, method, attempt, response=None):
+        """
+        Indicates if a request should be attempted again.
+
+        Parameters:
+            method (str):  The HTTP method of the request.
+            attempt (int):  Number of attempts made so far.
+            response (Response, optional):  The response received, or None if the request failed with a connection error or a timeout.
+
+        Returns:
+            bool
+        """
+        if attempt > self.retries or method.upper() not in self.methods:
+            return False
+        return response is None or response.status_code in self.statuses
+
+    @classmethod
+    def retry_after(cls, response):
+        """
+        Returns the number of seconds the server asked to wait with the `Retry-After` header of the response, or None.
+
+        Returns:
+            float
+        """
+        if response is None:
+            return None
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def delay(self, attempt, response=None):
+        """
+        Returns the number of seconds to wait before the next attempt.  The delay requested by the server takes precedence over the backoff.
+
+        Parameters:
+            attempt (int):  Number of attempts made so far.
+            response (Response, optional):  The response of the last attempt.
+
+        Returns:
+            float
+        """
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        # full jitter:  a random delay up to the exponential backoff
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
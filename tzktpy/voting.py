@@ -4,6 +4,17 @@ __all__ = ('Proposal', 'VotingEpoch', 'VotingPeriod', 'PeriodVoter')
 
 class Proposal(Base):
     __slots__ = ('hash', 'initiator', 'first_period', 'last_period', 'epoch', 'upvotes', 'rolls', 'status', 'metadata')
+    api_fields = (
+        ('hash', 'hash'),
+        ('initiator', 'initiator'),
+        ('firstPeriod', 'first_period'),
+        ('lastPeriod', 'last_period'),
+        ('epoch', 'epoch'),
+        ('upvotes', 'upvotes'),
+        ('rolls', 'rolls'),
+        ('status', 'status'),
+        ('metadata', 'metadata'),
+    )
 
     def __init__(self, hash, initiator, first_period, last_period, epoch, upvotes, rolls, status, metadata):
         self.hash = hash
@@ -31,20 +42,6 @@ class Proposal(Base):
         response = cls._request(path, **kwargs)
         return response.json()
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(Proposal, cls).from_api(data)
-        hash = data['hash']
-        initiator = data['initiator']
-        first_period = data['firstPeriod']
-        last_period = data['lastPeriod']
-        epoch = data['epoch']
-        upvotes = data['upvotes']
-        rolls = data['rolls']
-        status = data['status']
-        metadata = data['metadata']
-        return cls(hash, initiator, first_period, last_period, epoch, upvotes, rolls, status, metadata)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -55,6 +52,9 @@ class Proposal(Base):
             sort (str):  Sorts proposals by specified field. Supported fields: id (default), upvotes, rolls.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -64,11 +64,15 @@ class Proposal(Base):
             >>> proposals = Proposal.get(epoch=1)
         """
         path = 'v1/voting/proposals'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         optional_base_params = ['epoch'] + list(cls.pagination_parameters)
         params, _ = cls.prepare_modifiers(kwargs, include=optional_base_params)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def count(cls, **kwargs):
@@ -114,6 +118,30 @@ class Proposal(Base):
 
 class VotingPeriod(Base):
     __slots__ = ('index', 'epoch', 'first_level', 'start_time', 'last_level', 'end_time', 'kind', 'status', 'total_bakers', 'total_rolls', 'upvotes_quorum', 'proposals_count', 'top_upvotes', 'top_rolls', 'ballots_quorum', 'supermajority', 'yay_ballots', 'yay_rolls', 'nay_ballots', 'nay_rolls', 'pass_ballots', 'pass_rolls')
+    api_fields = (
+        ('index', 'index'),
+        ('epoch', 'epoch'),
+        ('firstLevel', 'first_level'),
+        ('startTime', 'start_time', 'to_datetime'),
+        ('lastLevel', 'last_level'),
+        ('endTime', 'end_time', 'to_datetime'),
+        ('kind', 'kind'),
+        ('status', 'status'),
+        ('totalBakers', 'total_bakers'),
+        ('totalRolls', 'total_rolls'),
+        ('upvotesQuorum', 'upvotes_quorum'),
+        ('proposalsCount', 'proposals_count'),
+        ('topUpvotes', 'top_upvotes'),
+        ('topRolls', 'top_rolls'),
+        ('ballotsQuorum', 'ballots_quorum'),
+        ('supermajority', 'supermajority'),
+        ('yayBallots', 'yay_ballots'),
+        ('yayRolls', 'yay_rolls'),
+        ('nayBallots', 'nay_ballots'),
+        ('nayRolls', 'nay_rolls'),
+        ('passBallots', 'pass_ballots'),
+        ('passRolls', 'pass_rolls'),
+    )
 
     def __init__(self, index, epoch, first_level, start_time, last_level, end_time, kind, status, total_bakers, total_rolls, upvotes_quorum, proposals_count, top_upvotes, top_rolls, ballots_quorum, supermajority, yay_ballots, yay_rolls, nay_ballots, nay_rolls, pass_ballots, pass_rolls):
         self.index = index
@@ -148,39 +176,6 @@ class VotingPeriod(Base):
     def __repr__(self):
         return '<%s %s epoch=%r, index=%r, kind=%r, first_level=%r, last_level=%r, status=%r>' % (self.__class__.__name__, id(self), self.epoch, self.index, self.kind, self.first_level, self.last_level, self.status)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(VotingPeriod, cls).from_api(data)
-        index = data['index']
-        epoch = data['epoch']
-        first_level = data['firstLevel']
-        start_time = data['startTime']
-        last_level = data['lastLevel']
-        end_time = data['endTime']
-        kind = data['kind']
-        status = data['status']
-        total_bakers = data['totalBakers']
-        total_rolls = data['totalRolls']
-        upvotes_quorum = data['upvotesQuorum']
-        proposals_count = data['proposalsCount']
-        top_upvotes = data['topUpvotes']
-        top_rolls = data['topRolls']
-        ballots_quorum = data['ballotsQuorum']
-        supermajority = data['supermajority']
-        yay_ballots = data['yayBallots']
-        yay_rolls = data['yayRolls']
-        nay_ballots = data['nayBallots']
-        nay_rolls = data['nayRolls']
-        pass_ballots = data['passBallots']
-        pass_rolls = data['passRolls']
-        if start_time:
-            start_time = cls.to_datetime(start_time)
-
-        if end_time:
-            end_time = cls.to_datetime(end_time)
-
-        return cls(index, epoch, first_level, start_time, last_level, end_time, kind, status, total_bakers, total_rolls, upvotes_quorum, proposals_count, top_upvotes, top_rolls, ballots_quorum, supermajority, yay_ballots, yay_rolls, nay_ballots, nay_rolls, pass_ballots, pass_rolls)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -190,6 +185,9 @@ class VotingPeriod(Base):
             sort (str):  Sorts voting periods by specified field. Supported fields: id (default).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -199,10 +197,14 @@ class VotingPeriod(Base):
             >>> voting_periods = VotingPeriod.get()
         """
         path = 'v1/voting/periods'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_index(cls, index, **kwargs):
@@ -248,6 +250,16 @@ class VotingPeriod(Base):
 
 class VotingEpoch(Base):
     __slots__ = ('index', 'first_level', 'start_time', 'last_level', 'end_time', 'status', 'periods', 'proposals')
+    api_fields = (
+        ('index', 'index'),
+        ('firstLevel', 'first_level'),
+        ('startTime', 'start_time', 'to_datetime'),
+        ('lastLevel', 'last_level'),
+        ('endTime', 'end_time', 'to_datetime'),
+        ('status', 'status'),
+        ('periods', 'periods', VotingPeriod.from_api_list),
+        ('proposals', 'proposals', Proposal.from_api_list),
+    )
 
     def __init__(self, index, first_level, start_time, last_level, end_time, status, periods, proposals):
         self.index = index
@@ -268,29 +280,6 @@ class VotingEpoch(Base):
     def __repr__(self):
         return '<%s %s index=%r, first_level=%r, last_level=%r, status=%r>' % (self.__class__.__name__, id(self), self.index, self.first_level, self.last_level, self.status)
 
-    @classmethod
-    def from_api(cls, data):
-        data = super(VotingEpoch, cls).from_api(data)
-        index = data['index']
-        first_level = data['firstLevel']
-        start_time = data['startTime']
-        last_level = data['lastLevel']
-        end_time = data['endTime']
-        status = data['status']
-        periods = data['periods']
-        proposals = data['proposals']
-        if start_time:
-            start_time = cls.to_datetime(start_time)
-        if end_time:
-            end_time = cls.to_datetime(end_time)
-
-        if periods:
-            periods = [VotingPeriod.from_api(item) for item in periods]
-
-        if proposals:
-            proposals = [Proposal.from_api(item) for item in proposals]
-        return cls(index, first_level, start_time, last_level, end_time, status, periods, proposals)
-
     @classmethod
     def get(cls, **kwargs):
         """
@@ -300,6 +289,9 @@ class VotingEpoch(Base):
             sort (str):  Sorts voting epochs by specified field. Supported fields: id (default).  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -309,10 +301,14 @@ class VotingEpoch(Base):
             >>> epochs = VotingEpoch.get()
         """
         path = 'v1/voting/epochs'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_index(cls, index, **kwargs):
@@ -377,6 +373,11 @@ class VotingEpoch(Base):
 
 class PeriodVoter(Base):
     __slots__ = ('delegate', 'rolls', 'status')
+    api_fields = (
+        ('delegate', 'delegate'),
+        ('rolls', 'rolls'),
+        ('status', 'status'),
+    )
 
     def __init__(self, delegate, rolls, status):
         self.delegate = delegate
@@ -392,13 +393,6 @@ class PeriodVoter(Base):
     def __repr__(self):
         return '<%s %s delegate=%r, rolls=%r, status=%r>' % (self.__class__.__name__, id(self), self.delegate, self.rolls, self.status)
 
-    @classmethod
-    def from_api(cls, data):
-        delegate = data['delegate']
-        rolls = data['rolls']
-        status = data['status']
-        return cls(delegate, rolls, status)
-
     @classmethod
     def get(cls, index, **kwargs):
         """
@@ -412,6 +406,9 @@ class PeriodVoter(Base):
             sort (str):  Sorts voters by specified field. Supported fields: id (default), rolls.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -422,13 +419,17 @@ class PeriodVoter(Base):
             >>> yay_voters = PeriodVoter.get(index, status='voted_yay')
         """
         path = 'v1/voting/periods/%s/voters' % index
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
         status = kwargs.pop('status', None)
         if status:
             params['status'] = status
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def by_address(cls, index, address, **kwargs):
@@ -465,6 +466,9 @@ class PeriodVoter(Base):
             sort (str):  Sorts voters by specified field. Supported fields: id (default), rolls.  Supports sorting modifiers.
             offset (int):  Specifies which or how many items should be skipped. Supports standard offset modifiers.
             limit (int):  Maximum number of items to return.
+            columns (bool|list, optional):  Returns a Columns of typed arrays (one per attribute) instead of a list of objects.  A list of attribute names only decodes those columns.  Defaults to False.
+            fields (list, optional):  Names of the attributes to return.  Only these fields are requested from the API (`select`) and the other attributes of the objects are None.  Defaults to every attribute.
+            tuples (bool, optional):  Returns a tuple with the values of `fields` for each item instead of an object.  Defaults to False.
             domain (str, optional):  The tzkt.io domain to use.  The domains correspond to the different Tezos networks.  Defaults to https://api.tzkt.io.
 
         Returns:
@@ -474,13 +478,17 @@ class PeriodVoter(Base):
             >>> current_voters = PeriodVoter.current()
         """
         path = 'v1/voting/periods/current/voters'
+        columns = kwargs.pop('columns', False)
+        fields = kwargs.pop('fields', None)
+        tuples = kwargs.pop('tuples', False)
         params = cls.get_pagination_parameters(kwargs)
         status = kwargs.pop('status', None)
         if status:
             params['status'] = status
+        params.update(cls.select_parameters(fields, tuples, columns))
         response = cls._request(path, params=params, **kwargs)
         data = response.json()
-        return [cls.from_api(item) for item in data]
+        return cls.from_api_list(data, columns=columns, fields=fields, tuples=tuples)
 
     @classmethod
     def current_by_address(cls, address, **kwargs):